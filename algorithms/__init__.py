@@ -9,6 +9,17 @@ from .radixsort import radixsort
 from .cache_oblivious import cache_oblivious_sort
 from .adaptive_mergesort import adaptive_mergesort
 from .smoothsort import smoothsort
+from .pdqsort import pdqsort
+from .block_quicksort import block_quicksort
+from .block_mergesort import block_mergesort
+from .auto_sort import auto_sort
+from .parallel_samplesort import parallel_samplesort
+from .threaded_sort import threaded_sort
+from .external_sort import external_sort
+from .segmented_sort import segmented_sort
+from .partial_sort import partial_sort, nth_element
+from .argsort import argsort
+from .events import iter_events
 
 __all__ = [
     'timsort',
@@ -16,5 +27,17 @@ __all__ = [
     'radixsort',
     'cache_oblivious_sort',
     'adaptive_mergesort',
-    'smoothsort'
+    'smoothsort',
+    'pdqsort',
+    'block_quicksort',
+    'block_mergesort',
+    'auto_sort',
+    'parallel_samplesort',
+    'threaded_sort',
+    'external_sort',
+    'segmented_sort',
+    'partial_sort',
+    'nth_element',
+    'argsort',
+    'iter_events'
 ]
\ No newline at end of file
@@ -0,0 +1,208 @@
+"""
+Tampon (Buffer) Girdileri Modülü
+
+Bu modül, sıralama algoritmalarının Python listelerinin yanı sıra tampon
+protokolünü destekleyen yazılabilir nesneleri (NumPy dizileri, array.array,
+memoryview, bytearray) Python listesine çevirmeden yerinde sıralayabilmesi için
+yardımcı fonksiyonlar içerir.
+
+- Saf Python algoritmaları tamponu düz (tek boyutlu) bir memoryview üzerinden
+  okur ve yazar. memoryview elemanları doğrudan Python sayıları olarak
+  döndürdüğünden NumPy skaleri oluşturma maliyeti de ödenmez. Geçici alanlar
+  da aynı türden ham tamponlar olarak ayrılır; böylece eleman başına kalıcı
+  PyLong nesnesi oluşmaz.
+- NumPy ile çalışan algoritmalar tamponu kopyalamadan aynı belleği paylaşan
+  bir NumPy görünümüyle sıralar.
+- collect_states=True iken veri listeye kopyalanıp sıralanır ve sonuç
+  tampona geri yazılır; animasyon izinin durumları Python listeleri olarak
+  üretilir.
+"""
+
+import numpy as np
+
+# memoryview'un indeksleyip Python sayısı döndürebildiği yerel biçimler
+_SCALAR_FORMATS = frozenset("bBhHiIlLqQnNfd?")
+
+
+def is_buffer(data):
+    """
+    data tampon protokolünü destekleyen (liste olmayan) bir nesneyse True döndürür.
+
+    Args:
+        data: İncelenecek nesne
+
+    Returns:
+        bool: NumPy dizisi, array.array, memoryview, bytearray gibi tamponlarda True
+    """
+    if isinstance(data, list):
+        return False
+    if isinstance(data, np.ndarray):
+        return True
+    try:
+        memoryview(data)
+    except TypeError:
+        return False
+    return True
+
+
+def _check_writable(view):
+    """
+    Raises:
+        TypeError: Tampon salt okunursa
+    """
+    if view.readonly:
+        raise TypeError("Salt okunur bir tampon yerinde sıralanamaz")
+
+
+def as_sequence(data):
+    """
+    Saf Python algoritmaları için veriyi indekslenebilir bir diziye çevirir.
+
+    Listeler ve tampon olmayan nesneler olduğu gibi döndürülür. Bitişik ve
+    sayısal tamponlar, kopyalanmadan düz bir memoryview olarak döndürülür.
+    memoryview'un indeksleyemediği tamponlar (nesne ya da metin türündeki
+    NumPy dizileri, bitişik olmayan diziler) olduğu gibi bırakılır.
+
+    Args:
+        data (list veya tampon): Sıralanacak veri
+
+    Returns:
+        list, memoryview veya özgün nesne: Veriyle aynı belleği kullanan dizi
+
+    Raises:
+        TypeError: Tampon salt okunursa
+    """
+    if not is_buffer(data):
+        return data
+    view = memoryview(data)
+    _check_writable(view)
+    fmt = view.format.lstrip("@")
+    if fmt not in _SCALAR_FORMATS or not view.c_contiguous:
+        return data
+    if view.ndim != 1 or view.format != fmt:
+        view = view.cast("B").cast(fmt)
+    return view
+
+
+def _list_to_array(data):
+    """
+    Listeyi yeni bir NumPy dizisine çevirir.
+
+    np.asarray iç içe listeleri çok boyutlu diziye açar, büyük tam sayıları ve
+    karışık tam sayı / kayan nokta listelerini sessizce float64'e yuvarlar.
+    Bu durumlar sıralanan değerleri ya da uzunluğu değiştireceğinden reddedilir.
+
+    Raises:
+        TypeError: Liste tek boyutlu bir diziye çevrilemiyorsa ya da sayısal
+            değerler çevrilirken değişiyorsa
+    """
+    try:
+        arr = np.asarray(data)
+    except ValueError:
+        raise TypeError("Liste elemanları tek boyutlu bir diziye çevrilemiyor") from None
+    if arr.ndim != 1:
+        raise TypeError(f"Liste elemanları sayı olmalı; iç içe diziler {arr.ndim} boyutlu diziye açılıyor")
+    # Tam sayı türlerine çeviri kayıpsızdır; yuvarlama yalnızca float'a
+    # yükseltilen tam sayılarda olur
+    if arr.dtype.kind == "f":
+        for x, y in zip(arr.tolist(), data):
+            # NaN kendine eşit olmasa da değişmeden korunur
+            if x != y and x == x:
+                raise TypeError(f"Liste değerleri {arr.dtype} türüne kayıpsız çevrilemiyor: {y!r}")
+    return arr
+
+
+def as_array(data):
+    """
+    NumPy ile çalışan algoritmalar için veriyi NumPy dizisi olarak döndürür.
+
+    NumPy dizileri olduğu gibi, diğer tamponlar aynı belleği paylaşan bir
+    görünüm olarak, listeler ise yeni bir (tek boyutlu) dizi olarak döndürülür.
+
+    Args:
+        data (list veya tampon): Sıralanacak veri
+
+    Returns:
+        np.ndarray: Veri dizisi
+
+    Raises:
+        TypeError: Tampon salt okunursa; liste tek boyutlu bir diziye
+            çevrilemiyorsa ya da sayısal değerleri çevrilirken değişiyorsa
+    """
+    if isinstance(data, np.ndarray):
+        arr = data
+    elif is_buffer(data):
+        arr = np.asarray(data)
+    else:
+        return _list_to_array(data)
+    if not arr.flags.writeable:
+        raise TypeError("Salt okunur bir tampon yerinde sıralanamaz")
+    return arr
+
+
+def write_back(data, arr, result):
+    """
+    NumPy ile sıralanan sonucu veriye yazar.
+
+    Args:
+        data (list veya tampon): Özgün veri
+        arr (np.ndarray): as_array(data) ile elde edilen dizi
+        result (np.ndarray): Sıralanmış değerler (arr ile aynı sayıda)
+    """
+    if is_buffer(data):
+        # Yerinde sıralanan görünümler zaten tamponun belleğini kullanır
+        if not np.may_share_memory(result, arr):
+            arr[...] = result.reshape(arr.shape)
+    else:
+        data[:] = result.tolist()
+
+
+def copy_slice(a, lo, hi):
+    """
+    a[lo:hi] aralığının a'dan bağımsız bir kopyasını döndürür.
+
+    Listelerde dilim zaten bir kopyadır; memoryview ve NumPy dizilerinde dilim
+    bir görünüm olduğundan aynı türden yeni bir tampon oluşturulur.
+    """
+    part = a[lo:hi]
+    if isinstance(a, memoryview):
+        return memoryview(part.tobytes()).cast(a.format)
+    if isinstance(a, np.ndarray):
+        return part.copy()
+    return part
+
+
+def empty_like(a, n):
+    """
+    a ile aynı türden n elemanlık geçici alan ayırır.
+
+    Listeler için [None] * n, memoryview için aynı biçimde ham bir tampon,
+    NumPy dizileri için aynı türde boş bir dizi döndürülür.
+    """
+    if isinstance(a, memoryview):
+        return memoryview(bytearray(n * a.itemsize)).cast(a.format)
+    if isinstance(a, np.ndarray):
+        return np.empty(n, dtype=a.dtype)
+    return [None] * n
+
+
+def sort_with_states(engine, data):
+    """
+    Tampon veriyi animasyon durumlarıyla birlikte sıralar.
+
+    Veri bir listeye kopyalanır, liste algoritmayla sıralanır ve sonuç tampona
+    eleman eleman geri yazılır.
+
+    Args:
+        engine (callable): (veri, collect_states) sözleşmesine uyan algoritma
+        data: Sıralanacak tampon
+
+    Returns:
+        tuple: (veri, durumlar)
+    """
+    view = as_sequence(data)
+    items = list(view)
+    _, states = engine(items, collect_states=True)
+    for i, x in enumerate(items):
+        view[i] = x
+    return data, states
@@ -0,0 +1,138 @@
+"""
+Az Farklı Değerli Veri İçin Sayma Sıralaması Modülü
+
+Bu modül, farklı değer sayısı eleman sayısına göre çok küçük olan verilerde
+(durum kodları, kiracı numaraları gibi) karşılaştırmalı sıralama yerine
+kullanılan sayma sıralamasını içerir.
+
+Karar örneklemeyle verilir: rastgele bir örnekteki farklı değer sayısı ile bir
+ve iki kez görülen değerlerin sayılarından toplam farklı değer sayısı Chao1
+tahmincisiyle kestirilir. Tahmin yeterince küçükse elemanlar tek geçişte
+değerlerine göre kovalara toplanır, yalnızca farklı değerler sıralanır ve
+kovalar sırayla veriye geri yazılır.
+
+Kovalar özgün elemanları ekleme sırasıyla tuttuğundan sonuç kararlıdır ve
+eşit değerli farklı nesneler (1 ile 1.0 gibi) birbirine dönüştürülmez.
+Değerlerin hashlenebilir olması ve == karşılaştırmasının < ile tutarlı olması
+gerekir; aksi halde yol kullanılmaz.
+"""
+
+import random
+
+from ._events import mark_phase
+
+# Bu boyutun altındaki veriler için yoklama yapılmaz
+_MIN_SIZE = 1024
+
+# Farklı değer tahmini için örnek boyutu
+_SAMPLE_SIZE = 1024
+
+# Tahmini farklı değer başına en az bu kadar eleman düşüyorsa sayma sıralaması
+# kullanılır
+_MIN_REPEATS = 16
+
+# Kovalara toplarken farklı değer sayısı n / _ABORT_REPEATS'i aşarsa tahmin
+# yanlış demektir; geçiş bırakılır ve veri değiştirilmez
+_ABORT_REPEATS = 4
+
+
+def estimate_distinct(data, rng=None):
+    """
+    Verideki farklı değer sayısını örnekleyerek tahmin eder (Chao1).
+
+    Args:
+        data (list veya np.ndarray): İncelenecek veri; değiştirilmez
+        rng (random.Random, optional): Örnekleme için rastgele sayı üreteci
+
+    Returns:
+        float: Tahmini farklı değer sayısı
+
+    Raises:
+        TypeError: Örnekteki değerler hashlenebilir değilse
+    """
+    n = len(data)
+    rng = rng or random.Random(n)
+    counts = {}
+    for i in rng.sample(range(n), min(n, _SAMPLE_SIZE)):
+        x = data[i]
+        counts[x] = counts.get(x, 0) + 1
+
+    singletons = 0
+    doubletons = 0
+    for c in counts.values():
+        if c == 1:
+            singletons += 1
+        elif c == 2:
+            doubletons += 1
+    return len(counts) + singletons * (singletons - 1) / (2 * (doubletons + 1))
+
+
+def has_few_distinct(data):
+    """
+    Verinin sayma sıralamasına uygun olacak kadar az farklı değer içerip
+    içermediğini örneklemeyle belirler.
+
+    Args:
+        data (list veya np.ndarray): İncelenecek veri; değiştirilmez
+
+    Returns:
+        bool: Tahmini farklı değer başına en az _MIN_REPEATS eleman düşüyorsa True
+    """
+    n = len(data)
+    if n < _MIN_SIZE:
+        return False
+    try:
+        return estimate_distinct(data) * _MIN_REPEATS <= n
+    except TypeError:
+        return False
+
+
+def counting_sort(data, sort_keys, states=None):
+    """
+    Veriyi, farklı değerlerine göre kovalara toplayarak yerinde sıralar.
+
+    Args:
+        data (list veya np.ndarray): Sıralanacak veri
+        sort_keys (callable): Farklı değerlerin listesini yerinde sıralayan
+            fonksiyon
+        states (Trace, optional): Verilirse her kova yazıldıktan sonra bir
+            adım kaydedilir
+
+    Returns:
+        bool: Veri sıralandıysa True; farklı değer sayısı beklenenden fazla
+        çıktığı ya da bir değer hashlenemediği için vazgeçildiyse (veri
+        değiştirilmeden) False
+    """
+    limit = len(data) // _ABORT_REPEATS
+    buckets = {}
+    try:
+        for x in data:
+            bucket = buckets.get(x)
+            if bucket is None:
+                if len(buckets) >= limit:
+                    return False
+                buckets[x] = [x]
+            else:
+                bucket.append(x)
+    except TypeError:
+        return False
+
+    keys = list(buckets)
+    sort_keys(keys)
+    mark_phase(data, "counting_sort", 0, len(data))
+
+    pos = 0
+    for k in keys:
+        bucket = buckets[k]
+        start = pos
+        if isinstance(data, list):
+            data[pos:pos + len(bucket)] = bucket
+            pos += len(bucket)
+        else:
+            # Tamponlara listeden dilim ataması yapılamaz; eleman eleman yazılır
+            for x in bucket:
+                data[pos] = x
+                pos += 1
+        if states is not None:
+            states.append(data, start, pos)
+    return True
@@ -0,0 +1,200 @@
+"""
+Olay Kaydı Modülü
+
+Bu modül, sıralama algoritmalarının veriye yaptığı işlemleri tipli olaylar
+olarak gözlemleyen kayıt listesini ve olay türlerini içerir.
+
+Algoritmalar olay akışı için ayrıca yazılmaz: veri, okumaları ve yazımları
+yakalayan bir liste alt sınıfına (_EventList) konur ve algoritma bu liste
+üzerinde her zamanki gibi çalışır.
+
+- Okunan her eleman, okunduğu konumu taşıyan bir sarmalayıcıyla döndürülür;
+  iki sarmalayıcı < ile karşılaştırıldığında Compare olayı üretilir.
+- Her yazım bir Write olayıdır. a[i], a[j] = a[j], a[i] biçimindeki ardışık
+  iki yazım tek bir Swap olayına birleştirilir.
+- Algoritmalar önemli aşamalarda (run bulundu, HeapSort'a geçildi gibi)
+  mark_phase ile Phase olayı bildirir. Veri kayıt listesi değilse mark_phase
+  hiçbir şey yapmaz.
+
+NumPy ile çalışan algoritmalar veriyi tek seferde diziye çevirdiğinden
+yalnızca sonucun geri yazımı Write olayları olarak görülür.
+"""
+
+from typing import Any, NamedTuple, Optional
+
+
+class Compare(NamedTuple):
+    """
+    a[i] < a[j] karşılaştırması. Konumlar elemanların okunduğu konumlardır;
+    dizi dışından gelen bir değer için None olur.
+    """
+    i: Optional[int]
+    j: Optional[int]
+
+
+class Swap(NamedTuple):
+    """
+    a[i] ile a[j] yer değiştirdi.
+    """
+    i: int
+    j: int
+
+
+class Write(NamedTuple):
+    """
+    a[i] konumuna value yazıldı.
+    """
+    i: int
+    value: Any
+
+
+class Phase(NamedTuple):
+    """
+    Algoritma [lo, hi) aralığında name aşamasına girdi.
+    """
+    name: str
+    lo: int
+    hi: int
+
+
+class _Read:
+    """
+    Kayıt listesinden okunan bir eleman ve okunduğu konum.
+    """
+
+    __slots__ = ("value", "index", "owner")
+
+    def __init__(self, value, index, owner):
+        self.value = value
+        self.index = index
+        self.owner = owner
+
+    def __lt__(self, other):
+        if isinstance(other, _Read):
+            self.owner.emit(Compare(self.index, other.index))
+            return self.value < other.value
+        self.owner.emit(Compare(self.index, None))
+        return self.value < other
+
+    def __gt__(self, other):
+        # Sol taraf dizi dışından gelen bir değerse: other < self
+        self.owner.emit(Compare(None, self.index))
+        return other < self.value
+
+    def __eq__(self, other):
+        return self.value == (other.value if isinstance(other, _Read) else other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+
+def _unwrap(value):
+    """
+    (değer, okunduğu konum) ikilisini döndürür; konum bilinmiyorsa None.
+    """
+    if isinstance(value, _Read):
+        return value.value, value.index
+    return value, None
+
+
+class _EventList(list):
+    """
+    Okuma ve yazımları olay olarak bildiren liste.
+
+    Args:
+        items (iterable): Başlangıç elemanları
+        sink (callable): Her olayla çağrılan fonksiyon
+    """
+
+    def __init__(self, items, sink):
+        super().__init__(items)
+        self._sink = sink
+        # Takas olarak birleştirilmeyi bekleyen yazım:
+        # (konum, yazılan değer, okunduğu konum, üzerine yazılan değer)
+        self._pending = None
+
+    def emit(self, event):
+        """
+        Olayı, bekleyen yazımdan sonra bildirir.
+        """
+        self.flush()
+        self._sink(event)
+
+    def flush(self):
+        """
+        Bekleyen yazımı Write olayı olarak bildirir.
+        """
+        if self._pending is not None:
+            i, value = self._pending[:2]
+            self._pending = None
+            self._sink(Write(i, value))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            positions = range(*index.indices(len(self)))
+            return [_Read(x, i, self) for i, x in zip(positions, super().__getitem__(index))]
+        if index < 0:
+            index += len(self)
+        return _Read(super().__getitem__(index), index, self)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            positions = range(*index.indices(len(self)))
+            values = [_unwrap(v)[0] for v in value]
+            super().__setitem__(index, values)
+            for i, v in zip(positions, values):
+                self.emit(Write(i, v))
+            return
+        if index < 0:
+            index += len(self)
+        value, source = _unwrap(value)
+        old = super().__getitem__(index)
+        super().__setitem__(index, value)
+        pending = self._pending
+        if (pending is not None and pending[2] == index and source == pending[0]
+                and old is pending[1] and value is pending[3]):
+            # a[i] = a[j] ardından a[j] = eski a[i]: takas
+            self._pending = None
+            self._sink(Swap(pending[0], index))
+            return
+        self.flush()
+        self._pending = (index, value, source, old)
+
+
+def mark_phase(a, name, lo, hi):
+    """
+    a bir kayıt listesiyse [lo, hi) aralığı için Phase olayı bildirir.
+
+    Args:
+        a: Algoritmanın çalışma dizisi
+        name (str): Aşama adı (ör. "run_detected", "heap_fallback")
+        lo (int): Aralığın başlangıcı
+        hi (int): Aralığın sonu
+    """
+    if isinstance(a, _EventList):
+        a.emit(Phase(name, lo, hi))
+
+
+def mark_runs(a, name, bounds):
+    """
+    a bir kayıt listesiyse bounds ile ayrılan her [bounds[k], bounds[k+1])
+    aralığı için Phase olayı bildirir. Kayıt listesi değilse döngü çalışmaz.
+
+    Args:
+        a: Algoritmanın çalışma dizisi
+        name (str): Aşama adı
+        bounds (list): Artan aralık sınırları, sonunda aralığın sonu ile
+    """
+    if isinstance(a, _EventList):
+        for k in range(len(bounds) - 1):
+            a.emit(Phase(name, bounds[k], bounds[k + 1]))
+
+
+def without_events(a):
+    """
+    a bir kayıt listesiyse olay üretmeyen düz bir kopyasını, değilse a'yı
+    döndürür. Veriyi yalnızca incelemek (yoklama gibi) için kullanılır.
+    """
+    if isinstance(a, _EventList):
+        return list(a)
+    return a
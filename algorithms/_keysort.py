@@ -0,0 +1,79 @@
+"""
+Anahtar Önbellekleme Modülü
+
+Bu modül, sıralama algoritmalarının key= parametresi için Schwartzian
+dönüşümünü içerir. Her elemanın anahtarı tam olarak bir kez hesaplanıp
+(anahtar, indeks) ikilileri halinde paralel bir diziye yazılır; algoritma bu
+ikilileri sıralar ve elde edilen permütasyon veriye en sonda tek seferde
+uygulanır.
+
+İndeks, eşit anahtarlarda sırayı belirlediğinden kararsız algoritmalar da bu
+yolla kararlı sonuç verir. İkililerin karşılaştırması C seviyesinde yapılır;
+elemanları Python sınıflarıyla sarmalamaktaki gibi her karşılaştırma bir
+Python metot çağrısı değildir.
+"""
+
+import numpy as np
+
+from ._buffer import as_array, is_buffer
+
+
+def apply_permutation(data, perm):
+    """
+    data'yı, i. konuma data[perm[i]] gelecek şekilde yerinde yeniden düzenler.
+
+    Args:
+        data (list veya tampon): Yeniden düzenlenecek veri
+        perm (list veya np.ndarray): İndeks permütasyonu
+    """
+    if is_buffer(data):
+        arr = as_array(data)
+        arr[...] = arr[np.asarray(perm, dtype=np.intp)]
+    else:
+        data[:] = [data[i] for i in perm]
+
+
+def decorate(data, key=None):
+    """
+    Her elemanı (anahtar, indeks) ikilisine çevirir. key verilmezse eleman
+    kendisi anahtardır.
+
+    Args:
+        data (list): Elemanlar
+        key (callable, optional): Elemandan sıralama anahtarı üreten fonksiyon
+
+    Returns:
+        list: (anahtar, indeks) ikilileri
+    """
+    if key is None:
+        return [(x, i) for i, x in enumerate(data)]
+    return [(key(x), i) for i, x in enumerate(data)]
+
+
+def sort_by_key(engine, data, key, collect_states=False):
+    """
+    data'yı key ile hesaplanan anahtarlara göre verilen algoritmayla sıralar.
+
+    Args:
+        engine (callable): (veri, collect_states) sözleşmesine uyan algoritma
+        data (list): Sıralanacak veri
+        key (callable): Elemandan sıralama anahtarı üreten fonksiyon
+        collect_states (bool): True ise ara durumlar özgün elemanlar
+            cinsinden döndürülür
+
+    Returns:
+        list: Sıralanmış veri; collect_states=True ise (veri, durumlar) ikilisi
+    """
+    decorated = decorate(data, key)
+
+    if collect_states:
+        _, states = engine(decorated, collect_states=True)
+        states = states.map(lambda item: data[item[1]])
+    else:
+        engine(decorated)
+
+    apply_permutation(data, [i for _, i in decorated])
+
+    if collect_states:
+        return data, states
+    return data
@@ -0,0 +1,230 @@
+"""
+Adaptive MergeSort Modülü
+
+Bu modül, doğal run'lardan yararlanan uyarlanabilir MergeSort algoritmasını
+içerir. Tek bir doğrusal taramada artan ve kesin azalan run'lar bulunur
+(azalanlar yerinde ters çevrilir), ardından run'lar aşağıdan yukarıya ikişer
+ikişer birleştirilir.
+
+Birleştirme geçişleri girdi ile çağrı başına bir kez ayrılan tek bir yardımcı
+tampon arasında gidip gelir (ping-pong); birleştirme başına ek bellek ayrılmaz.
+Zaten sıralı veri tarama bittiğinde sıralanmış olur.
+
+Run taraması ve birleştirme döngüsünün kayıt kodu içermeyen _untraced eşleri
+vardır; kayıt istenmediğinde sıcak döngülerde states kontrolü yapılmaz.
+"""
+
+from ._buffer import as_sequence, empty_like, is_buffer, sort_with_states
+from ._events import mark_runs
+from ._keysort import sort_by_key
+from .trace import Trace
+
+
+def _detect_runs_untraced(a, n):
+    """
+    Doğal run'ları tek geçişte bulur; kesin azalan run'ları ters çevirir.
+
+    Kesin azalan (a[i+1] < a[i]) koşulu, eşit elemanların göreli sırasının
+    ters çevirme sırasında korunmasını sağlar.
+
+    Returns:
+        list: Run başlangıç indeksleri, sonunda n ile
+    """
+    bounds = [0]
+    i = 0
+    while i < n - 1:
+        start = i
+        if a[i + 1] < a[i]:
+            i += 1
+            while i < n - 1 and a[i + 1] < a[i]:
+                i += 1
+            lo = start
+            hi = i
+            while lo < hi:
+                a[lo], a[hi] = a[hi], a[lo]
+                lo += 1
+                hi -= 1
+        else:
+            i += 1
+            while i < n - 1 and not a[i + 1] < a[i]:
+                i += 1
+        i += 1
+        bounds.append(i)
+    if bounds[-1] != n:
+        bounds.append(n)
+    return bounds
+
+
+def _detect_runs(a, n, states=None):
+    """
+    _detect_runs_untraced ile aynı taramayı yapar; ters çevrilen her run'ı
+    kaydeder.
+    """
+    if states is None:
+        return _detect_runs_untraced(a, n)
+    bounds = [0]
+    i = 0
+    while i < n - 1:
+        start = i
+        if a[i + 1] < a[i]:
+            i += 1
+            while i < n - 1 and a[i + 1] < a[i]:
+                i += 1
+            lo = start
+            hi = i
+            while lo < hi:
+                a[lo], a[hi] = a[hi], a[lo]
+                lo += 1
+                hi -= 1
+            states.append(a, start, i + 1)
+        else:
+            i += 1
+            while i < n - 1 and not a[i + 1] < a[i]:
+                i += 1
+        i += 1
+        bounds.append(i)
+    if bounds[-1] != n:
+        bounds.append(n)
+    return bounds
+
+
+def _merge(src, dst, lo, mid, hi):
+    """
+    src[lo:mid] ve src[mid:hi] sıralı run'larını dst[lo:hi] aralığına
+    kararlı şekilde birleştirir. Dilimleme yapılmaz.
+    """
+    i = lo
+    j = mid
+    k = lo
+    if i < mid and j < hi:
+        while True:
+            if src[j] < src[i]:
+                dst[k] = src[j]
+                j += 1
+                k += 1
+                if j == hi:
+                    break
+            else:
+                dst[k] = src[i]
+                i += 1
+                k += 1
+                if i == mid:
+                    break
+    while i < mid:
+        dst[k] = src[i]
+        i += 1
+        k += 1
+    while j < hi:
+        dst[k] = src[j]
+        j += 1
+        k += 1
+
+
+def _adaptive_mergesort_untraced(a):
+    """
+    Diziyi doğal run'larını bulup aşağıdan yukarıya birleştirerek sıralar.
+    """
+    n = len(a)
+    if n < 2:
+        return
+
+    bounds = _detect_runs_untraced(a, n)
+    mark_runs(a, "run_detected", bounds)
+    if len(bounds) <= 2:
+        return
+
+    # Tek yardımcı tampon; geçişler veri ile aux arasında gidip gelir
+    aux = empty_like(a, n)
+    src = a
+    dst = aux
+    while len(bounds) > 2:
+        runs = len(bounds) - 1
+        w = 0
+        for r in range(0, runs, 2):
+            lo = bounds[r]
+            if r + 1 < runs:
+                _merge(src, dst, lo, bounds[r + 1], bounds[r + 2])
+            else:
+                # Eşi olmayan son run olduğu gibi kopyalanır
+                hi = bounds[r + 1]
+                _merge(src, dst, lo, hi, hi)
+            bounds[w] = lo
+            w += 1
+        bounds[w] = n
+        del bounds[w + 1:]
+        src, dst = dst, src
+
+    if src is not a:
+        for i in range(n):
+            a[i] = src[i]
+
+
+def _adaptive_mergesort(a, states=None):
+    """
+    _adaptive_mergesort_untraced ile aynı sıralamayı yapar; her birleştirmeyi
+    kaydeder.
+    """
+    if states is None:
+        _adaptive_mergesort_untraced(a)
+        return
+    n = len(a)
+    if n < 2:
+        return
+
+    bounds = _detect_runs(a, n, states)
+    mark_runs(a, "run_detected", bounds)
+    if len(bounds) <= 2:
+        return
+
+    aux = empty_like(a, n)
+    src = a
+    dst = aux
+    while len(bounds) > 2:
+        runs = len(bounds) - 1
+        w = 0
+        for r in range(0, runs, 2):
+            lo = bounds[r]
+            if r + 1 < runs:
+                hi = bounds[r + 2]
+                _merge(src, dst, lo, bounds[r + 1], hi)
+            else:
+                hi = bounds[r + 1]
+                _merge(src, dst, lo, hi, hi)
+            bounds[w] = lo
+            w += 1
+            states.append(dst, lo, hi)
+        bounds[w] = n
+        del bounds[w + 1:]
+        src, dst = dst, src
+
+    if src is not a:
+        for i in range(n):
+            a[i] = src[i]
+
+
+def adaptive_mergesort(data, collect_states=False, key=None):
+    """
+    Doğal run tabanlı uyarlanabilir MergeSort ile veriyi yerinde ve kararlı
+    şekilde sıralar.
+
+    Args:
+        data (list veya tampon): Sıralanacak veri
+        collect_states (bool): True ise animasyon için ara durumlar toplanır
+        key (callable, optional): Her elemandan sıralama anahtarı üreten
+            fonksiyon. Anahtarlar eleman başına bir kez hesaplanır.
+
+    Returns:
+        list: Sıralanmış veri; collect_states=True ise (veri, durumlar) ikilisi
+    """
+    if key is not None:
+        return sort_by_key(adaptive_mergesort, data, key, collect_states)
+    if collect_states and is_buffer(data):
+        return sort_with_states(adaptive_mergesort, data)
+
+    a = as_sequence(data)
+    states = Trace(a) if collect_states else None
+    _adaptive_mergesort(a, states)
+
+    if collect_states:
+        return data, states
+    return data
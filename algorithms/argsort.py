@@ -0,0 +1,105 @@
+"""
+Argsort Modülü
+
+Bu modül, kayıtlı sıralama algoritmalarının veriyi taşımadan sıralayan
+permütasyonu döndüren argsort sürümlerini içerir. Dönen permütasyon p için
+data[p[0]], data[p[1]], ... sıralıdır; veri yerinde bırakılır. Permütasyon,
+eleman sayısına göre int32 ya da int64 türünde sıkışık bir NumPy dizisidir.
+
+Algoritmaya göre yöntem seçilir:
+
+- Karşılaştırmalı algoritmalar: elemanlar (anahtar, indeks) ikililerine
+  çevrilip bu ikililer sıralanır; kayıtların kendisi taşınmaz. Kararlı
+  algoritmalar kararlılığını korur. Anahtarların == karşılaştırması < ile
+  tutarlıysa (sayılar, metinler) eşitlikte indeks karar verdiğinden kararsız
+  algoritmalar da kararlı sonuç verir.
+- RadixSort: anahtar dizisi üzerinde kararlı radix permütasyonu hesaplanır.
+- NumPy dizileriyle çalışan sayısal algoritmalar: değer (ya da değer sırası)
+  ile indeks tek bir 64 bitlik tam sayıya paketlenir ve algoritma bu tam
+  sayıları sıralar. İndeks düşük bitlerde olduğundan eşitlikte özgün sıra
+  korunur.
+"""
+
+import numpy as np
+
+from ._keysort import decorate
+from .block_quicksort import block_quicksort
+from .parallel_samplesort import parallel_samplesort
+from .radixsort import _as_integer_array, _radix_argsort, radixsort
+from .threaded_sort import threaded_sort
+from .timsort import timsort
+
+# Yalnızca sayısal NumPy dizilerini sıralayabilen algoritmalar
+_NUMERIC_ALGORITHMS = {block_quicksort, parallel_samplesort, threaded_sort}
+
+
+def _index_dtype(n):
+    """
+    n elemanlık permütasyon için en küçük uygun indeks türü.
+    """
+    return np.int32 if n <= np.iinfo(np.int32).max else np.int64
+
+
+def _packed_argsort(values, algorithm):
+    """
+    Değer ile indeksi 64 bitlik tam sayılara paketleyip algoritmayla sıralar.
+
+    Tam sayılar en küçük değere göre kaydırılarak paketlenir; sığmazlarsa ya
+    da tam sayı değillerse önce yoğun sıra numaralarına (dense rank) çevrilir.
+
+    Raises:
+        TypeError: Değerler sayısal değilse
+    """
+    if values.size and values.dtype.kind not in "iuf":
+        raise TypeError(f"Bu algoritma yalnızca sayısal veri sıralayabilir, alınan tür: {values.dtype}")
+    n = values.size
+    index_bits = (n - 1).bit_length()
+
+    ranks = None
+    if values.dtype.kind in "iu":
+        ranks = values.astype(np.uint64) - values.min().astype(np.uint64)
+        if int(ranks.max()).bit_length() + index_bits > 63:
+            ranks = None
+    if ranks is None:
+        ranks = np.unique(values, return_inverse=True)[1].astype(np.uint64).ravel()
+
+    packed = ((ranks << np.uint64(index_bits)) | np.arange(n, dtype=np.uint64)).astype(np.int64)
+    algorithm(packed)
+    return packed & ((1 << index_bits) - 1)
+
+
+def argsort(data, algorithm=timsort, key=None):
+    """
+    Veriyi sıralayan permütasyonu, veriyi taşımadan döndürür.
+
+    Args:
+        data (list veya np.ndarray): Sıralanacak veri; değiştirilmez
+        algorithm (callable): Kullanılacak sıralama algoritması
+        key (callable, optional): Her elemandan sıralama anahtarı üreten
+            fonksiyon. Anahtarlar eleman başına bir kez hesaplanır.
+
+    Returns:
+        np.ndarray: int32 (2^31 elemandan azsa) ya da int64 indeks permütasyonu
+
+    Raises:
+        TypeError: Algoritma verinin türünü sıralayamıyorsa
+    """
+    n = len(data)
+    index_dtype = _index_dtype(n)
+    if n < 2:
+        return np.arange(n, dtype=index_dtype)
+
+    if algorithm is radixsort or algorithm in _NUMERIC_ALGORITHMS:
+        if key is not None:
+            values = np.asarray([key(x) for x in data])
+        else:
+            values = data if isinstance(data, np.ndarray) else np.asarray(data)
+        if algorithm is radixsort:
+            perm = _radix_argsort(_as_integer_array(values).ravel())
+        else:
+            perm = _packed_argsort(values.ravel(), algorithm)
+        return perm.astype(index_dtype, copy=False)
+
+    decorated = decorate(data, key)
+    algorithm(decorated)
+    return np.fromiter((i for _, i in decorated), dtype=index_dtype, count=n)
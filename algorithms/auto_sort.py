@@ -0,0 +1,182 @@
+"""
+Otomatik Algoritma Seçimi Modülü
+
+Bu modül, verinin şeklini alt doğrusal bir yoklamayla (probe) tahmin edip her
+çağrıda en uygun sıralama algoritmasını seçen Auto sözde algoritmasını içerir.
+
+Yoklama yalnızca örneklenmiş konumlara bakar:
+
+- Run uzunluğu: rastgele başlangıç noktalarından ileriye doğru artan ya da
+  kesin azalan run'ın sınırlı bir pencere içindeki uzunluğu
+- Ters çevrim oranı: rastgele seçilen (i < j) çiftlerinde a[j] < a[i] olanların
+  oranı; sıralı veride 0, ters sıralı veride 1, rastgele veride yaklaşık 0.5
+- Anahtar aralığı: örnekteki tam sayıların en büyük ve en küçük farkı
+- Farklı değer oranı: örnekteki farklı değerlerin örnek boyutuna oranı
+
+Seçim kuralları:
+
+1. Uzun run'lar: ters çevrim oranı uçlardaysa (neredeyse tek run, sıralı ya
+   da ters sıralı) TimSort, değilse (birkaç uzun run) Adaptive MergeSort
+2. Dar aralıktaki tam sayılar (aralık n'nin küçük bir katı ya da 16 bit):
+   RadixSort
+3. Az sayıda farklı değer ya da kısmen sıralı veri: PdqSort
+4. Rastgele veri: IntroSort
+
+Sıralılık radix kontrolünden önce gelir: run'lara uyum sağlayan algoritmalar
+sıralı ya da ters sıralı veriyi doğrusal zamanda bitirirken RadixSort her
+geçişte tüm veriyi yeniden dağıtır.
+"""
+
+import random
+
+import numpy as np
+
+from ._events import mark_phase, without_events
+from ._keysort import sort_by_key
+from .adaptive_mergesort import adaptive_mergesort
+from .introsort import introsort
+from .pdqsort import pdqsort
+from .radixsort import radixsort
+from .timsort import timsort
+
+# Bu boyuttaki ve daha küçük girdiler yoklanmadan TimSort ile sıralanır
+_SMALL_INPUT = 32
+
+# Run uzunluğu için örneklenen başlangıç noktası sayısı ve pencere boyutu
+_RUN_SAMPLES = 64
+_RUN_WINDOW = 64
+
+# Ters çevrim oranı için örneklenen çift sayısı
+_PAIR_SAMPLES = 256
+
+# Anahtar aralığı ve farklı değer tahmini için örnek boyutu
+_VALUE_SAMPLES = 256
+
+# Aralığı eleman sayısının bu katını ya da bu kadar biti aşmayan tam sayılar
+# RadixSort'a gider; geniş aralıklarda geçiş sayısı arttığından karşılaştırmalı
+# algoritmalar öne geçer.
+_NARROW_RANGE_FACTOR = 8
+_NARROW_RANGE_BITS = 16
+
+# Bu ortalama örnek run uzunluğunun üzerindeki veri uzun run'lardan oluşur
+_LONG_RUN = _RUN_WINDOW * 3 // 4
+
+# Ters çevrim oranı bu değer kadar uçlara (0 ya da 1) yakınsa veri neredeyse
+# sıralı ya da ters sıralıdır; 0.5'ten bu kadar uzaksa kısmen sıralıdır
+_ORDERED_INVERSIONS = 0.1
+
+
+def _is_integer(x):
+    """
+    x bir tam sayıysa (bool hariç) True döndürür.
+    """
+    return isinstance(x, (int, np.integer)) and not isinstance(x, (bool, np.bool_))
+
+
+def probe(data, rng=None):
+    """
+    Verinin sıralılık ve değer dağılımı özelliklerini örnekleyerek tahmin eder.
+
+    Args:
+        data (list veya np.ndarray): İncelenecek veri; değiştirilmez
+        rng (random.Random, optional): Örnekleme için rastgele sayı üreteci
+
+    Returns:
+        dict: run_length (ortalama örnek run uzunluğu), inversion_ratio,
+        key_range (tam sayı değilse None), distinct_ratio, integer
+    """
+    n = len(data)
+    rng = rng or random.Random(n)
+    a = data
+
+    run_total = 0
+    starts = [rng.randrange(n - 1) for _ in range(_RUN_SAMPLES)] if n > 1 else []
+    for s in starts:
+        end = min(n, s + _RUN_WINDOW)
+        j = s + 1
+        if a[j] < a[s]:
+            while j + 1 < end and a[j + 1] < a[j]:
+                j += 1
+        else:
+            while j + 1 < end and not a[j + 1] < a[j]:
+                j += 1
+        run_total += j + 1 - s
+
+    inversions = 0
+    for _ in range(_PAIR_SAMPLES if n > 1 else 0):
+        i = rng.randrange(n - 1)
+        j = rng.randrange(i + 1, n)
+        if a[j] < a[i]:
+            inversions += 1
+
+    sample = [a[i] for i in rng.sample(range(n), min(n, _VALUE_SAMPLES))]
+    integer = bool(sample) and all(_is_integer(x) for x in sample)
+    key_range = int(max(sample)) - int(min(sample)) if integer else None
+
+    sample.sort()
+    distinct = sum(1 for i in range(1, len(sample)) if sample[i - 1] < sample[i]) + bool(sample)
+
+    return {
+        "run_length": run_total / len(starts) if starts else float(n),
+        "inversion_ratio": inversions / _PAIR_SAMPLES if n > 1 else 0.0,
+        "key_range": key_range,
+        "distinct_ratio": distinct / len(sample) if sample else 1.0,
+        "integer": integer,
+    }
+
+
+def choose_algorithm(data, rng=None):
+    """
+    Yoklama sonucuna göre veri için uygun sıralama algoritmasını seçer.
+
+    Args:
+        data (list veya np.ndarray): Sıralanacak veri; değiştirilmez
+        rng (random.Random, optional): Örnekleme için rastgele sayı üreteci
+
+    Returns:
+        callable: Seçilen sıralama fonksiyonu
+    """
+    if len(data) <= _SMALL_INPUT:
+        return timsort
+
+    info = probe(data, rng)
+    if info["run_length"] >= _LONG_RUN:
+        inversions = info["inversion_ratio"]
+        if inversions < _ORDERED_INVERSIONS or inversions > 1 - _ORDERED_INVERSIONS:
+            return timsort
+        return adaptive_mergesort
+    if info["integer"]:
+        key_range = info["key_range"]
+        if key_range <= _NARROW_RANGE_FACTOR * len(data) or key_range.bit_length() <= _NARROW_RANGE_BITS:
+            return radixsort
+    if info["distinct_ratio"] < 0.5 or abs(info["inversion_ratio"] - 0.5) > _ORDERED_INVERSIONS:
+        return pdqsort
+    return introsort
+
+
+def auto_sort(data, collect_states=False, key=None):
+    """
+    Veriyi, yoklamayla seçilen algoritmayla yerinde sıralar.
+
+    Args:
+        data (list veya np.ndarray): Sıralanacak veri
+        collect_states (bool): True ise animasyon için ara durumlar toplanır
+        key (callable, optional): Her elemandan sıralama anahtarı üreten
+            fonksiyon. Anahtarlar eleman başına bir kez hesaplanır.
+
+    Returns:
+        list: Sıralanmış veri; collect_states=True ise (veri, durumlar) ikilisi
+    """
+    if key is not None:
+        return sort_by_key(auto_sort, data, key, collect_states)
+
+    # Yoklama okumaları olay akışında görünmez; yalnızca seçim bildirilir
+    algorithm = choose_algorithm(without_events(data))
+    mark_phase(data, f"{algorithm.__name__}_selected", 0, len(data))
+    if algorithm is radixsort:
+        try:
+            return radixsort(data, collect_states)
+        except TypeError:
+            # Örneklenmeyen elemanlardan biri tam sayı değil; veri değişmeden kalır
+            algorithm = pdqsort
+    return algorithm(data, collect_states)
@@ -0,0 +1,381 @@
+"""
+Block MergeSort Modülü
+
+Bu modül, Kim ve Kutzner'in blok birleştirme fikrine dayanan (WikiSort ve
+GrailSort'un da temel aldığı) kararlı ve O(1) ek bellekli MergeSort
+algoritmasını içerir.
+
+Yardımcı tampon girdinin kendisinden alınır: dizinin başına, her değerin ilk
+görüldüğü kopyalarından oluşan yaklaşık 2*sqrt(n) benzersiz anahtar
+rotasyonlarla toplanır. Bu anahtarlar iki iş görür:
+
+- Bir kısmı blok etiketi olarak kullanılır. Birleştirilen iki run eşit
+  boyutlu bloklara ayrılır, bloklar ilk elemanlarına göre seçmeli sıralanır;
+  eşitlikte etiketler blokların hangi run'dan geldiğini ve özgün sırasını
+  belirler.
+- Geri kalanı takas alanıdır. Bloklar arası yerel birleştirmeler elemanların
+  üzerine yazılarak değil takas edilerek yapıldığından tampondaki değerler
+  kaybolmaz, yalnızca karışır.
+
+Sonunda tampon sıralanır ve kalan diziyle rotasyon tabanlı yerinde
+birleştirme ile birleştirilir. Yeterli benzersiz değer bulunamayan seviyelerde
+run'lar tampon kullanmadan, ikili arama ve rotasyonla birleştirilir.
+
+Tüm taşımalar eleman takaslarıyla yapılır; liste dilimleme ya da geçici liste
+kullanılmaz.
+"""
+
+from ._buffer import as_sequence, is_buffer, sort_with_states
+from ._events import mark_phase
+from ._keysort import sort_by_key
+from .introsort import _insertion_sort
+from .trace import Trace
+
+# Başlangıçta InsertionSort ile sıralanan run'ların boyutu
+_RUN_SIZE = 16
+
+
+def _reverse(a, lo, hi):
+    """
+    a[lo:hi] aralığını takaslarla yerinde ters çevirir.
+    """
+    hi -= 1
+    while lo < hi:
+        a[lo], a[hi] = a[hi], a[lo]
+        lo += 1
+        hi -= 1
+
+
+def _rotate(a, lo, mid, hi):
+    """
+    a[lo:mid] ve a[mid:hi] bloklarının yerini üç ters çevirme ile değiştirir.
+    """
+    if lo < mid < hi:
+        _reverse(a, lo, mid)
+        _reverse(a, mid, hi)
+        _reverse(a, lo, hi)
+
+
+def _lower_bound(a, lo, hi, x):
+    """
+    a[lo:hi] sıralı aralığında x'ten küçük olmayan ilk konumu bulur.
+    """
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if a[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _upper_bound(a, lo, hi, x):
+    """
+    a[lo:hi] sıralı aralığında x'ten büyük ilk konumu bulur.
+    """
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if x < a[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _merge_in_place(a, lo, mid, hi):
+    """
+    a[lo:mid] ve a[mid:hi] sıralı run'larını tampon kullanmadan kararlı
+    şekilde birleştirir.
+
+    Uzun run'ın ortasındaki eleman diğer run'da ikili aramayla konumlandırılır,
+    iki parça rotasyonla yer değiştirir ve iki yarı ayrı ayrı birleştirilir.
+    Kısa yarıya özyinelemeli inilir.
+    """
+    while lo < mid < hi:
+        if hi - lo == 2:
+            if a[mid] < a[lo]:
+                a[lo], a[mid] = a[mid], a[lo]
+            return
+        if mid - lo > hi - mid:
+            cut1 = lo + (mid - lo) // 2
+            cut2 = _lower_bound(a, mid, hi, a[cut1])
+        else:
+            cut2 = mid + (hi - mid) // 2
+            cut1 = _upper_bound(a, lo, mid, a[cut2])
+        _rotate(a, cut1, mid, cut2)
+        new_mid = cut1 + (cut2 - mid)
+        if new_mid - lo < hi - new_mid:
+            _merge_in_place(a, lo, cut1, new_mid)
+            lo, mid = new_mid, cut2
+        else:
+            _merge_in_place(a, new_mid, cut2, hi)
+            mid, hi = cut1, new_mid
+
+
+def _collect_keys(a, n, target):
+    """
+    Dizinin başına en fazla target adet benzersiz anahtar toplar.
+
+    Anahtarlar, her değerin ilk görüldüğü elemanlardır ve sıralı bir pencerede
+    tutulur. Yeni bir anahtar bulunduğunda pencere rotasyonla o elemanın hemen
+    soluna kaydırılır; aradaki elemanların göreli sırası korunur.
+
+    Returns:
+        int: Toplanan anahtar sayısı; anahtarlar a[0:sayı] aralığındadır
+    """
+    head = 0
+    count = 1
+    i = 1
+    while i < n and count < target:
+        pos = _lower_bound(a, head, head + count, a[i])
+        if pos == head + count or a[i] < a[pos]:
+            _rotate(a, head, head + count, i)
+            pos += i - count - head
+            head = i - count
+            x = a[i]
+            j = i
+            while j > pos:
+                a[j] = a[j - 1]
+                j -= 1
+            a[pos] = x
+            count += 1
+        i += 1
+    _rotate(a, 0, head, head + count)
+    return count
+
+
+def _merge_forward(a, p_lo, p_hi, x_hi, buf, p_first):
+    """
+    Takas alanını kullanarak a[p_lo:p_hi] ve a[p_hi:x_hi] parçalarını soldan
+    sağa birleştirir.
+
+    Sol parça önce takas alanına alınır; boşalan konumlar okunan elemanlarla
+    takas edilerek doldurulur. Parçalardan biri bittiğinde durulur.
+
+    Args:
+        p_first (bool): Eşitlikte sol parçanın elemanı önce gelecekse True
+
+    Returns:
+        tuple: (başlangıç, bitiş, sol_parçadan_mı) - birleştirilmeden kalan
+        parçanın aralığı ve hangi parçaya ait olduğu
+    """
+    length = p_hi - p_lo
+    for k in range(length):
+        a[p_lo + k], a[buf + k] = a[buf + k], a[p_lo + k]
+
+    bi = buf
+    b_end = buf + length
+    xi = p_hi
+    out = p_lo
+    while bi < b_end and xi < x_hi:
+        if a[xi] < a[bi] if p_first else not a[bi] < a[xi]:
+            a[out], a[xi] = a[xi], a[out]
+            xi += 1
+        else:
+            a[out], a[bi] = a[bi], a[out]
+            bi += 1
+        out += 1
+
+    if bi == b_end:
+        return xi, x_hi, False
+
+    # Sağ parça bitti; soldan kalanlar sondaki boşluklara geri taşınır
+    rest = out
+    while bi < b_end:
+        a[out], a[bi] = a[bi], a[out]
+        bi += 1
+        out += 1
+    return rest, x_hi, True
+
+
+def _merge_backward(a, lo, mid, hi, buf):
+    """
+    Takas alanını kullanarak a[lo:mid] ve kısa a[mid:hi] run'ını sağdan sola
+    kararlı şekilde birleştirir.
+    """
+    length = hi - mid
+    for k in range(length):
+        a[mid + k], a[buf + k] = a[buf + k], a[mid + k]
+
+    bi = buf + length - 1
+    ai = mid - 1
+    out = hi - 1
+    while bi >= buf and ai >= lo:
+        if a[bi] < a[ai]:
+            a[out], a[ai] = a[ai], a[out]
+            ai -= 1
+        else:
+            a[out], a[bi] = a[bi], a[out]
+            bi -= 1
+        out -= 1
+
+    while bi >= buf:
+        a[out], a[bi] = a[bi], a[out]
+        bi -= 1
+        out -= 1
+
+
+def _block_merge(a, lo, mid, hi, block, buf):
+    """
+    a[lo:mid] ve a[mid:hi] run'larını blok blok kararlı şekilde birleştirir.
+
+    Sol run'ın uzunluğu block'un katıdır. Sağ run'ın block'a bölünemeyen kuyruğu
+    en sonda ayrıca birleştirilir. Etiketler a[0:blok_sayısı] aralığında
+    sıralı olarak bulunmalıdır; işlem sonunda yeniden sıralanır.
+    """
+    a_blocks = (mid - lo) // block
+    tail = (hi - mid) % block
+    blocks = a_blocks + (hi - mid) // block
+
+    if blocks > a_blocks:
+        # Sol run'ın blokları a_blocks'tan küçük etiketlere sahiptir
+        mid_tag = a[a_blocks]
+
+        # Blokları ilk elemanlarına, eşitlikte etiketlerine göre seçmeli sırala
+        for i in range(blocks):
+            m = i
+            for j in range(i + 1, blocks):
+                first_j = a[lo + j * block]
+                first_m = a[lo + m * block]
+                if first_j < first_m or (not first_m < first_j and a[j] < a[m]):
+                    m = j
+            if m != i:
+                bi = lo + i * block
+                bm = lo + m * block
+                for k in range(block):
+                    a[bi + k], a[bm + k] = a[bm + k], a[bi + k]
+                a[i], a[m] = a[m], a[i]
+
+        # Farklı run'dan gelen komşu blokları yerel olarak birleştir
+        p_lo = lo
+        p_hi = lo + block
+        p_from_left = a[0] < mid_tag
+        for i in range(1, blocks):
+            x_hi = p_hi + block
+            x_from_left = a[i] < mid_tag
+            if x_from_left == p_from_left:
+                p_lo, p_hi = p_hi, x_hi
+                continue
+            p_lo, p_hi, from_p = _merge_forward(a, p_lo, p_hi, x_hi, buf, p_from_left)
+            if not from_p:
+                p_from_left = x_from_left
+
+        _insertion_sort(a, 0, blocks)
+
+    if tail:
+        _merge_backward(a, lo, hi - tail, hi, buf)
+
+
+def _choose_block_size(run, keys):
+    """
+    run uzunluğundaki iki run'ın blok birleştirmesi için blok boyutunu seçer.
+
+    Blok boyutu run'ı bölen bir ikinin kuvvetidir ve etiket sayısı ile takas
+    alanının toplamı anahtar sayısını aşmamalıdır. Blok boyutu sqrt(2 * run)
+    değerine en yakın uygun değer olarak seçilir.
+
+    Returns:
+        int: Blok boyutu; uygun değer yoksa 0
+    """
+    best = 0
+    ideal = (2 * run) ** 0.5
+    block = 1
+    while block <= run:
+        if 2 * run // block + block <= keys:
+            if not best or abs(block - ideal) < abs(best - ideal):
+                best = block
+        block *= 2
+    return best
+
+
+def _keys_needed(length):
+    """
+    length elemanlık bölgenin tüm seviyeleri için gereken anahtar sayısı.
+    """
+    run = _RUN_SIZE
+    while 2 * run < length:
+        run *= 2
+    block = 1
+    needed = 2 * run + 1
+    while block <= run:
+        needed = min(needed, 2 * run // block + block)
+        block *= 2
+    return needed
+
+
+def block_mergesort(data, collect_states=False, key=None):
+    """
+    Block MergeSort algoritması ile veriyi yerinde, kararlı ve O(1) ek
+    bellekle sıralar.
+
+    Args:
+        data (list veya tampon): Sıralanacak veri
+        collect_states (bool): True ise animasyon için ara durumlar toplanır
+        key (callable, optional): Her elemandan sıralama anahtarı üreten
+            fonksiyon. Anahtarlar eleman başına bir kez hesaplanır.
+
+    Returns:
+        list: Sıralanmış veri; collect_states=True ise (veri, durumlar) ikilisi
+    """
+    if key is not None:
+        return sort_by_key(block_mergesort, data, key, collect_states)
+    if collect_states and is_buffer(data):
+        return sort_with_states(block_mergesort, data)
+
+    a = as_sequence(data)
+    states = Trace(a) if collect_states else None
+    n = len(a)
+
+    if n <= _RUN_SIZE:
+        _insertion_sort(a, 0, n, states)
+    else:
+        mark_phase(a, "collect_keys", 0, n)
+        keys = _collect_keys(a, n, _keys_needed(n))
+        if states is not None:
+            states.append(a)
+
+        for lo in range(keys, n, _RUN_SIZE):
+            _insertion_sort(a, lo, min(lo + _RUN_SIZE, n))
+        if states is not None:
+            states.append(a)
+
+        run = _RUN_SIZE
+        tags_sorted = True
+        while keys + run < n:
+            mark_phase(a, "merge_level", keys, n)
+            block = 0 if run <= keys else _choose_block_size(run, keys)
+            if block and not tags_sorted:
+                # Önceki seviyelerin takasları anahtarları karıştırmış olabilir
+                _insertion_sort(a, 0, keys)
+                tags_sorted = True
+
+            for lo in range(keys, n - run, 2 * run):
+                mid = lo + run
+                hi = min(mid + run, n)
+                if not a[mid] < a[mid - 1]:
+                    continue
+                if run <= keys:
+                    # Sol run takas alanına sığıyor; doğrudan birleştirilir
+                    _merge_forward(a, lo, mid, hi, 0, True)
+                    tags_sorted = False
+                elif block:
+                    _block_merge(a, lo, mid, hi, block, keys - block)
+                else:
+                    _merge_in_place(a, lo, mid, hi)
+                if states is not None:
+                    # Takas alanındaki anahtarlar da yer değiştirmiş olabilir
+                    states.append(a, lo, hi)
+                    states.amend(a, 0, keys)
+            run *= 2
+
+        # Anahtarlar sıralanıp kalan diziye geri birleştirilir; her değerin ilk
+        # kopyası olduklarından eşitlikte önce gelirler
+        mark_phase(a, "merge_keys", 0, n)
+        _insertion_sort(a, 0, keys)
+        _merge_in_place(a, 0, keys, n)
+        if states is not None:
+            states.append(a)
+
+    if collect_states:
+        return data, states
+    return data
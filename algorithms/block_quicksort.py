@@ -0,0 +1,163 @@
+"""
+BlockQuicksort Modülü
+
+Bu modül, Edelkamp ve Weiß'in BlockQuicksort algoritmasının NumPy ile
+vektörleştirilmiş bir sürümünü içerir. Bölümleme, aralığın iki ucundan sabit
+boyutlu bloklar alınarak yapılır. Her blokta yanlış taraftaki elemanların
+konumları eleman başına dallanma yerine tek bir NumPy karşılaştırmasıyla
+(boolean maske) bulunur ve eşleşen konumlar toplu olarak takas edilir.
+
+Yalnızca sayısal veri desteklenir. Tamponlar (NumPy dizileri, array.array,
+memoryview) kopyalanmadan NumPy görünümüyle sıralanır; listeler tek seferde
+NumPy dizisine çevrilir, sonuç aynı listeye geri yazılır.
+"""
+
+import numpy as np
+
+from ._buffer import as_array, write_back
+from .trace import Trace
+
+# Bölümlemede iki uçtan alınan blokların boyutu
+_BLOCK_SIZE = 1024
+
+# Bölümleme çağrısının sabit maliyeti küçük aralıklarda baskın olduğundan bu
+# boyuttaki ve daha küçük aralıklar doğrudan NumPy ile sıralanır
+_SMALL_SORT_THRESHOLD = 256
+
+# Bu boyutun üzerindeki aralıklarda pivot dokuz elemanın ortancası olarak seçilir
+_NINTHER_THRESHOLD = 128
+
+
+def _choose_pivot(a, lo, hi):
+    """
+    Pivotu seçer ve a[lo] konumuna taşır.
+
+    Küçük aralıklarda üç, büyük aralıklarda eşit aralıklı dokuz elemanın
+    ortancası kullanılır.
+    """
+    count = 9 if hi - lo > _NINTHER_THRESHOLD else 3
+    idx = np.linspace(lo, hi - 1, count).astype(np.intp)
+    median = idx[np.argsort(a[idx], kind="stable")[count // 2]]
+    a[lo], a[median] = a[median], a[lo]
+
+
+def _block_partition(a, lo, hi, block_size):
+    """
+    [lo, hi) aralığını a[lo] konumundaki pivota göre blok blok böler.
+
+    Soldaki blokta pivottan küçük olmayan, sağdaki blokta pivottan büyük
+    olmayan elemanlar yanlış taraftadır. Konumları maskelerden toplu olarak
+    çıkarılır ve iki taraftaki eşleşen konumlar tek seferde takas edilir.
+    Konumları tükenen bloğun yerine yenisi alınır. İki uç arasında iki bloktan
+    az eleman kaldığında kalan bölge tek maskeyle bölünür.
+
+    Returns:
+        int: Pivotun son konumu. Solundaki elemanlar pivottan küçük veya eşit,
+        sağındakiler büyük veya eşittir.
+    """
+    pivot = a[lo]
+    left = lo + 1
+    right = hi - 1
+    offsets_l = offsets_r = None
+
+    while right - left + 1 >= 2 * block_size:
+        if offsets_l is None:
+            offsets_l = np.flatnonzero(a[left:left + block_size] >= pivot) + left
+        if offsets_r is None:
+            # Sağ blok sağdan sola taranır; ilk yanlış eleman ilk eşleşir
+            block = a[right - block_size + 1:right + 1][::-1]
+            offsets_r = right - np.flatnonzero(block <= pivot)
+
+        num = min(offsets_l.size, offsets_r.size)
+        if num:
+            li = offsets_l[:num]
+            ri = offsets_r[:num]
+            moved = a[li]
+            a[li] = a[ri]
+            a[ri] = moved
+
+        if num == offsets_l.size:
+            offsets_l = None
+            left += block_size
+        else:
+            offsets_l = offsets_l[num:]
+        if num == offsets_r.size:
+            offsets_r = None
+            right -= block_size
+        else:
+            offsets_r = offsets_r[num:]
+
+    # Kalan bölge (yarım kalmış blok dahil) tek maskeyle bölünür
+    rest = a[left:right + 1]
+    mask = rest < pivot
+    split = left + int(np.count_nonzero(mask))
+    a[left:right + 1] = np.concatenate((rest[mask], rest[~mask]))
+
+    p = split - 1
+    a[lo] = a[p]
+    a[p] = pivot
+    return p
+
+
+def _block_quicksort_loop(a, lo, hi, depth_limit, block_size, states=None):
+    """
+    [lo, hi) aralığını sıralar. Küçük yarıya özyinelemeli inilir, büyük yarı
+    döngüde işlenir; derinlik sınırı aşılırsa HeapSort'a geçilir.
+    """
+    while hi - lo > _SMALL_SORT_THRESHOLD:
+        if depth_limit == 0:
+            a[lo:hi].sort(kind="heapsort")
+            if states is not None:
+                states.append(a, lo, hi)
+            return
+        depth_limit -= 1
+        _choose_pivot(a, lo, hi)
+        p = _block_partition(a, lo, hi, block_size)
+        if states is not None:
+            states.append(a, lo, hi)
+        if p - lo < hi - p:
+            _block_quicksort_loop(a, lo, p, depth_limit, block_size, states)
+            lo = p + 1
+        else:
+            _block_quicksort_loop(a, p + 1, hi, depth_limit, block_size, states)
+            hi = p
+    if hi - lo > 1:
+        a[lo:hi].sort()
+        if states is not None:
+            states.append(a, lo, hi)
+
+
+def block_quicksort(data, collect_states=False, block_size=_BLOCK_SIZE):
+    """
+    BlockQuicksort algoritması ile sayısal veriyi yerinde sıralar.
+
+    Args:
+        data (list veya tampon): Sıralanacak sayısal veri
+        collect_states (bool): True ise animasyon için her bölümlemeden
+            sonraki durum toplanır
+        block_size (int): Bölümlemede kullanılan blok boyutu (en az 1)
+
+    Returns:
+        list veya tampon: Sıralanmış veri; collect_states=True ise
+        (veri, durumlar) ikilisi
+
+    Raises:
+        TypeError: Veri sayısal değilse
+    """
+    arr = as_array(data)
+    if arr.size and arr.dtype.kind not in "iuf":
+        raise TypeError(f"BlockQuicksort yalnızca sayısal veri sıralayabilir, alınan tür: {arr.dtype}")
+
+    states = Trace(arr) if collect_states else None
+    n = arr.size
+
+    if n > 1:
+        flat = arr.ravel()
+        # Derinlik sınırı: 2 * floor(log2(n))
+        _block_quicksort_loop(flat, 0, n, 2 * (n.bit_length() - 1), max(1, block_size), states)
+
+        write_back(data, arr, flat)
+
+    if collect_states:
+        return data, states
+    return data
@@ -0,0 +1,250 @@
+"""
+Cache-Oblivious Sıralama Modülü
+
+Bu modül, Frigo ve arkadaşlarının Funnelsort algoritmasının Brodal ve Fagerberg
+tarafından önerilen tembel (lazy) sürümünü içerir.
+
+Girdi n^(1/3) parçaya bölünür, her parça özyinelemeli olarak sıralanır ve
+parçalar bir k-huni (k-funnel) ile birleştirilir. k-huni, düğümleri ikili
+birleştirici olan tam bir ikili ağaçtır. Ağaç ortadaki seviyeden kesilerek
+özyinelemeli olarak tanımlanır; kesilen kenarlardaki tamponların boyutu
+k^(3/2)'dir. Tamponlar van Emde Boas düzeninde yerleştirilir, böylece algoritma
+önbellek boyutunu bilmeden her bellek seviyesinde verimli çalışır.
+
+Çıktı bölgesi ve tüm huni tamponları çağrı başına bir kez ayrılan tek bir
+dizi (arena) üzerinden dağıtılır.
+"""
+
+import math
+from functools import lru_cache, partial
+
+from ._buffer import as_sequence, empty_like, is_buffer, sort_with_states
+from ._events import mark_phase
+from ._keysort import sort_by_key
+from .timsort import _binary_insertion_sort
+from .trace import Trace
+
+# Bu boyuttaki ve daha küçük parçalar doğrudan ikili InsertionSort ile sıralanır
+_BASE_CASE_SIZE = 32
+
+
+@lru_cache(maxsize=None)
+def _funnel_layout(height):
+    """
+    2^height girişli bir k-huninin tampon yerleşimini hesaplar.
+
+    Düğümler yığın numaralandırmasıyla tutulur (kök 1, v'nin çocukları 2v ve
+    2v+1). h seviyelik bir alt ağaç ortadan kesilir; alt yarıdaki alt ağaçların
+    köklerinin çıkış tamponları ceil((2^h)^(3/2)) boyutundadır. Önce üst ağaç,
+    ardından her alt ağaç kendi tamponuyla birlikte yerleştirilir.
+
+    Args:
+        height (int): Ağacın yüksekliği (log2 k)
+
+    Returns:
+        tuple: (göreli_başlangıçlar, kapasiteler, toplam_boyut) - iç düğüm
+        indeksine göre listeler
+    """
+    k = 1 << height
+    offsets = [0] * k
+    capacities = [0] * k
+    total = 0
+
+    def place(root, levels):
+        nonlocal total
+        if levels <= 1:
+            return
+        top = (levels + 1) // 2
+        place(root, top)
+        size = math.ceil((1 << levels) ** 1.5)
+        first = root << top
+        for child in range(first, first + (1 << top)):
+            offsets[child] = total
+            capacities[child] = size
+            total += size
+            place(child, levels - top)
+
+    place(1, height)
+    return offsets, capacities, total
+
+
+def _height_for(n):
+    """
+    n elemanlık bir parça için huni yüksekliği: k = 2^h >= n^(1/3).
+    """
+    k = max(2, math.ceil(n ** (1.0 / 3.0)))
+    return (k - 1).bit_length()
+
+
+def _arena_size(n, base_case_size):
+    """
+    n elemanı sıralamak için gereken arena boyutu.
+
+    Özyinelemeli çağrılar sırayla çalıştığından ve en büyük ihtiyaç en üst
+    seviyede olduğundan tüm seviyeler aynı arenayı paylaşır.
+    """
+    if n <= base_case_size:
+        return 0
+    return n + _funnel_layout(_height_for(n))[2]
+
+
+class _Funnel:
+    """
+    Tembel k-huni birleştirici.
+
+    Her kenar bir akıştır: kaynak dizi, baş ve son indeksi ile tükendi bilgisi.
+    Yapraklar girdideki sıralı parçaları doğrudan okur; iç düğümler arenadaki
+    tamponlarına yazar. Bir düğüm yalnızca tamponu boşaldığında doldurulur.
+    """
+
+    def __init__(self, a, arena, segments, height, out_size):
+        k = 1 << height
+        rel_offsets, capacities, _ = _funnel_layout(height)
+
+        self.k = k
+        self.arena = arena
+        self.src = [arena] * (2 * k)
+        self.head = [0] * (2 * k)
+        self.tail = [0] * (2 * k)
+        self.exhausted = [False] * (2 * k)
+        self.start = [out_size + off for off in rel_offsets]
+        self.capacity = list(capacities)
+
+        # Kök doğrudan arenanın başındaki çıktı bölgesine yazar
+        self.start[1] = 0
+        self.capacity[1] = out_size
+
+        for v in range(2, k):
+            self.head[v] = self.tail[v] = self.start[v]
+
+        for i in range(k):
+            leaf = k + i
+            self.src[leaf] = a
+            self.exhausted[leaf] = True
+            if i < len(segments):
+                self.head[leaf], self.tail[leaf] = segments[i]
+
+    def fill(self, v):
+        """
+        v düğümünün tamponunu dolana ya da girişleri tükenene kadar doldurur.
+
+        Eşitlikte sol çocuk tercih edildiğinden birleştirme kararlıdır.
+        """
+        arena = self.arena
+        head = self.head
+        tail = self.tail
+        src = self.src
+        exhausted = self.exhausted
+
+        start = self.start[v]
+        end = start + self.capacity[v]
+        pos = start
+        left = 2 * v
+        right = left + 1
+
+        while pos < end:
+            if head[left] == tail[left] and not exhausted[left]:
+                self.fill(left)
+            if head[right] == tail[right] and not exhausted[right]:
+                self.fill(right)
+
+            lh, lt, ls = head[left], tail[left], src[left]
+            rh, rt, rs = head[right], tail[right], src[right]
+
+            if lh == lt:
+                if rh == rt:
+                    break
+                count = min(end - pos, rt - rh)
+                arena[pos:pos + count] = rs[rh:rh + count]
+                pos += count
+                head[right] = rh + count
+                continue
+            if rh == rt:
+                count = min(end - pos, lt - lh)
+                arena[pos:pos + count] = ls[lh:lh + count]
+                pos += count
+                head[left] = lh + count
+                continue
+
+            while True:
+                if rs[rh] < ls[lh]:
+                    arena[pos] = rs[rh]
+                    rh += 1
+                    pos += 1
+                    if rh == rt or pos == end:
+                        break
+                else:
+                    arena[pos] = ls[lh]
+                    lh += 1
+                    pos += 1
+                    if lh == lt or pos == end:
+                        break
+            head[left] = lh
+            head[right] = rh
+
+        head[v] = start
+        tail[v] = pos
+        if pos < end:
+            exhausted[v] = True
+
+
+def _funnelsort(a, lo, hi, arena, base_case_size, states=None):
+    """
+    a[lo:hi] aralığını Funnelsort ile yerinde sıralar.
+    """
+    n = hi - lo
+    if n <= base_case_size:
+        _binary_insertion_sort(a, lo, hi, lo + 1, states)
+        return
+
+    height = _height_for(n)
+    k = 1 << height
+    seg_size = -(-n // k)
+
+    segments = []
+    for seg_lo in range(lo, hi, seg_size):
+        seg_hi = min(seg_lo + seg_size, hi)
+        _funnelsort(a, seg_lo, seg_hi, arena, base_case_size, states)
+        segments.append((seg_lo, seg_hi))
+
+    mark_phase(a, "funnel_merge", lo, hi)
+    _Funnel(a, arena, segments, height, n).fill(1)
+    a[lo:hi] = arena[:n]
+    if states is not None:
+        states.append(a, lo, hi)
+
+
+def cache_oblivious_sort(data, collect_states=False, base_case_size=_BASE_CASE_SIZE, key=None):
+    """
+    Tembel Funnelsort algoritması ile veriyi yerinde ve kararlı şekilde sıralar.
+
+    Args:
+        data (list veya tampon): Sıralanacak veri
+        collect_states (bool): True ise animasyon için ara durumlar toplanır
+        base_case_size (int): Bu boyuttaki ve daha küçük parçalar ikili
+            InsertionSort ile sıralanır (en az 1)
+        key (callable, optional): Her elemandan sıralama anahtarı üreten
+            fonksiyon. Anahtarlar eleman başına bir kez hesaplanır.
+
+    Returns:
+        list: Sıralanmış veri; collect_states=True ise (veri, durumlar) ikilisi
+    """
+    if key is not None:
+        engine = partial(cache_oblivious_sort, base_case_size=base_case_size)
+        return sort_by_key(engine, data, key, collect_states)
+    if collect_states and is_buffer(data):
+        engine = partial(cache_oblivious_sort, base_case_size=base_case_size)
+        return sort_with_states(engine, data)
+
+    a = as_sequence(data)
+    base_case_size = max(1, base_case_size)
+    states = Trace(a) if collect_states else None
+    n = len(a)
+
+    if n > 1:
+        arena = empty_like(a, _arena_size(n, base_case_size))
+        _funnelsort(a, 0, n, arena, base_case_size, states)
+
+    if collect_states:
+        return data, states
+    return data
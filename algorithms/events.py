@@ -0,0 +1,133 @@
+"""
+Olay Akışı Modülü
+
+Bu modül, bir sıralama algoritmasının çalışırken yaptığı karşılaştırma,
+takas ve yazım işlemlerini ve girdiği aşamaları tipli olaylar olarak tembel
+şekilde üreten iter_events fonksiyonunu içerir.
+
+Olaylar sıralama ilerledikçe üretilir: algoritma ayrı bir iş parçacığında
+verinin bir kopyası üzerinde çalışır ve olayları küçük gruplar halinde
+üreticiye aktarır. Tüketici yalnızca birkaç grup geride kalabilir; döngüden
+erken çıkıldığında algoritma bir sonraki olayında durdurulur. Bu sayede
+büyük bir verinin ilk birkaç adımını görmek için tüm olaylar bellekte
+toplanmaz.
+
+Olay türleri:
+
+- Compare(i, j): a[i] < a[j] karşılaştırması
+- Swap(i, j): a[i] ile a[j] yer değiştirdi
+- Write(i, value): a[i] konumuna value yazıldı
+- Phase(name, lo, hi): [lo, hi) aralığında yeni bir aşama başladı
+  (ör. "run_detected", "heap_fallback", "three_way_partition")
+
+Başlangıç verisine olaylar sırayla uygulandığında (Swap ve Write) algoritmanın
+ürettiği sıralı sonuç elde edilir.
+"""
+
+import queue
+import threading
+
+import numpy as np
+
+from ._buffer import is_buffer
+from ._events import Compare, Phase, Swap, Write, _EventList
+from .timsort import timsort
+
+# Üreticiden tüketiciye tek seferde aktarılan olay sayısı
+_BATCH_SIZE = 1024
+
+# Tüketicinin durdurma isteğinin kontrol edilme aralığı (saniye)
+_POLL_INTERVAL = 0.05
+
+__all__ = ["Compare", "Phase", "Swap", "Write", "iter_events"]
+
+
+class _Cancelled(BaseException):
+    """
+    Tüketici olay akışını bıraktığında algoritmayı durdurmak için fırlatılır.
+
+    Algoritmaların kendi hata yakalamalarına takılmaması için Exception'dan
+    türetilmez.
+    """
+
+
+def _hand_over(handoff, stop, item):
+    """
+    item'ı tüketiciye aktarır; tüketici akışı bıraktıysa _Cancelled fırlatır.
+    """
+    while not stop.is_set():
+        try:
+            handoff.put(item, timeout=_POLL_INTERVAL)
+            return
+        except queue.Full:
+            pass
+    raise _Cancelled
+
+
+def iter_events(data, algorithm=timsort, batch_size=_BATCH_SIZE):
+    """
+    Algoritmanın veriyi sıralarken yaptığı işlemleri olay olarak üretir.
+
+    Veri değiştirilmez; algoritma bir kopya üzerinde çalışır. Üreteç
+    kapatıldığında (döngüden çıkıldığında) algoritma da durdurulur.
+
+    NumPy ile çalışan algoritmalar (radixsort, block_quicksort gibi) veriyi
+    tek seferde diziye çevirdiğinden yalnızca sonucun geri yazımını Write
+    olayları olarak bildirir.
+
+    Args:
+        data (list veya tampon): Sıralanacak veri; değiştirilmez
+        algorithm (callable): Kullanılacak sıralama algoritması
+        batch_size (int): Tüketiciye tek seferde aktarılan olay sayısı
+
+    Yields:
+        Compare, Swap, Write veya Phase: Algoritmanın sıradaki işlemi
+
+    Raises:
+        Algoritmanın fırlattığı hata (ör. sayısal olmayan veri için TypeError)
+    """
+    values = np.asarray(data).tolist() if is_buffer(data) else list(data)
+    batch_size = max(1, batch_size)
+    handoff = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    batch = []
+
+    def sink(event):
+        batch.append(event)
+        if len(batch) >= batch_size:
+            _hand_over(handoff, stop, batch[:])
+            batch.clear()
+
+    a = _EventList(values, sink)
+
+    def run():
+        try:
+            try:
+                algorithm(a)
+                a.flush()
+            except Exception as exc:
+                _hand_over(handoff, stop, exc)
+                return
+            if batch:
+                _hand_over(handoff, stop, batch[:])
+            _hand_over(handoff, stop, None)
+        except _Cancelled:
+            pass
+
+    worker = threading.Thread(target=run, name="iter_events", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = handoff.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield from item
+    finally:
+        stop.set()
+        try:
+            handoff.get_nowait()
+        except queue.Empty:
+            pass
+        worker.join()
@@ -0,0 +1,224 @@
+"""
+Harici (Out-of-Core) Sıralama Modülü
+
+Bu modül, belleğe sığmayan ikili tam sayı dökümlerini sıralamak için harici
+MergeSort içerir. Girdi, bellek bütçesine göre parçalar halinde okunur; her
+parça kayıtlı sıralama algoritmalarından biriyle sıralanıp geçici dosyaya ham
+ikili dizi olarak yazılır (run). Ardından run'lar bellek eşlemeli (np.memmap)
+okuyucular üzerinden k-yollu birleştirilir.
+
+Birleştirme vektörleştirilmiştir: her turda her run'dan bir blok okunur,
+sonraki bloğu olan run'ların blok sonlarının en küçüğü güvenli sınırdır; bu
+sınıra kadar olan tüm elemanlar tek seferde birleştirilip yazılır.
+
+Bellek bütçesi yalnızca parçanın kendisini değil, sıralama algoritmasının ek
+alanını da kapsar: parça boyutu algoritmanın eleman başına ek bellek
+ihtiyacına (_SCRATCH) göre küçültülür. Birleştirmede okunan parçalar tek
+diziye kopyalanıp yerinde sıralanır; bloklar bu kopya ve sıralama tamponu
+bütçeye sığacak boyutta seçilir.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from .adaptive_mergesort import adaptive_mergesort
+from .block_mergesort import block_mergesort
+from .block_quicksort import block_quicksort
+from .cache_oblivious import cache_oblivious_sort
+from .introsort import introsort
+from .pdqsort import pdqsort
+from .radixsort import radixsort
+from .smoothsort import smoothsort
+from .timsort import timsort
+
+# Varsayılan bellek bütçesi (bayt)
+_DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+# Birleştirmede run başına okunacak en küçük blok (eleman); bütçe bunu
+# karşılayamayacak kadar çok run varsa birleştirme birden fazla geçişte yapılır
+_MIN_MERGE_BLOCK = 4096
+
+
+def _numpy_sort(chunk):
+    """
+    Varsayılan parça sıralayıcısı: NumPy'nin kararlı yerinde sıralaması.
+    """
+    chunk.sort(kind="stable")
+
+
+# Algoritmaların parça dışında kullandığı ek bellek (eleman başına sabit bayt,
+# eleman boyutunun katı); tracemalloc ölçümlerinin üzerine pay bırakılmıştır.
+# NumPy'nin kararlı sıralaması en çok yarım parça boyutunda tampon ayırır.
+_SCRATCH = {
+    _numpy_sort: (0, 1),
+    radixsort: (16, 4),
+    block_quicksort: (0, 0.5),
+    timsort: (0, 1),
+    cache_oblivious_sort: (0, 1.5),
+    adaptive_mergesort: (24, 1),
+    introsort: (0, 0.5),
+    pdqsort: (0, 0.5),
+    smoothsort: (0, 0.5),
+    block_mergesort: (0, 0.5),
+}
+
+# Tabloda olmayan algoritmalar için ihtiyatlı varsayım
+_DEFAULT_SCRATCH = (16, 4)
+
+# Parça boyutundan bağımsız ek bellek (histogramlar, dosya nesneleri);
+# küçük bütçelerde en çok yarısı ayrılır
+_FIXED_SCRATCH = 16 * 1024
+
+# Birleştirmede okunan parçaların toplamı başına bellek: birleştirilmiş kopya
+# ve kararlı sıralamanın tamponu (yarım kopya) için pay
+_MERGE_SCRATCH_FACTOR = 2
+
+
+def _sort_chunk(chunk, algorithm):
+    """
+    Bir parçayı verilen algoritmayla yerinde sıralar ve döndürür.
+
+    Algoritmalar NumPy dizilerini listeye çevirmeden sıraladığından parça
+    bellek bütçesinde hesaplandığı gibi ham tampon olarak kalır.
+    """
+    algorithm(chunk)
+    return chunk
+
+
+def _create_runs(input_path, dtype, chunk_elems, algorithm, run_dir):
+    """
+    Girdiyi parça parça okuyup sıralanmış run dosyaları oluşturur.
+
+    Returns:
+        tuple: (run dosya yolları, toplam eleman sayısı)
+    """
+    runs = []
+    total = 0
+    with open(input_path, "rb") as f:
+        while True:
+            chunk = np.fromfile(f, dtype=dtype, count=chunk_elems)
+            if chunk.size == 0:
+                break
+            chunk = _sort_chunk(chunk, algorithm)
+            fd, path = tempfile.mkstemp(suffix=".run", dir=run_dir)
+            with os.fdopen(fd, "wb") as run_file:
+                chunk.tofile(run_file)
+            runs.append(path)
+            total += chunk.size
+            # Sonraki parça okunmadan önce bu parça serbest bırakılır
+            del chunk
+    return runs, total
+
+
+def _merge_runs(run_paths, out_file, dtype, block_elems):
+    """
+    Sıralı run dosyalarını bellek eşlemeli okuyucularla k-yollu birleştirip
+    out_file'a yazar.
+    """
+    readers = []
+    for path in run_paths:
+        if os.path.getsize(path):
+            readers.append(np.memmap(path, dtype=dtype, mode="r"))
+    positions = [0] * len(readers)
+
+    while True:
+        blocks = []
+        bound = None
+        for reader, pos in zip(readers, positions):
+            block = reader[pos:pos + block_elems]
+            blocks.append(block)
+            # Yalnızca devamı olan run'lar sınırı kısıtlar
+            if block.size and pos + block.size < reader.size:
+                if bound is None or block[-1] < bound:
+                    bound = block[-1]
+
+        pieces = []
+        for i, block in enumerate(blocks):
+            if not block.size:
+                continue
+            take = block.size if bound is None else int(np.searchsorted(block, bound, side="right"))
+            if take:
+                pieces.append(block[:take])
+                positions[i] += take
+
+        if not pieces:
+            break
+        # Parçalar bellek eşlemeli görünümlerdir; tek kopya yerinde sıralanır
+        merged = np.concatenate(pieces)
+        merged.sort(kind="stable")
+        merged.tofile(out_file)
+        del merged
+
+    del readers
+
+
+def _chunk_elems(memory_budget, dtype, algorithm):
+    """
+    Parça ve algoritmanın ek belleği birlikte bütçeye sığacak şekilde parça
+    başına eleman sayısı.
+    """
+    fixed, factor = _SCRATCH.get(algorithm, _DEFAULT_SCRATCH)
+    per_elem = dtype.itemsize * (1 + factor) + fixed
+    available = memory_budget - min(_FIXED_SCRATCH, memory_budget // 2)
+    return max(1, int(available // per_elem))
+
+
+def _block_elems(memory_budget, dtype, run_count):
+    """
+    Birleştirmede run başına okunacak blok boyutu. Tüm run'lardan alınan
+    parçalar, kopyaları ve sıralama tamponuyla birlikte bütçeye sığar.
+    """
+    return max(1, memory_budget // (_MERGE_SCRATCH_FACTOR * dtype.itemsize * max(1, run_count)))
+
+
+def external_sort(input_path, output_path, algorithm=None,
+                  memory_budget=_DEFAULT_MEMORY_BUDGET, dtype="int64", temp_dir=None):
+    """
+    Belleğe sığmayan ikili sayı dosyasını harici MergeSort ile sıralar.
+
+    Args:
+        input_path (str): Ham ikili girdi dosyası (dtype türünde ardışık değerler)
+        output_path (str): Sıralı çıktının yazılacağı dosya
+        algorithm (callable, optional): Parçaları sıralayacak algoritma
+            (timsort, introsort, radixsort...). Varsayılan, tüm sayısal
+            türlerde NumPy'nin kararlı sıralamasıdır; saf Python algoritmaları
+            büyük parçalarda çok yavaştır ve yalnızca istenirse kullanılır.
+        memory_budget (int): Bayt cinsinden bellek bütçesi; parçalar,
+            algoritmanın ek belleği ve birleştirme tamponları dahil
+        dtype (str): Dosyadaki değerlerin NumPy türü
+        temp_dir (str, optional): Run dosyalarının yazılacağı dizin
+
+    Returns:
+        int: Sıralanan eleman sayısı
+    """
+    dtype = np.dtype(dtype)
+    if algorithm is None:
+        algorithm = _numpy_sort
+
+    chunk_elems = _chunk_elems(memory_budget, dtype, algorithm)
+    fan_in = max(2, memory_budget // (_MERGE_SCRATCH_FACTOR * dtype.itemsize * _MIN_MERGE_BLOCK))
+
+    # Run dosyaları geçici bir dizinde tutulur; hata durumunda da silinir
+    with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+        runs, total = _create_runs(input_path, dtype, chunk_elems, algorithm, run_dir)
+
+        # Run sayısı bütçeye sığana kadar ara birleştirme geçişleri
+        while len(runs) > fan_in:
+            merged_runs = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                fd, path = tempfile.mkstemp(suffix=".run", dir=run_dir)
+                with os.fdopen(fd, "wb") as run_file:
+                    _merge_runs(group, run_file, dtype, _block_elems(memory_budget, dtype, len(group)))
+                for old in group:
+                    os.remove(old)
+                merged_runs.append(path)
+            runs = merged_runs
+
+        with open(output_path, "wb") as out_file:
+            _merge_runs(runs, out_file, dtype, _block_elems(memory_budget, dtype, len(runs)))
+
+    return total
+
@@ -0,0 +1,330 @@
+"""
+IntroSort Modülü
+
+Bu modül, David Musser'in IntroSort algoritmasını içerir. QuickSort ile başlar,
+özyineleme derinliği sınırı aşıldığında HeapSort'a geçer ve küçük aralıkları
+InsertionSort ile bitirir.
+
+Tekrar eden anahtarlar için iki önlem vardır:
+
+- Pivot örneğinde pivota eşit bir eleman görülürse aralık üç yollu (Dutch
+  flag, "fat pivot") bölümlenir; pivota eşit elemanlar ortada toplanır ve bir
+  daha bölümlenmez.
+- Örneklenen farklı değer sayısı çok küçükse veri karşılaştırmalı sıralama
+  yerine sayma sıralamasıyla sıralanır.
+
+Tüm işlemler indeks aralıkları üzerinde yerinde yapılır; liste dilimleme
+yapılmaz, bu sayede collect_states=False iken ek liste tahsisi gerekmez.
+
+Döngü içinde durum kaydeden yardımcıların (_partition, _partition3,
+_insertion_sort, _heapsort) kayıt kodu içermeyen _untraced eşleri vardır.
+states None ise çağrının başında bu eşlere geçilir; böylece
+collect_states=False iken döngülerde bayrak kontrolü kalmaz.
+"""
+
+from ._buffer import as_sequence, is_buffer, sort_with_states
+from ._counting import counting_sort, has_few_distinct
+from ._events import mark_phase
+from ._keysort import sort_by_key
+from .trace import Trace
+
+# Bu boyutun altındaki aralıklar InsertionSort ile sıralanır
+_INSERTION_THRESHOLD = 16
+
+# Bu boyutun üzerindeki aralıklarda pivot Tukey'nin ninther yöntemiyle seçilir
+_NINTHER_THRESHOLD = 128
+
+
+def _sort3(a, i, j, k, states=None):
+    """
+    Üç konumdaki elemanları a[i] <= a[j] <= a[k] olacak şekilde yerinde sıralar.
+    """
+    if a[j] < a[i]:
+        a[i], a[j] = a[j], a[i]
+    if a[k] < a[j]:
+        a[j], a[k] = a[k], a[j]
+        if a[j] < a[i]:
+            a[i], a[j] = a[j], a[i]
+    if states is not None:
+        states.append_at(a, i, j, k)
+
+
+def _choose_pivot(a, lo, hi, states=None):
+    """
+    Pivotu seçer ve a[lo] konumuna taşır.
+
+    Küçük aralıklarda üçün ortancası, büyük aralıklarda ninther (üç ortancanın
+    ortancası) kullanılır. Her iki yöntem de aralıkta pivottan büyük veya eşit
+    en az bir elemanın bulunmasını garanti eder; bölümleme döngüsü bu sayede
+    sınır kontrolü yapmadan çalışır.
+
+    Returns:
+        bool: Son üçlüde pivota eşit bir komşu varsa True; bu, aralıkta
+        pivota eşit çok sayıda eleman olabileceğini gösterir
+    """
+    size = hi - lo
+    mid = lo + size // 2
+    if size > _NINTHER_THRESHOLD:
+        _sort3(a, lo, mid, hi - 1, states)
+        _sort3(a, lo + 1, mid - 1, hi - 2, states)
+        _sort3(a, lo + 2, mid + 1, hi - 3, states)
+        _sort3(a, mid - 1, mid, mid + 1, states)
+        a[lo], a[mid] = a[mid], a[lo]
+        if states is not None:
+            states.append_at(a, lo, mid)
+        below, above = mid - 1, mid + 1
+    else:
+        # Ortanca doğrudan a[lo] konumuna yerleşir
+        _sort3(a, mid, lo, hi - 1, states)
+        below, above = mid, hi - 1
+    pivot = a[lo]
+    return not a[below] < pivot or not pivot < a[above]
+
+
+def _partition_untraced(a, lo, hi):
+    """
+    [lo, hi) aralığını a[lo] konumundaki pivota göre Hoare yöntemiyle böler.
+
+    Returns:
+        int: Pivotun son konumu. Solundaki elemanlar pivottan küçük veya eşit,
+        sağındakiler büyük veya eşittir.
+    """
+    pivot = a[lo]
+    i = lo
+    j = hi
+    while True:
+        i += 1
+        while a[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < a[j]:
+            j -= 1
+        if i >= j:
+            break
+        a[i], a[j] = a[j], a[i]
+    a[lo], a[j] = a[j], a[lo]
+    return j
+
+
+def _partition(a, lo, hi, states=None):
+    """
+    _partition_untraced ile aynı bölümlemeyi yapar; her takası kaydeder.
+    """
+    if states is None:
+        return _partition_untraced(a, lo, hi)
+    pivot = a[lo]
+    i = lo
+    j = hi
+    while True:
+        i += 1
+        while a[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < a[j]:
+            j -= 1
+        if i >= j:
+            break
+        a[i], a[j] = a[j], a[i]
+        states.append_at(a, i, j)
+    a[lo], a[j] = a[j], a[lo]
+    states.append_at(a, lo, j)
+    return j
+
+
+def _partition3_untraced(a, lo, hi):
+    """
+    [lo, hi) aralığını a[lo] konumundaki pivota göre üç yollu (Dijkstra'nın
+    Dutch flag yöntemi) böler.
+
+    Returns:
+        tuple: (lt, gt) - [lo, lt) pivottan küçük, [lt, gt) pivota eşit,
+        [gt, hi) pivottan büyük elemanları içerir
+    """
+    pivot = a[lo]
+    lt = lo
+    i = lo + 1
+    gt = hi
+    while i < gt:
+        x = a[i]
+        if x < pivot:
+            a[i] = a[lt]
+            a[lt] = x
+            lt += 1
+            i += 1
+        elif pivot < x:
+            gt -= 1
+            a[i] = a[gt]
+            a[gt] = x
+        else:
+            i += 1
+    return lt, gt
+
+
+def _partition3(a, lo, hi, states=None):
+    """
+    _partition3_untraced ile aynı bölümlemeyi yapar; her takası kaydeder.
+    """
+    if states is None:
+        return _partition3_untraced(a, lo, hi)
+    pivot = a[lo]
+    lt = lo
+    i = lo + 1
+    gt = hi
+    while i < gt:
+        x = a[i]
+        if x < pivot:
+            a[i] = a[lt]
+            a[lt] = x
+            states.append_at(a, i, lt)
+            lt += 1
+            i += 1
+        elif pivot < x:
+            gt -= 1
+            a[i] = a[gt]
+            a[gt] = x
+            states.append_at(a, i, gt)
+        else:
+            i += 1
+    return lt, gt
+
+
+def _insertion_sort_untraced(a, lo, hi):
+    """
+    [lo, hi) aralığını yerinde InsertionSort ile sıralar.
+    """
+    for i in range(lo + 1, hi):
+        x = a[i]
+        j = i - 1
+        while j >= lo and x < a[j]:
+            a[j + 1] = a[j]
+            j -= 1
+        if j + 1 != i:
+            a[j + 1] = x
+
+
+def _insertion_sort(a, lo, hi, states=None):
+    """
+    _insertion_sort_untraced ile aynı sıralamayı yapar; her yerleştirmeyi
+    kaydeder.
+    """
+    if states is None:
+        _insertion_sort_untraced(a, lo, hi)
+        return
+    for i in range(lo + 1, hi):
+        x = a[i]
+        j = i - 1
+        while j >= lo and x < a[j]:
+            a[j + 1] = a[j]
+            j -= 1
+        if j + 1 != i:
+            a[j + 1] = x
+            states.append(a, j + 1, i + 1)
+
+
+def _sift_down(a, lo, root, end):
+    """
+    lo tabanlı yığında root düğümünü end sınırına kadar aşağı kaydırır.
+    """
+    x = a[lo + root]
+    child = 2 * root + 1
+    while child < end:
+        if child + 1 < end and a[lo + child] < a[lo + child + 1]:
+            child += 1
+        if not x < a[lo + child]:
+            break
+        a[lo + root] = a[lo + child]
+        root = child
+        child = 2 * root + 1
+    a[lo + root] = x
+
+
+def _heapsort_untraced(a, lo, hi):
+    """
+    [lo, hi) aralığını yerinde HeapSort ile sıralar.
+    """
+    n = hi - lo
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down(a, lo, root, n)
+    for end in range(n - 1, 0, -1):
+        a[lo], a[lo + end] = a[lo + end], a[lo]
+        _sift_down(a, lo, 0, end)
+
+
+def _heapsort(a, lo, hi, states=None):
+    """
+    _heapsort_untraced ile aynı sıralamayı yapar; yığın kurulduktan sonra ve
+    her çıkarmada durumu kaydeder.
+    """
+    if states is None:
+        _heapsort_untraced(a, lo, hi)
+        return
+    n = hi - lo
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down(a, lo, root, n)
+    states.append(a, lo, hi)
+    for end in range(n - 1, 0, -1):
+        a[lo], a[lo + end] = a[lo + end], a[lo]
+        _sift_down(a, lo, 0, end)
+        states.append(a, lo, lo + end + 1)
+
+
+def _introsort_loop(a, lo, hi, depth_limit, states=None):
+    """
+    [lo, hi) aralığını sıralar. Küçük yarıya özyinelemeli inilir, büyük yarı
+    döngüde işlenir; böylece yığın derinliği O(log n) ile sınırlı kalır.
+    """
+    while hi - lo > _INSERTION_THRESHOLD:
+        if depth_limit == 0:
+            mark_phase(a, "heap_fallback", lo, hi)
+            _heapsort(a, lo, hi, states)
+            return
+        depth_limit -= 1
+        if _choose_pivot(a, lo, hi, states):
+            # Pivota eşit elemanlar ortada kalır ve bir daha işlenmez
+            mark_phase(a, "three_way_partition", lo, hi)
+            lt, gt = _partition3(a, lo, hi, states)
+            if lt - lo < hi - gt:
+                _introsort_loop(a, lo, lt, depth_limit, states)
+                lo = gt
+            else:
+                _introsort_loop(a, gt, hi, depth_limit, states)
+                hi = lt
+            continue
+        p = _partition(a, lo, hi, states)
+        if p - lo < hi - p:
+            _introsort_loop(a, lo, p, depth_limit, states)
+            lo = p + 1
+        else:
+            _introsort_loop(a, p + 1, hi, depth_limit, states)
+            hi = p
+    _insertion_sort(a, lo, hi, states)
+
+
+def introsort(data, collect_states=False, key=None):
+    """
+    IntroSort algoritması ile veriyi yerinde sıralar.
+
+    Args:
+        data (list veya tampon): Sıralanacak veri
+        collect_states (bool): True ise animasyon için ara durumlar toplanır
+        key (callable, optional): Her elemandan sıralama anahtarı üreten
+            fonksiyon. Anahtarlar eleman başına bir kez hesaplanır.
+
+    Returns:
+        list: Sıralanmış veri; collect_states=True ise (veri, durumlar) ikilisi
+    """
+    if key is not None:
+        return sort_by_key(introsort, data, key, collect_states)
+    if collect_states and is_buffer(data):
+        return sort_with_states(introsort, data)
+
+    a = as_sequence(data)
+    states = Trace(a) if collect_states else None
+    n = len(a)
+    by_counting = has_few_distinct(a) and counting_sort(a, introsort, states)
+    if n > 1 and not by_counting:
+        # Derinlik sınırı: 2 * floor(log2(n))
+        _introsort_loop(a, 0, n, 2 * (n.bit_length() - 1), states)
+    if collect_states:
+        return data, states
+    return data
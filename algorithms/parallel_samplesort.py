@@ -0,0 +1,165 @@
+"""
+Paralel SampleSort Modülü
+
+Bu modül, çok çekirdekli SampleSort algoritmasını içerir. Girdiden fazladan
+örnek alınarak (oversampling) p-1 ayırıcı seçilir, veri p kovaya bölünür ve
+her kova ayrı bir işçi süreçte sıralanır.
+
+Veri süreçler arasında multiprocessing.shared_memory üzerindeki NumPy
+tamponlarıyla taşınır; işçilere yalnızca tampon adı ve kova sınırları
+gönderilir, verinin kendisi hiç pickle edilmez.
+"""
+
+import atexit
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from ._buffer import as_array, write_back
+from .trace import Trace
+
+# Bu boyutun altındaki veriler süreç başlatma maliyetine değmez; kovalar
+# aynı süreçte sıralanır
+_PARALLEL_THRESHOLD = 1 << 16
+
+# Kova başına alınan örnek sayısı
+_OVERSAMPLING = 64
+
+# Süreç havuzu çağrılar arasında yeniden kullanılır
+_executor = None
+_executor_workers = 0
+
+
+def _get_executor(workers):
+    """
+    İstenen işçi sayısında paylaşılan süreç havuzunu döndürür.
+    """
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        # Farklı işçi sayısıyla açılmış eski havuzun süreçleri kapatılır
+        _shutdown_executor()
+        _executor = ProcessPoolExecutor(max_workers=workers)
+        _executor_workers = workers
+    return _executor
+
+
+def _shutdown_executor():
+    """
+    Paylaşılan süreç havuzunu kapatır; yorumlayıcı kapanırken de çağrılır.
+    """
+    global _executor, _executor_workers
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+        _executor_workers = 0
+
+
+atexit.register(_shutdown_executor)
+
+
+def _attach_shared_memory(name):
+    """
+    Var olan paylaşılan bellek bloğuna bağlanır.
+
+    Bloğun sahibi ana süreçtir ve silme işini o yapar. Python 3.13+ sürümünde
+    işçi bağlantısı kaynak izleyiciye hiç kaydedilmez; eski sürümlerde işçiler
+    ana süreçle aynı izleyiciyi paylaştığından kayıt tekrarı zararsızdır.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _sort_bucket(shm_name, dtype, size, start, end):
+    """
+    İşçi süreçte paylaşılan tampondaki [start, end) kovasını yerinde sıralar.
+    """
+    shm = _attach_shared_memory(shm_name)
+    try:
+        arr = np.ndarray((size,), dtype=dtype, buffer=shm.buf)
+        arr[start:end].sort()
+        del arr
+    finally:
+        shm.close()
+
+
+def _choose_splitters(arr, buckets, rng):
+    """
+    Kova sayısının _OVERSAMPLING katı kadar örnek alıp eşit aralıklı
+    buckets-1 ayırıcı seçer.
+    """
+    sample_size = min(arr.size, buckets * _OVERSAMPLING)
+    sample = np.sort(arr[rng.integers(0, arr.size, size=sample_size)])
+    positions = (np.arange(1, buckets) * sample_size) // buckets
+    return sample[positions]
+
+
+def parallel_samplesort(data, collect_states=False, workers=None):
+    """
+    Paralel SampleSort algoritması ile sayısal veriyi yerinde sıralar.
+
+    Args:
+        data (list veya tampon): Sıralanacak sayısal veri
+        collect_states (bool): True ise animasyon için ara durumlar toplanır
+        workers (int, optional): İşçi süreç sayısı. Varsayılan CPU sayısı.
+
+    Returns:
+        list veya tampon: Sıralanmış veri; collect_states=True ise
+        (veri, durumlar) ikilisi
+
+    Raises:
+        TypeError: Veri sayısal değilse
+    """
+    arr = as_array(data)
+    if arr.size and arr.dtype.kind not in "iuf":
+        raise TypeError(f"Paralel SampleSort yalnızca sayısal veri sıralayabilir, alınan tür: {arr.dtype}")
+
+    states = Trace(arr) if collect_states else None
+    n = arr.size
+
+    if n > 1:
+        workers = workers or os.cpu_count() or 1
+        buckets = max(1, min(workers, n // _OVERSAMPLING))
+        flat = arr.ravel()
+
+        # Ayırıcılara göre kova numaraları; kararlı gruplama kovaları bitişik yapar
+        splitters = _choose_splitters(flat, buckets, np.random.default_rng())
+        bucket_ids = np.searchsorted(splitters, flat, side="right").astype(np.uint16)
+        counts = np.bincount(bucket_ids, minlength=buckets)
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        order = np.argsort(bucket_ids, kind="stable")
+
+        shm = shared_memory.SharedMemory(create=True, size=flat.nbytes)
+        try:
+            shared = np.ndarray(flat.shape, dtype=flat.dtype, buffer=shm.buf)
+            np.take(flat, order, out=shared)
+            if collect_states:
+                states.append(shared)
+
+            jobs = [(int(bounds[b]), int(bounds[b + 1])) for b in range(buckets)
+                    if bounds[b + 1] - bounds[b] > 1]
+            if n < _PARALLEL_THRESHOLD or workers == 1 or len(jobs) < 2:
+                for start, end in jobs:
+                    shared[start:end].sort()
+            else:
+                executor = _get_executor(workers)
+                futures = [executor.submit(_sort_bucket, shm.name, flat.dtype.str, n, start, end)
+                           for start, end in jobs]
+                for future in futures:
+                    future.result()
+
+            write_back(data, arr, shared)
+            del shared
+        finally:
+            shm.close()
+            shm.unlink()
+
+        if collect_states:
+            states.append(data if isinstance(data, list) else arr)
+
+    if collect_states:
+        return data, states
+    return data
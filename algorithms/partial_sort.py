@@ -0,0 +1,164 @@
+"""
+Kısmi Sıralama Modülü
+
+Bu modül, verinin yalnızca en küçük k elemanını sıralı olarak öne getiren
+kısmi sıralama (top-k) ile IntroSelect tabanlı n. eleman seçimini içerir.
+Kalan elemanlar sırasız bırakılır; böylece tam O(n log n) sıralama maliyeti
+yerine O(n + k log k) ödenir.
+
+Algoritmaya göre yöntem seçilir:
+
+- IntroSort ve PdqSort: QuickSelect bölümlemesiyle en küçük k eleman öne
+  toplanır, ardından yalnızca bu k eleman algoritmanın kendi döngüsüyle
+  sıralanır. Durum kaydı yapılmadığından seçim kayıt kodu içermeyen _untraced
+  yardımcılarla yapılır; döngüler de states=None ile aynı yardımcılara iner.
+- Yığın tabanlı algoritmalar (SmoothSort): k boyutlu sınırlı bir en büyük
+  yığın tutulur; her yeni eleman yığının kökünden küçükse kökün yerine geçer.
+  Sonunda yığın yerinde sıralanır.
+- Diğer algoritmalar: n. eleman seçimiyle bulunan eşik değere göre en küçük k
+  eleman özgün sıralarıyla öne alınır ve algoritmayla sıralanır. Kararlı
+  algoritmalarda sonuç da kararlıdır.
+"""
+
+from .introsort import (
+    _INSERTION_THRESHOLD,
+    _choose_pivot,
+    _heapsort_untraced,
+    _insertion_sort_untraced,
+    _introsort_loop,
+    _partition_untraced,
+    _sift_down,
+    introsort,
+)
+from .pdqsort import _pdqsort_loop, pdqsort
+from .smoothsort import smoothsort
+
+# Yığın tabanlı algoritmalar; bunlarda kısmi sıralama sınırlı yığınla yapılır
+_HEAP_ALGORITHMS = {smoothsort}
+
+
+def _select(a, lo, hi, k, depth_limit):
+    """
+    [lo, hi) aralığını, k. konuma sıralı halde orada olacak eleman gelecek
+    şekilde yeniden düzenler (IntroSelect).
+
+    Her bölümlemeden sonra yalnızca k'yı içeren tarafa devam edilir. Derinlik
+    sınırı aşılırsa kalan aralık HeapSort ile sıralanır.
+    """
+    while hi - lo > _INSERTION_THRESHOLD:
+        if depth_limit == 0:
+            _heapsort_untraced(a, lo, hi)
+            return
+        depth_limit -= 1
+        _choose_pivot(a, lo, hi)
+        p = _partition_untraced(a, lo, hi)
+        if k < p:
+            hi = p
+        elif k > p:
+            lo = p + 1
+        else:
+            return
+    _insertion_sort_untraced(a, lo, hi)
+
+
+def nth_element(data, k):
+    """
+    Veriyi, k. konuma tam sıralamada orada olacak eleman gelecek şekilde
+    yerinde yeniden düzenler. Solundaki elemanlar ondan küçük veya eşit,
+    sağındakiler büyük veya eşittir; iki taraf kendi içinde sırasızdır.
+
+    Args:
+        data (list): Düzenlenecek veri
+        k (int): Seçilecek konum (0 tabanlı)
+
+    Returns:
+        list: Düzenlenmiş veri
+
+    Raises:
+        IndexError: k veri aralığında değilse
+    """
+    n = len(data)
+    if not 0 <= k < n:
+        raise IndexError(f"k={k} veri aralığının dışında (uzunluk {n})")
+    # Derinlik sınırı: 2 * floor(log2(n))
+    _select(data, 0, n, k, 2 * (n.bit_length() - 1))
+    return data
+
+
+def _heap_partial_sort(a, n, k):
+    """
+    a'nın en küçük k elemanını k boyutlu sınırlı en büyük yığınla seçip
+    a[0:k] aralığına sıralı yerleştirir.
+    """
+    for root in range(k // 2 - 1, -1, -1):
+        _sift_down(a, 0, root, k)
+    for i in range(k, n):
+        if a[i] < a[0]:
+            a[0], a[i] = a[i], a[0]
+            _sift_down(a, 0, 0, k)
+    for end in range(k - 1, 0, -1):
+        a[0], a[end] = a[end], a[0]
+        _sift_down(a, 0, 0, end)
+
+
+def _stable_partial_sort(data, k, algorithm):
+    """
+    En küçük k elemanı özgün sıralarıyla öne alır ve algoritmayla sıralar.
+
+    Eşik değer (k. en küçük eleman) verinin bir kopyası üzerinde seçilir.
+    Eşiğe eşit elemanlardan yalnızca ilk gelenler alınır; böylece kararlı
+    algoritmalarda sonuç da kararlı olur.
+    """
+    pivot = nth_element(data[:], k - 1)[k - 1]
+
+    head = []
+    tail = []
+    equal_slots = k - sum(1 for x in data if x < pivot)
+    for x in data:
+        if x < pivot:
+            head.append(x)
+        elif equal_slots and not pivot < x:
+            head.append(x)
+            equal_slots -= 1
+        else:
+            tail.append(x)
+
+    algorithm(head)
+    data[:k] = head
+    data[k:] = tail
+
+
+def partial_sort(data, k, algorithm=introsort):
+    """
+    Verinin en küçük k elemanını yerinde ve sıralı olarak başa getirir.
+    Kalan elemanlar sırasız bırakılır.
+
+    Args:
+        data (list): Sıralanacak veri
+        k (int): Sıralı olarak döndürülecek eleman sayısı; veri uzunluğundan
+            büyükse tüm veri sıralanır
+        algorithm (callable): Kullanılacak sıralama algoritması
+
+    Returns:
+        list: Kısmen sıralanmış veri
+    """
+    n = len(data)
+    k = min(k, n)
+    if k <= 0 or n < 2:
+        return data
+    if k == n:
+        algorithm(data)
+        return data
+
+    if algorithm is introsort or algorithm is pdqsort:
+        # QuickSelect bölümlemesi; sıralama yalnızca ilk k elemanda yapılır
+        _select(data, 0, n, k - 1, 2 * (n.bit_length() - 1))
+        if algorithm is introsort:
+            _introsort_loop(data, 0, k, 2 * (k.bit_length() - 1))
+        else:
+            _pdqsort_loop(data, 0, k, k.bit_length() - 1)
+    elif algorithm in _HEAP_ALGORITHMS:
+        _heap_partial_sort(data, n, k)
+    else:
+        _stable_partial_sort(data, k, algorithm)
+    return data
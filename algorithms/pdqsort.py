@@ -0,0 +1,392 @@
+"""
+PdqSort Modülü
+
+Bu modül, Orson Peters'ın Pattern-Defeating QuickSort (pdqsort) algoritmasını
+içerir. IntroSort'un iskeletini korur, ancak yaygın girdi desenlerine karşı
+şu eklemeleri yapar:
+
+- Pivota eşit elemanlar solda toplanır; çok sayıda tekrar eden anahtar
+  tek bölümlemede ayıklanır ve tekrar bölümlenmez.
+- Bölümleme hiç takas yapmadıysa aralık muhtemelen sıralıdır; iki taraf sınırlı
+  sayıda taşıma yapan InsertionSort ile denenir ve başarılı olursa biter.
+- Dengesiz bölümlemelerde seçilen elemanlar takas edilerek desen bozulur;
+  log2(n) kötü bölümlemeden sonra HeapSort'a geçilir.
+- Örneklenen farklı değer sayısı çok küçükse veri karşılaştırmalı sıralama
+  yerine sayma sıralamasıyla sıralanır.
+
+Bölümleme ve InsertionSort yardımcıları, IntroSort'taki gibi, states None ise
+çağrının başında kayıt kodu içermeyen _untraced eşlerine geçer.
+"""
+
+from ._buffer import as_sequence, is_buffer, sort_with_states
+from ._counting import counting_sort, has_few_distinct
+from ._events import mark_phase
+from ._keysort import sort_by_key
+from .introsort import _choose_pivot, _heapsort, _insertion_sort
+from .trace import Trace
+
+# Bu boyutun altındaki aralıklar InsertionSort ile sıralanır
+_INSERTION_THRESHOLD = 24
+
+# Bu boyutun üzerindeki aralıklarda desen bozma daha fazla eleman taşır
+_NINTHER_THRESHOLD = 128
+
+# Sıralı görünen aralıklarda InsertionSort'un vazgeçmeden yapabileceği taşıma sayısı
+_PARTIAL_INSERTION_LIMIT = 8
+
+
+def _unguarded_insertion_sort_untraced(a, lo, hi):
+    """
+    [lo, hi) aralığını InsertionSort ile sıralar. a[lo - 1] aralıktaki tüm
+    elemanlardan küçük veya eşit olduğundan sol sınır kontrolü yapılmaz.
+    """
+    for i in range(lo + 1, hi):
+        x = a[i]
+        j = i - 1
+        while x < a[j]:
+            a[j + 1] = a[j]
+            j -= 1
+        if j + 1 != i:
+            a[j + 1] = x
+
+
+def _unguarded_insertion_sort(a, lo, hi, states=None):
+    """
+    _unguarded_insertion_sort_untraced ile aynı sıralamayı yapar; her
+    yerleştirmeyi kaydeder.
+    """
+    if states is None:
+        _unguarded_insertion_sort_untraced(a, lo, hi)
+        return
+    for i in range(lo + 1, hi):
+        x = a[i]
+        j = i - 1
+        while x < a[j]:
+            a[j + 1] = a[j]
+            j -= 1
+        if j + 1 != i:
+            a[j + 1] = x
+            states.append(a, j + 1, i + 1)
+
+
+def _partial_insertion_sort_untraced(a, lo, hi):
+    """
+    [lo, hi) aralığını InsertionSort ile sıralamayı dener.
+
+    Returns:
+        bool: Aralık sıralandıysa True; taşıma sayısı sınırı aşıldıysa
+        (aralık kısmen sıralı bırakılarak) False
+    """
+    moves = 0
+    for i in range(lo + 1, hi):
+        x = a[i]
+        if x < a[i - 1]:
+            j = i - 1
+            while j >= lo and x < a[j]:
+                a[j + 1] = a[j]
+                j -= 1
+            a[j + 1] = x
+            moves += i - j - 1
+            if moves > _PARTIAL_INSERTION_LIMIT:
+                return False
+    return True
+
+
+def _partial_insertion_sort(a, lo, hi, states=None):
+    """
+    _partial_insertion_sort_untraced ile aynı işi yapar; her yerleştirmeyi
+    kaydeder.
+    """
+    if states is None:
+        return _partial_insertion_sort_untraced(a, lo, hi)
+    moves = 0
+    for i in range(lo + 1, hi):
+        x = a[i]
+        if x < a[i - 1]:
+            j = i - 1
+            while j >= lo and x < a[j]:
+                a[j + 1] = a[j]
+                j -= 1
+            a[j + 1] = x
+            moves += i - j - 1
+            states.append(a, j + 1, i + 1)
+            if moves > _PARTIAL_INSERTION_LIMIT:
+                return False
+    return True
+
+
+def _partition_right_untraced(a, lo, hi):
+    """
+    [lo, hi) aralığını a[lo] konumundaki pivota göre böler; pivota eşit
+    elemanlar sağa gider.
+
+    Returns:
+        tuple: (pivot_konumu, zaten_bölümlenmiş) - ikinci değer hiç takas
+        yapılmadıysa True'dur
+    """
+    pivot = a[lo]
+    i = lo + 1
+    while a[i] < pivot:
+        i += 1
+
+    j = hi
+    if i - 1 == lo:
+        # Soldan pivottan küçük eleman bulunamadı; sağdan tarama sınırlanmalı
+        while i < j:
+            j -= 1
+            if a[j] < pivot:
+                break
+    else:
+        j -= 1
+        while not a[j] < pivot:
+            j -= 1
+
+    already_partitioned = i >= j
+    while i < j:
+        a[i], a[j] = a[j], a[i]
+        i += 1
+        while a[i] < pivot:
+            i += 1
+        j -= 1
+        while not a[j] < pivot:
+            j -= 1
+
+    p = i - 1
+    a[lo] = a[p]
+    a[p] = pivot
+    return p, already_partitioned
+
+
+def _partition_right(a, lo, hi, states=None):
+    """
+    _partition_right_untraced ile aynı bölümlemeyi yapar; her takası kaydeder.
+    """
+    if states is None:
+        return _partition_right_untraced(a, lo, hi)
+    pivot = a[lo]
+    i = lo + 1
+    while a[i] < pivot:
+        i += 1
+
+    j = hi
+    if i - 1 == lo:
+        # Soldan pivottan küçük eleman bulunamadı; sağdan tarama sınırlanmalı
+        while i < j:
+            j -= 1
+            if a[j] < pivot:
+                break
+    else:
+        j -= 1
+        while not a[j] < pivot:
+            j -= 1
+
+    already_partitioned = i >= j
+    while i < j:
+        a[i], a[j] = a[j], a[i]
+        states.append_at(a, i, j)
+        i += 1
+        while a[i] < pivot:
+            i += 1
+        j -= 1
+        while not a[j] < pivot:
+            j -= 1
+
+    p = i - 1
+    a[lo] = a[p]
+    a[p] = pivot
+    states.append_at(a, lo, p)
+    return p, already_partitioned
+
+
+def _partition_left_untraced(a, lo, hi):
+    """
+    [lo, hi) aralığını a[lo] konumundaki pivota göre böler; pivota eşit
+    elemanlar sola gider.
+
+    Yalnızca pivot, aralığın solundaki elemana eşitken çağrılır. Bu durumda
+    sol taraftaki tüm elemanlar pivota eşittir ve yeniden sıralanmaz.
+
+    Returns:
+        int: Pivotun son konumu
+    """
+    pivot = a[lo]
+    j = hi - 1
+    while pivot < a[j]:
+        j -= 1
+
+    i = lo
+    if j + 1 == hi:
+        while i < j:
+            i += 1
+            if pivot < a[i]:
+                break
+    else:
+        i += 1
+        while not pivot < a[i]:
+            i += 1
+
+    while i < j:
+        a[i], a[j] = a[j], a[i]
+        j -= 1
+        while pivot < a[j]:
+            j -= 1
+        i += 1
+        while not pivot < a[i]:
+            i += 1
+
+    a[lo] = a[j]
+    a[j] = pivot
+    return j
+
+
+def _partition_left(a, lo, hi, states=None):
+    """
+    _partition_left_untraced ile aynı bölümlemeyi yapar; her takası kaydeder.
+    """
+    if states is None:
+        return _partition_left_untraced(a, lo, hi)
+    pivot = a[lo]
+    j = hi - 1
+    while pivot < a[j]:
+        j -= 1
+
+    i = lo
+    if j + 1 == hi:
+        while i < j:
+            i += 1
+            if pivot < a[i]:
+                break
+    else:
+        i += 1
+        while not pivot < a[i]:
+            i += 1
+
+    while i < j:
+        a[i], a[j] = a[j], a[i]
+        states.append_at(a, i, j)
+        j -= 1
+        while pivot < a[j]:
+            j -= 1
+        i += 1
+        while not pivot < a[i]:
+            i += 1
+
+    a[lo] = a[j]
+    a[j] = pivot
+    states.append_at(a, lo, j)
+    return j
+
+
+def _break_patterns(a, lo, p, hi, states=None):
+    """
+    Dengesiz bir bölümlemeden sonra her iki taraftaki bazı elemanları yer
+    değiştirerek bir sonraki pivot seçimini bozan deseni dağıtır.
+    """
+    l_size = p - lo
+    r_size = hi - p - 1
+
+    if l_size >= _INSERTION_THRESHOLD:
+        q = l_size // 4
+        a[lo], a[lo + q] = a[lo + q], a[lo]
+        a[p - 1], a[p - q] = a[p - q], a[p - 1]
+        if l_size > _NINTHER_THRESHOLD:
+            a[lo + 1], a[lo + q + 1] = a[lo + q + 1], a[lo + 1]
+            a[lo + 2], a[lo + q + 2] = a[lo + q + 2], a[lo + 2]
+            a[p - 2], a[p - q - 1] = a[p - q - 1], a[p - 2]
+            a[p - 3], a[p - q - 2] = a[p - q - 2], a[p - 3]
+
+    if r_size >= _INSERTION_THRESHOLD:
+        q = r_size // 4
+        a[p + 1], a[p + q + 1] = a[p + q + 1], a[p + 1]
+        a[hi - 1], a[hi - q] = a[hi - q], a[hi - 1]
+        if r_size > _NINTHER_THRESHOLD:
+            a[p + 2], a[p + q + 2] = a[p + q + 2], a[p + 2]
+            a[p + 3], a[p + q + 3] = a[p + q + 3], a[p + 3]
+            a[hi - 2], a[hi - q - 1] = a[hi - q - 1], a[hi - 2]
+            a[hi - 3], a[hi - q - 2] = a[hi - q - 2], a[hi - 3]
+
+    if states is not None:
+        states.append(a, lo, hi)
+
+
+def _pdqsort_loop(a, lo, hi, bad_allowed, leftmost=True, states=None):
+    """
+    [lo, hi) aralığını sıralar. Küçük tarafa özyinelemeli inilir, büyük taraf
+    döngüde işlenir.
+
+    leftmost=False ise a[lo - 1] aralıktaki tüm elemanlardan küçük veya
+    eşittir; bu bilgi sınır kontrolsüz InsertionSort ve eşit eleman tespiti
+    için kullanılır.
+    """
+    while True:
+        size = hi - lo
+        if size < _INSERTION_THRESHOLD:
+            if leftmost:
+                _insertion_sort(a, lo, hi, states)
+            else:
+                _unguarded_insertion_sort(a, lo, hi, states)
+            return
+
+        _choose_pivot(a, lo, hi, states)
+
+        # Pivot soldaki elemana eşitse aralıktaki en küçük değerdir; ona eşit
+        # elemanlar sola toplanır ve yalnızca sağ taraf sıralanmaya devam eder
+        if not leftmost and not a[lo - 1] < a[lo]:
+            mark_phase(a, "equal_partition", lo, hi)
+            lo = _partition_left(a, lo, hi, states) + 1
+            continue
+
+        p, already_partitioned = _partition_right(a, lo, hi, states)
+        l_size = p - lo
+        r_size = hi - p - 1
+
+        if l_size < size // 8 or r_size < size // 8:
+            bad_allowed -= 1
+            if bad_allowed == 0:
+                mark_phase(a, "heap_fallback", lo, hi)
+                _heapsort(a, lo, hi, states)
+                return
+            mark_phase(a, "break_patterns", lo, hi)
+            _break_patterns(a, lo, p, hi, states)
+        elif (already_partitioned
+              and _partial_insertion_sort(a, lo, p, states)
+              and _partial_insertion_sort(a, p + 1, hi, states)):
+            return
+
+        if l_size < r_size:
+            _pdqsort_loop(a, lo, p, bad_allowed, leftmost, states)
+            lo = p + 1
+            leftmost = False
+        else:
+            _pdqsort_loop(a, p + 1, hi, bad_allowed, False, states)
+            hi = p
+
+
+def pdqsort(data, collect_states=False, key=None):
+    """
+    Pattern-Defeating QuickSort algoritması ile veriyi yerinde sıralar.
+
+    Args:
+        data (list veya tampon): Sıralanacak veri
+        collect_states (bool): True ise animasyon için ara durumlar toplanır
+        key (callable, optional): Her elemandan sıralama anahtarı üreten
+            fonksiyon. Anahtarlar eleman başına bir kez hesaplanır.
+
+    Returns:
+        list: Sıralanmış veri; collect_states=True ise (veri, durumlar) ikilisi
+    """
+    if key is not None:
+        return sort_by_key(pdqsort, data, key, collect_states)
+    if collect_states and is_buffer(data):
+        return sort_with_states(pdqsort, data)
+
+    a = as_sequence(data)
+    states = Trace(a) if collect_states else None
+    n = len(a)
+    by_counting = has_few_distinct(a) and counting_sort(a, pdqsort, states)
+    if n > 1 and not by_counting:
+        # İzin verilen kötü bölümleme sayısı: floor(log2(n))
+        _pdqsort_loop(a, 0, n, n.bit_length() - 1, True, states)
+    if collect_states:
+        return data, states
+    return data
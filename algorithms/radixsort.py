@@ -0,0 +1,210 @@
+"""
+RadixSort Modülü
+
+Bu modül, NumPy ile vektörleştirilmiş LSD (en düşük basamaktan başlayan)
+RadixSort algoritmasını içerir. Anahtarlar 8 veya 11 bitlik basamaklar halinde
+işlenir; her geçiş tüm dizi üzerinde tek seferde ve kararlı şekilde yapılır.
+
+İşaretli tam sayılarda işaret biti ters çevrilerek (bias) negatif sayılar
+işaretsiz sıralamada doğru konuma taşınır. Tüm anahtarlarda aynı olan
+basamaklar için geçiş yapılmaz; dar aralıklı verilerde tek bir sayma geçişi
+yeterlidir.
+"""
+
+import numpy as np
+
+from ._buffer import as_array, write_back
+from ._keysort import apply_permutation
+from .trace import Trace
+
+# Bu boyuttan küçük dizilerde 8 bitlik, daha büyüklerinde 11 bitlik basamak
+# kullanılır (11 bit: 64 bitlik anahtar için 6 geçiş, 2048 kovalık histogram)
+_WIDE_DIGIT_THRESHOLD = 1 << 16
+
+# Anahtar aralığı bundan darsa radix geçişleri yerine tek sayma geçişi yapılır
+_COUNTING_RANGE = 1 << 16
+
+
+def _to_unsigned_keys(arr):
+    """
+    Tam sayı dizisini sıralama düzeni korunan işaretsiz anahtarlara çevirir.
+
+    Returns:
+        tuple: (anahtarlar, bias) - bias, işaretli türlerde işaret bitidir
+    """
+    bits = arr.dtype.itemsize * 8
+    unsigned = np.dtype(f"u{arr.dtype.itemsize}")
+    keys = arr.view(unsigned)
+    if arr.dtype.kind == "i":
+        bias = unsigned.type(1 << (bits - 1))
+        keys = keys ^ bias
+    else:
+        bias = None
+    return keys, bias
+
+
+def _from_unsigned_keys(keys, bias, dtype):
+    """
+    _to_unsigned_keys dönüşümünü geri alır.
+    """
+    if bias is not None:
+        keys = keys ^ bias
+    return keys.view(dtype)
+
+
+def _radix_passes(keys, digit_bits, on_pass=None, perm=None):
+    """
+    İşaretsiz anahtar dizisini LSD radix geçişleriyle sıralar.
+
+    Anahtar aralığı küçükse (max - min < _COUNTING_RANGE) tek bir sayma
+    geçişi yeterlidir: np.bincount ile histogram çıkarılır ve değerler
+    sayılarına göre yeniden yazılır.
+
+    Aksi halde her geçişte basamak histogramı np.bincount ile çıkarılır; tüm
+    anahtarların aynı basamağa sahip olduğu geçişler ve en yüksek farklı bitin
+    üzerindeki geçişler atlanır. Kararlı dağıtım, dar (8/16 bit) basamak dizisi
+    üzerinde NumPy'nin kararlı argsort'u ile yapılır; NumPy bu türler için C
+    seviyesinde sayma tabanlı radix geçişi kullanır.
+
+    Args:
+        keys (np.ndarray): İşaretsiz anahtarlar
+        digit_bits (int): Basamak genişliği (8 veya 11)
+        on_pass (callable, optional): Her geçişten sonra (anahtarlar,
+            permütasyon) ile çağrılır
+        perm (np.ndarray, optional): Verilirse anahtarlarla birlikte aynı
+            sırayla taşınan indeks dizisi
+
+    Returns:
+        tuple: (sıralanmış anahtarlar, taşınan permütasyon veya None)
+    """
+    n = keys.size
+    bits = keys.dtype.itemsize * 8
+    kmin = keys.min()
+    kmax = keys.max()
+    key_range = int(kmax) - int(kmin)
+
+    if key_range < _COUNTING_RANGE:
+        if perm is None:
+            counts = np.bincount((keys - kmin).astype(np.intp), minlength=key_range + 1)
+            keys = np.repeat(np.arange(key_range + 1, dtype=keys.dtype) + kmin, counts)
+        else:
+            # Eşit anahtarların özgün sırası da gerektiğinden kararlı dağıtım
+            order = np.argsort((keys - kmin).astype(np.uint16), kind="stable")
+            keys = keys[order]
+            perm = perm[order]
+        if on_pass is not None:
+            on_pass(keys, perm)
+        return keys, perm
+
+    digit_bits = min(digit_bits, bits)
+    radix = 1 << digit_bits
+    mask = keys.dtype.type(radix - 1)
+    digit_dtype = np.uint8 if digit_bits <= 8 else np.uint16
+
+    # En yüksek farklı bitin üzerindeki tüm basamaklar bütün anahtarlarda aynıdır
+    top_bit = int(kmax ^ kmin).bit_length()
+
+    for shift in range(0, top_bit, digit_bits):
+        digits = ((keys >> keys.dtype.type(shift)) & mask).astype(digit_dtype)
+        counts = np.bincount(digits, minlength=radix)
+        if counts.max() == n:
+            continue
+        order = np.argsort(digits, kind="stable")
+        keys = keys[order]
+        if perm is not None:
+            perm = perm[order]
+        if on_pass is not None:
+            on_pass(keys, perm)
+    return keys, perm
+
+
+def _as_integer_array(values):
+    """
+    Değerleri tam sayı NumPy dizisine çevirir.
+
+    Raises:
+        TypeError: Değerler tam sayı değilse
+    """
+    arr = values if isinstance(values, np.ndarray) else np.asarray(values)
+    if arr.size and arr.dtype.kind not in "iu":
+        raise TypeError(f"RadixSort yalnızca tam sayı verisi sıralayabilir, alınan tür: {arr.dtype}")
+    return arr
+
+
+def _radix_argsort(keys, on_pass=None):
+    """
+    Tam sayı anahtarlarını sıralayan kararlı permütasyonu döndürür.
+
+    Args:
+        keys (np.ndarray): Tam sayı anahtarları
+        on_pass (callable, optional): Her geçişten sonra ara permütasyonla çağrılır
+
+    Returns:
+        np.ndarray: keys[perm] sıralı olacak şekilde indeks dizisi
+    """
+    perm = np.arange(keys.size)
+    if keys.size < 2:
+        return perm
+    unsigned, _ = _to_unsigned_keys(keys.ravel())
+    digit_bits = 8 if keys.size < _WIDE_DIGIT_THRESHOLD else 11
+    callback = None if on_pass is None else (lambda k, p: on_pass(p))
+    return _radix_passes(unsigned, digit_bits, callback, perm)[1]
+
+
+def radixsort(data, collect_states=False, key=None):
+    """
+    RadixSort algoritması ile tam sayı verisini yerinde ve kararlı şekilde sıralar.
+
+    Python listeleri ve tam sayı tamponları (NumPy dizileri, array.array,
+    memoryview) desteklenir. Tamponlar kopyalanmadan NumPy görünümüyle
+    sıralanır; listeler tek seferde NumPy dizisine çevrilir, sonuç aynı listeye
+    geri yazılır.
+
+    Args:
+        data (list veya tampon): Sıralanacak tam sayı verisi
+        collect_states (bool): True ise animasyon için her geçişten sonraki
+            durum toplanır
+        key (callable, optional): Her elemandan tam sayı sıralama anahtarı
+            üreten fonksiyon. Anahtarlar eleman başına bir kez hesaplanır,
+            sıralama anahtar dizisi üzerinde yapılır ve sonuç permütasyonu
+            veriye en sonda tek seferde uygulanır.
+
+    Returns:
+        list veya tampon: Sıralanmış veri; collect_states=True ise
+        (veri, durumlar) ikilisi
+
+    Raises:
+        TypeError: Veri (ya da key ile üretilen anahtarlar) tam sayı değilse
+    """
+    if key is not None:
+        keys = _as_integer_array(as_array([key(x) for x in data]))
+        states = Trace(data) if collect_states else None
+        on_pass = None
+        if collect_states:
+            def on_pass(p):
+                states.append([data[i] for i in p.tolist()])
+        apply_permutation(data, _radix_argsort(keys, on_pass))
+        if collect_states:
+            return data, states
+        return data
+
+    arr = _as_integer_array(as_array(data))
+    states = Trace(arr) if collect_states else None
+
+    if arr.size > 1:
+        keys, bias = _to_unsigned_keys(arr.ravel())
+        digit_bits = 8 if arr.size < _WIDE_DIGIT_THRESHOLD else 11
+
+        on_pass = None
+        if collect_states:
+            def on_pass(k, p):
+                states.append(_from_unsigned_keys(k, bias, arr.dtype))
+
+        keys, _ = _radix_passes(keys, digit_bits, on_pass)
+        result = _from_unsigned_keys(keys, bias, arr.dtype)
+
+        write_back(data, arr, result)
+
+    if collect_states:
+        return data, states
+    return data
@@ -0,0 +1,127 @@
+"""
+Bölümlü (Segmented) Sıralama Modülü
+
+Bu modül, çok sayıda bağımsız küçük diziyi tek çağrıda sıralamak için
+bölümlü sıralama içerir. Diziler düz bir değer tamponu ve bölüm sınırlarını
+veren ofset dizisi (CSR düzeni) olarak verilir: i. bölüm
+values[offsets[i]:offsets[i + 1]] aralığıdır.
+
+Küçük bölümlerin tümü tek bir vektörel sıralamayla işlenir: her elemana bölüm
+numarası eşlenir ve (bölüm, değer) çifti tek bir 64 bitlik anahtara paketlenip
+permütasyon hesaplanmadan doğrudan sıralanır. Tam sayılar en küçük değere
+göre kaydırılarak, diğer türler global sıra numaralarına çevrilerek paketlenir;
+paketleme sığmazsa np.lexsort kullanılır. Büyük bölümler kayıtlı algoritmalardan biriyle tek tek
+sıralanır. Böylece bölüm başına Python çağrısı maliyeti yalnızca büyük
+bölümlerde ödenir.
+"""
+
+import numpy as np
+
+from ._buffer import as_array, write_back
+from .radixsort import radixsort
+from .timsort import timsort
+
+# Bu boyuttan büyük bölümler algoritmayla tek tek sıralanır
+_SMALL_SEGMENT_THRESHOLD = 4096
+
+
+def _check_offsets(offsets, size):
+    """
+    Ofset dizisini doğrular ve NumPy indeks dizisine çevirir.
+
+    Raises:
+        ValueError: Ofsetler tek boyutlu, azalmayan ve [0, size] aralığında değilse
+    """
+    offsets = np.asarray(offsets, dtype=np.intp)
+    if offsets.ndim != 1 or offsets.size == 0:
+        raise ValueError("Ofsetler en az bir eleman içeren tek boyutlu bir dizi olmalıdır")
+    if offsets[0] < 0 or offsets[-1] > size or np.any(np.diff(offsets) < 0):
+        raise ValueError("Ofsetler azalmayan sırada ve [0, değer sayısı] aralığında olmalıdır")
+    return offsets
+
+
+def _sort_small_segments(arr, starts, lengths):
+    """
+    Verilen bölümlerin tümünü tek bir vektörel sıralamayla yerinde sıralar.
+    """
+    total = int(lengths.sum())
+    seg_ids = np.repeat(np.arange(lengths.size), lengths)
+    # Her elemanın düz dizideki konumu: bölüm başlangıcı + bölüm içi sıra
+    first = np.cumsum(lengths) - lengths
+    idx = np.repeat(starts - first, lengths) + np.arange(total)
+    vals = arr[idx]
+
+    if vals.dtype.kind in "iu":
+        # Değerler en küçük değere göre kaydırılır; işaretli türlerde uint64'e
+        # çevirmedeki taşma farkı değiştirmez
+        low = vals.min().astype(np.uint64)
+        keys = vals.astype(np.uint64) - low
+        value_bits = int(keys.max()).bit_length()
+
+        def decode(k):
+            return (k + low).astype(vals.dtype)
+    else:
+        # Diğer türlerde değerler önce tek bir global sıralamayla sıra
+        # numaralarına (rank) çevrilir
+        order = np.argsort(vals)
+        keys = np.empty(total, dtype=np.uint64)
+        keys[order] = np.arange(total, dtype=np.uint64)
+        value_bits = (total - 1).bit_length()
+
+        def decode(k):
+            return vals[order[k.astype(np.intp)]]
+
+    if (lengths.size - 1).bit_length() + value_bits <= 64:
+        # (bölüm, değer) tek anahtara paketlenir; sıralama permütasyonsuz yapılır
+        packed = (seg_ids.astype(np.uint64) << np.uint64(value_bits)) | keys
+        packed.sort()
+        packed &= np.uint64((1 << value_bits) - 1)
+        arr[idx] = decode(packed)
+    else:
+        arr[idx] = vals[np.lexsort((vals, seg_ids))]
+
+
+def segmented_sort(values, offsets, algorithm=None,
+                   small_segment_threshold=_SMALL_SEGMENT_THRESHOLD):
+    """
+    Düz bir tamponda ardışık tutulan bağımsız dizilerin her birini yerinde sıralar.
+
+    Args:
+        values (list veya tampon): Tüm bölümlerin ardışık değerleri
+        offsets (list veya np.ndarray): Bölüm sınırları; i. bölüm
+            values[offsets[i]:offsets[i + 1]] aralığıdır
+        algorithm (callable, optional): Büyük bölümleri sıralayacak algoritma
+            (timsort, introsort, radixsort...). Varsayılan tam sayılar için
+            radixsort, diğer türler için timsort.
+        small_segment_threshold (int): Bu boyuttaki ve daha küçük bölümler
+            tek vektörel sıralamayla işlenir
+
+    Returns:
+        list veya tampon: Bölümleri sıralanmış veri
+
+    Raises:
+        ValueError: Ofsetler geçersizse
+    """
+    arr = as_array(values)
+    offsets = _check_offsets(offsets, arr.size)
+    flat = arr.ravel()
+
+    starts = offsets[:-1]
+    lengths = np.diff(offsets)
+
+    small = (lengths > 1) & (lengths <= small_segment_threshold)
+    if small.any():
+        _sort_small_segments(flat, starts[small], lengths[small])
+
+    large = np.flatnonzero(lengths > small_segment_threshold)
+    if large.size:
+        if algorithm is None:
+            algorithm = radixsort if flat.dtype.kind in "iu" else timsort
+        for i in large.tolist():
+            start = int(starts[i])
+            end = start + int(lengths[i])
+            # Dilim flat ile aynı belleği paylaşır; algoritma onu yerinde sıralar
+            algorithm(flat[start:end])
+
+    write_back(values, arr, flat)
+    return values
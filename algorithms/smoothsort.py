@@ -0,0 +1,305 @@
+"""
+SmoothSort Modülü
+
+Bu modül, Edsger Dijkstra'nın SmoothSort algoritmasını içerir. Dizi, boyutları
+Leonardo sayıları olan yığınların (heap) bir dizisi olarak tutulur. Yığın
+şekli tek bir tam sayı bit maskesinde (p, pshift) saklanır; sift ve trinkle
+işlemleri yinelemelidir. Bu sayede özyineleme ya da düğüm başına bellek
+ayrılmaz ve ek bellek O(1) olur.
+
+Sıralı ya da kısmen sıralı veride yığınlar neredeyse hiç düzeltme gerektirmez,
+bu yüzden en iyi durum O(n)'dir.
+
+_sift, _trinkle ve ana döngünün kayıt kodu içermeyen _untraced eşleri vardır;
+collect_states=False iken yalnızca bunlar çalışır.
+"""
+
+from ._buffer import as_sequence, is_buffer, sort_with_states
+from ._events import mark_phase
+from ._keysort import sort_by_key
+from .trace import Trace
+
+
+def _leonardo_numbers(limit):
+    """
+    limit değerini aşana kadar Leonardo sayılarını üretir:
+    L(0) = L(1) = 1, L(k) = L(k-1) + L(k-2) + 1
+    """
+    numbers = [1, 1]
+    while numbers[-1] <= limit:
+        numbers.append(numbers[-1] + numbers[-2] + 1)
+    return numbers
+
+
+# 64 bitlik indeks aralığının tamamını kapsayan Leonardo sayıları tablosu
+_LP = _leonardo_numbers(1 << 64)
+
+
+def _trailing_zeros(x):
+    """
+    x'in sondaki sıfır bit sayısını döndürür (x > 0).
+    """
+    return (x & -x).bit_length() - 1
+
+
+def _sift_untraced(a, pshift, head):
+    """
+    head kökündeki L(pshift) boyutlu Leonardo yığınında kökü aşağı kaydırır.
+    """
+    lp = _LP
+    val = a[head]
+    while pshift > 1:
+        rt = head - 1
+        lf = head - 1 - lp[pshift - 2]
+        if not val < a[lf] and not val < a[rt]:
+            break
+        if not a[lf] < a[rt]:
+            a[head] = a[lf]
+            head = lf
+            pshift -= 1
+        else:
+            a[head] = a[rt]
+            head = rt
+            pshift -= 2
+    a[head] = val
+
+
+def _sift(a, pshift, head, written=None):
+    """
+    _sift_untraced ile aynı işi yapar; yazılan konumları written'a ekler.
+    """
+    if written is None:
+        _sift_untraced(a, pshift, head)
+        return
+    lp = _LP
+    val = a[head]
+    while pshift > 1:
+        rt = head - 1
+        lf = head - 1 - lp[pshift - 2]
+        if not val < a[lf] and not val < a[rt]:
+            break
+        written.append(head)
+        if not a[lf] < a[rt]:
+            a[head] = a[lf]
+            head = lf
+            pshift -= 1
+        else:
+            a[head] = a[rt]
+            head = rt
+            pshift -= 2
+    a[head] = val
+    written.append(head)
+
+
+def _trinkle_untraced(a, p, pshift, head, trusty):
+    """
+    head kökünü, kök dizisi boyunca soldaki yığınların kökleriyle
+    karşılaştırarak doğru yığına taşır, ardından o yığında aşağı kaydırır.
+
+    trusty=True ise head'in kendi yığınının zaten düzgün olduğu bilinir ve
+    çocuk karşılaştırmaları atlanır.
+    """
+    lp = _LP
+    val = a[head]
+    while p != 1:
+        stepson = head - lp[pshift]
+        if not val < a[stepson]:
+            break
+        if not trusty and pshift > 1:
+            rt = head - 1
+            lf = head - 1 - lp[pshift - 2]
+            if not a[rt] < a[stepson] or not a[lf] < a[stepson]:
+                break
+        a[head] = a[stepson]
+        head = stepson
+        trail = _trailing_zeros(p & ~1)
+        p >>= trail
+        pshift += trail
+        trusty = False
+    if not trusty:
+        a[head] = val
+        _sift_untraced(a, pshift, head)
+
+
+def _trinkle(a, p, pshift, head, trusty, written=None):
+    """
+    _trinkle_untraced ile aynı işi yapar; yazılan konumları written'a ekler.
+    """
+    if written is None:
+        _trinkle_untraced(a, p, pshift, head, trusty)
+        return
+    lp = _LP
+    val = a[head]
+    while p != 1:
+        stepson = head - lp[pshift]
+        if not val < a[stepson]:
+            break
+        if not trusty and pshift > 1:
+            rt = head - 1
+            lf = head - 1 - lp[pshift - 2]
+            if not a[rt] < a[stepson] or not a[lf] < a[stepson]:
+                break
+        a[head] = a[stepson]
+        written.append(head)
+        head = stepson
+        trail = _trailing_zeros(p & ~1)
+        p >>= trail
+        pshift += trail
+        trusty = False
+    if not trusty:
+        a[head] = val
+        _sift(a, pshift, head, written)
+
+
+def _smoothsort_untraced(a):
+    """
+    Dizinin tamamını Leonardo yığınlarıyla sıralar.
+    """
+    n = len(a)
+
+    if n > 1:
+        lp = _LP
+        hi = n - 1
+        head = 0
+        # p: yığın şeklinin bit maskesi (pshift kadar sağa kaydırılmış),
+        # pshift: en sağdaki yığının Leonardo derecesi
+        p = 1
+        pshift = 1
+
+        # Yığın kurma: her eleman en sağdaki yığınlara eklenir
+        mark_phase(a, "heap_build", 0, n)
+        while head < hi:
+            if (p & 3) == 3:
+                # Ardışık iki Leonardo yığını yeni kökle birleşir
+                _sift_untraced(a, pshift, head)
+                p >>= 2
+                pshift += 2
+            else:
+                if lp[pshift - 1] >= hi - head:
+                    # Bu yığın son boyutunda; köklerin sırası düzeltilmeli
+                    _trinkle_untraced(a, p, pshift, head, False)
+                else:
+                    # Daha sonra birleşecek; yığın özelliği yeterli
+                    _sift_untraced(a, pshift, head)
+                if pshift == 1:
+                    p <<= 1
+                    pshift -= 1
+                else:
+                    p <<= pshift - 1
+                    pshift = 1
+            p |= 1
+            head += 1
+
+        # Kök dizisinin son düzeltmesi
+        _trinkle_untraced(a, p, pshift, head, False)
+
+        # Yığınları küçültme: her adımda en büyük eleman yerinde kalır
+        mark_phase(a, "heap_shrink", 0, n)
+        while pshift != 1 or p != 1:
+            if pshift <= 1:
+                trail = _trailing_zeros(p & ~1)
+                p >>= trail
+                pshift += trail
+            else:
+                p <<= 2
+                p ^= 7
+                pshift -= 2
+                # Kök çıkınca iki alt yığın kalır; kökleri sırayla düzeltilir
+                _trinkle_untraced(a, p >> 1, pshift + 1, head - lp[pshift] - 1, True)
+                _trinkle_untraced(a, p, pshift, head - 1, True)
+            head -= 1
+
+
+def _smoothsort(a, states=None):
+    """
+    _smoothsort_untraced ile aynı sıralamayı yapar; her adımda yazılan
+    konumları kaydeder.
+    """
+    if states is None:
+        _smoothsort_untraced(a)
+        return
+    # Bir adımda yazılan konumlar; iz yalnızca bunları karşılaştırır
+    written = []
+    n = len(a)
+
+    if n > 1:
+        lp = _LP
+        hi = n - 1
+        head = 0
+        # p: yığın şeklinin bit maskesi (pshift kadar sağa kaydırılmış),
+        # pshift: en sağdaki yığının Leonardo derecesi
+        p = 1
+        pshift = 1
+
+        # Yığın kurma: her eleman en sağdaki yığınlara eklenir
+        mark_phase(a, "heap_build", 0, n)
+        while head < hi:
+            if (p & 3) == 3:
+                # Ardışık iki Leonardo yığını yeni kökle birleşir
+                _sift(a, pshift, head, written)
+                p >>= 2
+                pshift += 2
+            else:
+                if lp[pshift - 1] >= hi - head:
+                    # Bu yığın son boyutunda; köklerin sırası düzeltilmeli
+                    _trinkle(a, p, pshift, head, False, written)
+                else:
+                    # Daha sonra birleşecek; yığın özelliği yeterli
+                    _sift(a, pshift, head, written)
+                if pshift == 1:
+                    p <<= 1
+                    pshift -= 1
+                else:
+                    p <<= pshift - 1
+                    pshift = 1
+            p |= 1
+            head += 1
+            states.append_at(a, *written)
+            written.clear()
+
+        # Bu düzeltmenin yazımları küçültmenin ilk adımına katılır
+        _trinkle(a, p, pshift, head, False, written)
+
+        # Yığınları küçültme: her adımda en büyük eleman yerinde kalır
+        mark_phase(a, "heap_shrink", 0, n)
+        while pshift != 1 or p != 1:
+            if pshift <= 1:
+                trail = _trailing_zeros(p & ~1)
+                p >>= trail
+                pshift += trail
+            else:
+                p <<= 2
+                p ^= 7
+                pshift -= 2
+                # Kök çıkınca iki alt yığın kalır; kökleri sırayla düzeltilir
+                _trinkle(a, p >> 1, pshift + 1, head - lp[pshift] - 1, True, written)
+                _trinkle(a, p, pshift, head - 1, True, written)
+            head -= 1
+            states.append_at(a, *written)
+            written.clear()
+
+
+def smoothsort(data, collect_states=False, key=None):
+    """
+    SmoothSort algoritması ile veriyi yerinde sıralar.
+
+    Args:
+        data (list veya tampon): Sıralanacak veri
+        collect_states (bool): True ise animasyon için ara durumlar toplanır
+        key (callable, optional): Her elemandan sıralama anahtarı üreten
+            fonksiyon. Anahtarlar eleman başına bir kez hesaplanır.
+
+    Returns:
+        list: Sıralanmış veri; collect_states=True ise (veri, durumlar) ikilisi
+    """
+    if key is not None:
+        return sort_by_key(smoothsort, data, key, collect_states)
+    if collect_states and is_buffer(data):
+        return sort_with_states(smoothsort, data)
+
+    a = as_sequence(data)
+    states = Trace(a) if collect_states else None
+    _smoothsort(a, states)
+    if collect_states:
+        return data, states
+    return data
@@ -0,0 +1,182 @@
+"""
+İş Parçacıklı Parçalı Sıralama Modülü
+
+Bu modül, sayısal dizileri çekirdek başına parçalara bölüp bir iş parçacığı
+havuzunda (ThreadPoolExecutor) eşzamanlı sıralayan ve parçaları paralel bir
+birleştirme ağacıyla birleştiren sıralamayı içerir.
+
+NumPy'nin sıralama ve kopyalama çekirdekleri sayısal dizilerde GIL'i
+bıraktığından iş parçacıkları gerçekten paralel çalışır. Paralel SampleSort'tan
+farklı olarak süreç başlatma ve süreçler arası veri taşıma maliyeti yoktur;
+tüm iş parçacıkları aynı diziyi doğrudan kullanır.
+
+Birleştirme ağacının her seviyesinde komşu run çiftleri birleştirilir. Her
+birleştirme merge path yöntemiyle bağımsız parçalara bölünür: iki run'dan
+eşit aralıklı konumlar alınır ve her konumun diğer run'daki karşılığı
+np.searchsorted ile bulunur. Bu noktaların tümü birleştirme yolunun üzerinde
+olduğundan her parça diğerlerinden bağımsız olarak çıktıdaki kendi yerine
+birleştirilebilir. Parça birleştirmesi, iki sıralı yarıyı art arda yazıp
+NumPy'nin kararlı sıralamasıyla (iki run'ı doğrusal sürede birleştiren
+TimSort) yapılır.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ._buffer import as_array, write_back
+from .trace import Trace
+
+# Bu boyutun altındaki veriler tek parça halinde sıralanır
+_PARALLEL_THRESHOLD = 1 << 16
+
+# İş parçacığı havuzu çağrılar arasında yeniden kullanılır
+_executor = None
+_executor_workers = 0
+
+
+def _get_executor(workers):
+    """
+    İstenen işçi sayısında paylaşılan iş parçacığı havuzunu döndürür.
+    """
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        if _executor is not None:
+            _executor.shutdown()
+        _executor = ThreadPoolExecutor(max_workers=workers)
+        _executor_workers = workers
+    return _executor
+
+
+def _run_all(executor, func, tasks):
+    """
+    Görevleri havuzda eşzamanlı çalıştırır ve hepsinin bitmesini bekler.
+    Havuz yoksa görevler sırayla çalıştırılır.
+    """
+    if executor is None or len(tasks) < 2:
+        for task in tasks:
+            func(*task)
+        return
+    for future in [executor.submit(func, *task) for task in tasks]:
+        future.result()
+
+
+def _sort_chunk(arr, lo, hi):
+    """
+    arr[lo:hi] parçasını yerinde sıralar.
+    """
+    arr[lo:hi].sort()
+
+
+def _merge_path_splits(a, b, parts):
+    """
+    Sıralı a ve b run'larının birleştirme yolunu bağımsız parçalara böler.
+
+    a ve b'nin her birinden eşit aralıklı parts - 1 konum alınır. a'daki bir
+    konumun b'deki karşılığı, ondan küçük elemanların sayısıdır; b'deki bir
+    konumun a'daki karşılığı ondan küçük veya eşit elemanların sayısıdır.
+    Böylece eşitlikte a'nın elemanları önce gelir. Her parça a ve b'nin her
+    birinden en fazla len / parts eleman içerir.
+
+    Returns:
+        tuple: (a_sınırları, b_sınırları) - k. parça a[i[k]:i[k+1]] ve
+        b[j[k]:j[k+1]] aralıklarıdır ve çıktıda i[k] + j[k] konumundan başlar
+    """
+    ia = (np.arange(1, parts) * a.size) // parts
+    jb = (np.arange(1, parts) * b.size) // parts
+    ja = np.searchsorted(b, a[ia], side="left")
+    ib = np.searchsorted(a, b[jb], side="right")
+
+    i = np.concatenate(([0], ia, ib, [a.size]))
+    j = np.concatenate(([0], ja, jb, [b.size]))
+    # Yol üzerindeki noktalar köşegen (i + j) sırasına göre dizilir
+    order = np.argsort(i + j, kind="stable")
+    return i[order].tolist(), j[order].tolist()
+
+
+def _merge_piece(a, b, out, offset):
+    """
+    Sıralı a ve b parçalarını out[offset:] konumuna birleştirir.
+    """
+    mid = offset + a.size
+    end = mid + b.size
+    out[offset:mid] = a
+    out[mid:end] = b
+    out[offset:end].sort(kind="stable")
+
+
+def threaded_sort(data, collect_states=False, workers=None):
+    """
+    Sayısal veriyi iş parçacığı havuzunda parçalı olarak yerinde sıralar.
+
+    Args:
+        data (list veya tampon): Sıralanacak sayısal veri
+        collect_states (bool): True ise animasyon için parçalar sıralandıktan
+            sonraki ve her birleştirme seviyesinden sonraki durum toplanır
+        workers (int, optional): İş parçacığı sayısı. Varsayılan CPU sayısı.
+
+    Returns:
+        list veya tampon: Sıralanmış veri; collect_states=True ise
+        (veri, durumlar) ikilisi
+
+    Raises:
+        TypeError: Veri sayısal değilse
+    """
+    arr = as_array(data)
+    if arr.size and arr.dtype.kind not in "iuf":
+        raise TypeError(f"Threaded Sort yalnızca sayısal veri sıralayabilir, alınan tür: {arr.dtype}")
+
+    states = Trace(arr) if collect_states else None
+    n = arr.size
+
+    if n > 1:
+        workers = max(1, workers or os.cpu_count() or 1)
+        chunks = workers if n >= _PARALLEL_THRESHOLD else 1
+        executor = _get_executor(workers) if chunks > 1 else None
+        flat = arr.ravel()
+
+        # Çekirdek başına bir parça; her parça ayrı bir iş parçacığında sıralanır
+        bounds = [(k * n) // chunks for k in range(chunks + 1)]
+        runs = list(zip(bounds[:-1], bounds[1:]))
+        _run_all(executor, _sort_chunk, [(flat, lo, hi) for lo, hi in runs])
+        if collect_states:
+            states.append(flat)
+
+        # Birleştirme ağacı; seviyeler flat ile yardımcı dizi arasında gidip gelir
+        src = flat
+        dst = np.empty_like(flat) if len(runs) > 1 else None
+        while len(runs) > 1:
+            tasks = []
+            next_runs = []
+            for r in range(0, len(runs), 2):
+                lo, mid = runs[r]
+                if r + 1 == len(runs):
+                    # Eşi olmayan son run olduğu gibi kopyalanır
+                    tasks.append((src[lo:mid], src[mid:mid], dst, lo))
+                    next_runs.append((lo, mid))
+                    continue
+                hi = runs[r + 1][1]
+                a = src[lo:mid]
+                b = src[mid:hi]
+                if a.size and b.size:
+                    i, j = _merge_path_splits(a, b, workers)
+                else:
+                    i, j = [0, a.size], [0, b.size]
+                for k in range(len(i) - 1):
+                    if i[k] < i[k + 1] or j[k] < j[k + 1]:
+                        tasks.append((a[i[k]:i[k + 1]], b[j[k]:j[k + 1]], dst, lo + i[k] + j[k]))
+                next_runs.append((lo, hi))
+            _run_all(executor, _merge_piece, tasks)
+            src, dst = dst, src
+            runs = next_runs
+            if collect_states:
+                states.append(src)
+
+        if src is not flat:
+            flat[...] = src
+        write_back(data, arr, flat)
+
+    if collect_states:
+        return data, states
+    return data
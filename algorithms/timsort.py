@@ -0,0 +1,555 @@
+"""
+TimSort Modülü
+
+Bu modül, Tim Peters'ın TimSort algoritmasını içerir. Verideki doğal sıralı
+dizileri (run) bulur, kısa olanları ikili InsertionSort ile minrun uzunluğuna
+tamamlar ve bunları yığın değişmezlerini koruyarak birleştirir. Birleştirme
+sırasında bir dizi art arda kazanırsa galop (üstel arama) moduna geçilir.
+
+Birleştirme tamponu yalnızca iki diziden kısa olanı için ayrılır.
+
+Eleman başına kayıt yapılan tek yer ikili InsertionSort'tur; states None ise
+kayıt kodu içermeyen _binary_insertion_sort_untraced çalışır. Diğer kayıtlar
+run ve birleştirme başına birer kez yapılır.
+"""
+
+from ._buffer import as_sequence, copy_slice, is_buffer, sort_with_states
+from ._events import mark_phase
+from ._keysort import sort_by_key
+from .trace import Trace
+
+# Bu boyutun altındaki diziler doğrudan ikili InsertionSort ile sıralanır
+_MIN_MERGE = 32
+
+# Galop moduna geçmek için gereken başlangıç ardışık kazanma sayısı
+_MIN_GALLOP = 7
+
+
+def _compute_minrun(n):
+    """
+    n için minimum run uzunluğunu hesaplar.
+
+    Sonuç [_MIN_MERGE/2, _MIN_MERGE] aralığındadır ve n / minrun ikinin bir
+    kuvvetine eşit ya da ondan biraz küçüktür; böylece birleştirmeler dengeli olur.
+    """
+    r = 0
+    while n >= _MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _reverse_range(a, lo, hi):
+    """
+    [lo, hi) aralığını yerinde ters çevirir.
+    """
+    hi -= 1
+    while lo < hi:
+        a[lo], a[hi] = a[hi], a[lo]
+        lo += 1
+        hi -= 1
+
+
+def _count_run_and_make_ascending(a, lo, hi, states=None):
+    """
+    lo konumunda başlayan doğal run'ın uzunluğunu döndürür.
+
+    Kesin azalan run'lar kararlılığı bozmadan yerinde ters çevrilir.
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+    if a[run_hi] < a[lo]:
+        run_hi += 1
+        while run_hi < hi and a[run_hi] < a[run_hi - 1]:
+            run_hi += 1
+        _reverse_range(a, lo, run_hi)
+        if states is not None:
+            states.append(a, lo, run_hi)
+    else:
+        run_hi += 1
+        while run_hi < hi and not a[run_hi] < a[run_hi - 1]:
+            run_hi += 1
+    mark_phase(a, "run_detected", lo, run_hi)
+    return run_hi - lo
+
+
+def _binary_insertion_sort_untraced(a, lo, hi, start):
+    """
+    [lo, start) aralığı sıralıyken [start, hi) elemanlarını ikili arama ile
+    yerlerine ekler.
+    """
+    for i in range(start, hi):
+        pivot = a[i]
+        left = lo
+        right = i
+        while left < right:
+            mid = (left + right) >> 1
+            if pivot < a[mid]:
+                right = mid
+            else:
+                left = mid + 1
+        if left != i:
+            a[left + 1:i + 1] = a[left:i]
+            a[left] = pivot
+
+
+def _binary_insertion_sort(a, lo, hi, start, states=None):
+    """
+    _binary_insertion_sort_untraced ile aynı işi yapar; her eklemeyi kaydeder.
+    """
+    if states is None:
+        _binary_insertion_sort_untraced(a, lo, hi, start)
+        return
+    for i in range(start, hi):
+        pivot = a[i]
+        left = lo
+        right = i
+        while left < right:
+            mid = (left + right) >> 1
+            if pivot < a[mid]:
+                right = mid
+            else:
+                left = mid + 1
+        if left != i:
+            a[left + 1:i + 1] = a[left:i]
+            a[left] = pivot
+            states.append(a, left, i + 1)
+
+
+def _gallop_left(key, a, base, length, hint):
+    """
+    a[base:base+length] sıralı aralığında key'in en soldaki ekleme konumunu
+    hint'ten başlayan üstel arama ve ardından ikili arama ile bulur.
+
+    Returns:
+        int: a[base+k-1] < key <= a[base+k] olacak şekilde k
+    """
+    last_ofs = 0
+    ofs = 1
+    if a[base + hint] < key:
+        max_ofs = length - hint
+        while ofs < max_ofs and a[base + hint + ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs += hint
+        ofs += hint
+    else:
+        max_ofs = hint + 1
+        while ofs < max_ofs and not a[base + hint - ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+
+    last_ofs += 1
+    while last_ofs < ofs:
+        m = last_ofs + ((ofs - last_ofs) >> 1)
+        if a[base + m] < key:
+            last_ofs = m + 1
+        else:
+            ofs = m
+    return ofs
+
+
+def _gallop_right(key, a, base, length, hint):
+    """
+    _gallop_left ile aynıdır ancak eşit elemanların en sağındaki konumu bulur.
+
+    Returns:
+        int: a[base+k-1] <= key < a[base+k] olacak şekilde k
+    """
+    last_ofs = 0
+    ofs = 1
+    if key < a[base + hint]:
+        max_ofs = hint + 1
+        while ofs < max_ofs and key < a[base + hint - ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+    else:
+        max_ofs = length - hint
+        while ofs < max_ofs and not key < a[base + hint + ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs += hint
+        ofs += hint
+
+    last_ofs += 1
+    while last_ofs < ofs:
+        m = last_ofs + ((ofs - last_ofs) >> 1)
+        if key < a[base + m]:
+            ofs = m
+        else:
+            last_ofs = m + 1
+    return ofs
+
+
+class _MergeState:
+    """
+    Tek bir TimSort çağrısının durumunu tutar: sıralanan dizi, bekleyen run
+    yığını ve uyarlanabilir galop eşiği.
+    """
+
+    def __init__(self, a, states=None):
+        self.a = a
+        self.states = states
+        self.min_gallop = _MIN_GALLOP
+        self.run_base = []
+        self.run_len = []
+
+    def push_run(self, base, length):
+        self.run_base.append(base)
+        self.run_len.append(length)
+
+    def merge_collapse(self):
+        """
+        Yığın değişmezleri sağlanana kadar run'ları birleştirir:
+
+            run_len[i - 2] > run_len[i - 1] + run_len[i]
+            run_len[i - 1] > run_len[i]
+
+        Değişmez yığının en üstteki dört run'ı için kontrol edilir; bu sayede
+        yığın uzunluğu O(log n) ile sınırlı kalır.
+        """
+        run_len = self.run_len
+        while len(run_len) > 1:
+            n = len(run_len) - 2
+            if ((n > 0 and run_len[n - 1] <= run_len[n] + run_len[n + 1])
+                    or (n > 1 and run_len[n - 2] <= run_len[n] + run_len[n - 1])):
+                if run_len[n - 1] < run_len[n + 1]:
+                    n -= 1
+            elif run_len[n] > run_len[n + 1]:
+                break
+            self.merge_at(n)
+
+    def merge_force_collapse(self):
+        """
+        Yığında tek run kalana kadar tüm run'ları birleştirir.
+        """
+        run_len = self.run_len
+        while len(run_len) > 1:
+            n = len(run_len) - 2
+            if n > 0 and run_len[n - 1] < run_len[n + 1]:
+                n -= 1
+            self.merge_at(n)
+
+    def merge_at(self, i):
+        """
+        Yığındaki i ve i+1 numaralı run'ları birleştirir.
+        """
+        a = self.a
+        base1 = self.run_base[i]
+        len1 = self.run_len[i]
+        base2 = self.run_base[i + 1]
+        len2 = self.run_len[i + 1]
+
+        self.run_len[i] = len1 + len2
+        del self.run_base[i + 1]
+        del self.run_len[i + 1]
+
+        # İkinci run'ın ilk elemanından küçük/eşit olan baştaki elemanlar
+        # zaten yerinde
+        k = _gallop_right(a[base2], a, base1, len1, 0)
+        base1 += k
+        len1 -= k
+        if len1 == 0:
+            return
+
+        # Birinci run'ın son elemanından büyük olan sondaki elemanlar da
+        # zaten yerinde
+        len2 = _gallop_left(a[base1 + len1 - 1], a, base2, len2, len2 - 1)
+        if len2 == 0:
+            return
+
+        mark_phase(a, "merge", base1, base2 + len2)
+        if len1 <= len2:
+            self.merge_lo(base1, len1, base2, len2)
+        else:
+            self.merge_hi(base1, len1, base2, len2)
+        if self.states is not None:
+            self.states.append(a, base1, base2 + len2)
+
+    def merge_lo(self, base1, len1, base2, len2):
+        """
+        Bitişik iki run'ı soldan sağa birleştirir. len1 <= len2 olmalıdır;
+        geçici tampon yalnızca birinci run için ayrılır.
+        """
+        a = self.a
+        tmp = copy_slice(a, base1, base1 + len1)
+        cursor1 = 0
+        cursor2 = base2
+        dest = base1
+
+        a[dest] = a[cursor2]
+        dest += 1
+        cursor2 += 1
+        len2 -= 1
+        if len2 == 0:
+            a[dest:dest + len1] = tmp
+            return
+        if len1 == 1:
+            a[dest:dest + len2] = a[cursor2:cursor2 + len2]
+            a[dest + len2] = tmp[cursor1]
+            return
+
+        min_gallop = self.min_gallop
+        done = False
+        while not done:
+            count1 = 0
+            count2 = 0
+
+            # Tek tek karşılaştırma modu
+            while True:
+                if a[cursor2] < tmp[cursor1]:
+                    a[dest] = a[cursor2]
+                    dest += 1
+                    cursor2 += 1
+                    count2 += 1
+                    count1 = 0
+                    len2 -= 1
+                    if len2 == 0:
+                        done = True
+                        break
+                else:
+                    a[dest] = tmp[cursor1]
+                    dest += 1
+                    cursor1 += 1
+                    count1 += 1
+                    count2 = 0
+                    len1 -= 1
+                    if len1 == 1:
+                        done = True
+                        break
+                if (count1 | count2) >= min_gallop:
+                    break
+            if done:
+                break
+
+            # Galop modu: run'lardan biri art arda kazanmaya devam ettiği sürece
+            while True:
+                count1 = _gallop_right(a[cursor2], tmp, cursor1, len1, 0)
+                if count1 != 0:
+                    a[dest:dest + count1] = tmp[cursor1:cursor1 + count1]
+                    dest += count1
+                    cursor1 += count1
+                    len1 -= count1
+                    if len1 <= 1:
+                        done = True
+                        break
+                a[dest] = a[cursor2]
+                dest += 1
+                cursor2 += 1
+                len2 -= 1
+                if len2 == 0:
+                    done = True
+                    break
+
+                count2 = _gallop_left(tmp[cursor1], a, cursor2, len2, 0)
+                if count2 != 0:
+                    a[dest:dest + count2] = a[cursor2:cursor2 + count2]
+                    dest += count2
+                    cursor2 += count2
+                    len2 -= count2
+                    if len2 == 0:
+                        done = True
+                        break
+                a[dest] = tmp[cursor1]
+                dest += 1
+                cursor1 += 1
+                len1 -= 1
+                if len1 == 1:
+                    done = True
+                    break
+
+                min_gallop -= 1
+                if count1 < _MIN_GALLOP and count2 < _MIN_GALLOP:
+                    break
+            if done:
+                break
+            # Galop modundan çıkmanın cezası
+            if min_gallop < 0:
+                min_gallop = 0
+            min_gallop += 2
+
+        self.min_gallop = max(1, min_gallop)
+
+        if len1 == 1:
+            a[dest:dest + len2] = a[cursor2:cursor2 + len2]
+            a[dest + len2] = tmp[cursor1]
+        elif len1 == 0:
+            raise ValueError("Karşılaştırma işlemi tutarsız sonuçlar veriyor")
+        else:
+            a[dest:dest + len1] = tmp[cursor1:cursor1 + len1]
+
+    def merge_hi(self, base1, len1, base2, len2):
+        """
+        Bitişik iki run'ı sağdan sola birleştirir. len1 >= len2 olmalıdır;
+        geçici tampon yalnızca ikinci run için ayrılır.
+        """
+        a = self.a
+        tmp = copy_slice(a, base2, base2 + len2)
+        cursor1 = base1 + len1 - 1
+        cursor2 = len2 - 1
+        dest = base2 + len2 - 1
+
+        a[dest] = a[cursor1]
+        dest -= 1
+        cursor1 -= 1
+        len1 -= 1
+        if len1 == 0:
+            a[dest - len2 + 1:dest + 1] = tmp
+            return
+        if len2 == 1:
+            dest -= len1
+            cursor1 -= len1
+            a[dest + 1:dest + 1 + len1] = a[cursor1 + 1:cursor1 + 1 + len1]
+            a[dest] = tmp[cursor2]
+            return
+
+        min_gallop = self.min_gallop
+        done = False
+        while not done:
+            count1 = 0
+            count2 = 0
+
+            # Tek tek karşılaştırma modu
+            while True:
+                if tmp[cursor2] < a[cursor1]:
+                    a[dest] = a[cursor1]
+                    dest -= 1
+                    cursor1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    len1 -= 1
+                    if len1 == 0:
+                        done = True
+                        break
+                else:
+                    a[dest] = tmp[cursor2]
+                    dest -= 1
+                    cursor2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    len2 -= 1
+                    if len2 == 1:
+                        done = True
+                        break
+                if (count1 | count2) >= min_gallop:
+                    break
+            if done:
+                break
+
+            # Galop modu
+            while True:
+                count1 = len1 - _gallop_right(tmp[cursor2], a, base1, len1, len1 - 1)
+                if count1 != 0:
+                    dest -= count1
+                    cursor1 -= count1
+                    len1 -= count1
+                    a[dest + 1:dest + 1 + count1] = a[cursor1 + 1:cursor1 + 1 + count1]
+                    if len1 == 0:
+                        done = True
+                        break
+                a[dest] = tmp[cursor2]
+                dest -= 1
+                cursor2 -= 1
+                len2 -= 1
+                if len2 == 1:
+                    done = True
+                    break
+
+                count2 = len2 - _gallop_left(a[cursor1], tmp, 0, len2, len2 - 1)
+                if count2 != 0:
+                    dest -= count2
+                    cursor2 -= count2
+                    len2 -= count2
+                    a[dest + 1:dest + 1 + count2] = tmp[cursor2 + 1:cursor2 + 1 + count2]
+                    if len2 <= 1:
+                        done = True
+                        break
+                a[dest] = a[cursor1]
+                dest -= 1
+                cursor1 -= 1
+                len1 -= 1
+                if len1 == 0:
+                    done = True
+                    break
+
+                min_gallop -= 1
+                if count1 < _MIN_GALLOP and count2 < _MIN_GALLOP:
+                    break
+            if done:
+                break
+            if min_gallop < 0:
+                min_gallop = 0
+            min_gallop += 2
+
+        self.min_gallop = max(1, min_gallop)
+
+        if len2 == 1:
+            dest -= len1
+            cursor1 -= len1
+            a[dest + 1:dest + 1 + len1] = a[cursor1 + 1:cursor1 + 1 + len1]
+            a[dest] = tmp[cursor2]
+        elif len2 == 0:
+            raise ValueError("Karşılaştırma işlemi tutarsız sonuçlar veriyor")
+        else:
+            a[dest - len2 + 1:dest + 1] = tmp[:len2]
+
+
+def timsort(data, collect_states=False, key=None):
+    """
+    TimSort algoritması ile veriyi yerinde ve kararlı şekilde sıralar.
+
+    Args:
+        data (list veya tampon): Sıralanacak veri
+        collect_states (bool): True ise animasyon için ara durumlar toplanır
+        key (callable, optional): Her elemandan sıralama anahtarı üreten
+            fonksiyon. Anahtarlar eleman başına bir kez hesaplanır.
+
+    Returns:
+        list: Sıralanmış veri; collect_states=True ise (veri, durumlar) ikilisi
+    """
+    if key is not None:
+        return sort_by_key(timsort, data, key, collect_states)
+    if collect_states and is_buffer(data):
+        return sort_with_states(timsort, data)
+
+    a = as_sequence(data)
+    states = Trace(a) if collect_states else None
+    n = len(a)
+
+    if n >= 2:
+        if n < _MIN_MERGE:
+            # Küçük diziler: tek run + ikili InsertionSort, birleştirme yok
+            init_run = _count_run_and_make_ascending(a, 0, n, states)
+            _binary_insertion_sort(a, 0, n, init_run, states)
+        else:
+            ms = _MergeState(a, states)
+            min_run = _compute_minrun(n)
+            lo = 0
+            remaining = n
+            while remaining:
+                run_len = _count_run_and_make_ascending(a, lo, n, states)
+                # Kısa run'ları minrun uzunluğuna tamamla
+                if run_len < min_run:
+                    force = min(remaining, min_run)
+                    _binary_insertion_sort(a, lo, lo + force, lo + run_len, states)
+                    run_len = force
+                ms.push_run(lo, run_len)
+                ms.merge_collapse()
+                lo += run_len
+                remaining -= run_len
+            ms.merge_force_collapse()
+
+    if collect_states:
+        return data, states
+    return data
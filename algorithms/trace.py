@@ -0,0 +1,418 @@
+"""
+İşlem İzi (Trace) Modülü
+
+Bu modül, sıralama algoritmalarının collect_states=True iken topladığı ara
+durumları her adım için verinin tam kopyası yerine sıkışık bir yazım izi
+olarak saklayan Trace sınıfını içerir.
+
+İz, ilk durumun bir NumPy kopyasından ve her adımda değişen konumların
+(indeks, değer) yazımlarından oluşur. Algoritma bir adım kaydederken çalışma
+dizisini kopyalamadan verir ve değişmiş olabilecek bölgeyi (append) ya da
+konumları (append_at, ör. bir takas) bildirir. Yalnızca bu bölge izin tuttuğu
+son durumla karşılaştırılır ve farklı olan konumlar saklanır. Böylece bellek
+kullanımı adım sayısı ile eleman sayısının çarpımıyla değil, toplam yazım
+sayısıyla; kayıt süresi de bildirilen bölgenin boyutuyla orantılıdır.
+
+Trace salt okunur bir dizi (Sequence) gibi davranır: states[i], i. adımdaki
+durumu yazımları yeniden oynatarak Python listesi olarak üretir. Rastgele
+erişim için her K yazımda bir tam durum (anahtar kare) iki boyutlu bir NumPy
+dizisinin satırı olarak saklanır; istenen adımdan önceki en yakın anahtar
+kareden başlanarak en fazla K yazım (ve tek bir adımın yazımları) oynatılır.
+Artan sırada erişimde son üretilen durumdan devam edildiğinden tüm adımları
+sırayla gezmek toplam yazım sayısı kadar iş yapar. K varsayılan olarak eleman
+sayısıdır; böylece anahtar karelerin belleği yazımların belleğiyle aynı
+mertebede kalır.
+
+Sayısal izler trace_file modülüyle ikili dosyaya yazılabilir ve dosyadan bellek
+eşlemeli (np.memmap) olarak belleğe yüklenmeden okunabilir.
+
+Değerler sayısal ise NumPy'nin sayısal türüyle, değilse (nesneler, metinler,
+karışık türler) nesne dizisi olarak saklanır; nesne dizilerinde yeniden
+oluşturulan durumlar özgün nesneleri içerir. Değişiklik == ile belirlenir;
+eşit sayılan farklı nesneler arasındaki yer değişimi kaydedilmez.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+
+import numpy as np
+
+# Yazım dizilerinin başlangıç kapasitesi; dolunca ikiye katlanır
+_INITIAL_CAPACITY = 1024
+
+# Küçük verilerde anahtar karelerin çok sık alınmaması için en küçük aralık
+_MIN_KEYFRAME_INTERVAL = 1024
+
+# Liste elemanlarının Python türü ve kayıpsız karşılık gelen NumPy tür sınıfları
+_KINDS = {int: "iu", float: "f", bool: "b"}
+
+
+def _index_dtype(n):
+    """
+    n elemanlık veri için en küçük uygun indeks türü.
+    """
+    return np.int32 if n <= np.iinfo(np.int32).max else np.int64
+
+
+def _value_dtype(state):
+    """
+    Durum değerlerini kayıpsız saklayabilecek NumPy türünü belirler.
+
+    Tamponlar kendi türleriyle saklanır. Listeler yalnızca tüm elemanlar aynı
+    türden int, float ya da bool ise sayısal türle saklanır; aksi halde (ör.
+    int ve float karışık) değerlerin türü değişmesin diye nesne türü kullanılır.
+    """
+    if isinstance(state, np.ndarray):
+        return state.dtype
+    if not isinstance(state, list):
+        return np.asarray(state).dtype
+    types = {type(x) for x in state}
+    if len(types) == 1 and types <= set(_KINDS):
+        try:
+            dtype = np.asarray(state).dtype
+        except OverflowError:
+            dtype = None
+        # int64 aralığı dışındaki tam sayılar float64'e yuvarlanır
+        if dtype is not None and dtype.kind in _KINDS[types.pop()]:
+            return dtype
+    return np.dtype(object)
+
+
+def _to_array(state, dtype):
+    """
+    Durumu verilen türde tek boyutlu bir NumPy dizisine çevirir.
+    """
+    if isinstance(state, np.ndarray) and state.dtype == dtype:
+        return state.ravel()
+    if dtype == object:
+        # Eşit uzunluklu demetler iki boyutlu diziye çevrilmesin diye tek tek
+        return np.fromiter(state, dtype=object, count=len(state))
+    return np.asarray(state, dtype=dtype).ravel()
+
+
+class Trace(Sequence):
+    """
+    Ara durumları ilk durum ve adım başına (indeks, değer) yazımları olarak
+    saklayan iz.
+
+    Yazımlar tüm adımlar için tek bir indeks dizisinde ve tek bir değer
+    dizisinde art arda tutulur; her adımın yazımlarının nerede bittiği ayrı bir
+    sınır dizisinde saklanır. Böylece adım başına ek yük yalnızca bir sınırdır.
+    İlk durum 0. anahtar karedir.
+
+    Args:
+        initial (list veya tampon): İlk durum; kopyalanır
+        keyframe_interval (int, optional): Anahtar kareler arasındaki en az
+            yazım sayısı (K). Varsayılan eleman sayısı (en az 1024).
+    """
+
+    def __init__(self, initial, keyframe_interval=None):
+        self.dtype = _value_dtype(initial)
+        first = _to_array(initial, self.dtype)
+        n = first.size
+        self.keyframe_interval = max(1, keyframe_interval or max(n, _MIN_KEYFRAME_INTERVAL))
+        # Anahtar kareler satır satır; k. satır _keyframe_steps[k]. adımın durumu
+        self._keyframes = np.empty((1, n), dtype=self.dtype)
+        self._keyframes[0] = first
+        self._keyframe_steps = array("q", [0])
+        index_dtype = _index_dtype(n)
+        self._event_index = np.empty(_INITIAL_CAPACITY, dtype=index_dtype)
+        self._event_value = np.empty(_INITIAL_CAPACITY, dtype=self.dtype)
+        self._event_count = 0
+        # k. adımın yazımları [_bounds[k], _bounds[k + 1]) aralığındadır
+        self._bounds = array("q", [0, 0])
+        # İzin kaydettiği son durum; yeni adımlar bununla karşılaştırılır
+        self._last = first.copy()
+        # Son üretilen durum ve adımı; artan sırada erişimde buradan devam edilir
+        self._cursor = 0
+        self._cursor_state = None
+
+    @classmethod
+    def from_states(cls, states, keyframe_interval=None):
+        """
+        Tam durum listesinden iz oluşturur.
+
+        Args:
+            states (list): Durumların listesi (en az bir durum)
+            keyframe_interval (int, optional): Anahtar kare aralığı
+
+        Returns:
+            Trace: Aynı durumları üreten iz
+        """
+        if isinstance(states, Trace):
+            return states
+        trace = cls(states[0], keyframe_interval)
+        for state in states[1:]:
+            trace.append(state)
+        return trace
+
+    @classmethod
+    def _from_arrays(cls, keyframes, keyframe_steps, event_index, event_value, bounds,
+                     keyframe_interval):
+        """
+        Hazır dizilerden salt okunur bir iz oluşturur (ör. dosyadan okunan).
+
+        Diziler kopyalanmaz; bellek eşlemeli diziler ya da satır ve dilim
+        erişimini destekleyen nesneler olabilir. Böyle bir ize yeni adım
+        eklenemez.
+        """
+        trace = cls.__new__(cls)
+        trace.dtype = event_value.dtype
+        trace.keyframe_interval = keyframe_interval
+        trace._keyframes = keyframes
+        trace._keyframe_steps = keyframe_steps
+        trace._event_index = event_index
+        trace._event_value = event_value
+        trace._event_count = event_value.size
+        trace._bounds = bounds
+        trace._last = None
+        trace._cursor = 0
+        trace._cursor_state = None
+        return trace
+
+    @property
+    def size(self):
+        """
+        int: Durum başına eleman sayısı
+        """
+        return self._keyframes.shape[1]
+
+    @property
+    def event_count(self):
+        """
+        int: Tüm adımlardaki toplam yazım sayısı
+        """
+        return self._event_count
+
+    @property
+    def keyframe_count(self):
+        """
+        int: İlk durum dahil saklanan anahtar kare sayısı
+        """
+        return len(self._keyframe_steps)
+
+    @property
+    def nbytes(self):
+        """
+        int: İzin sakladığı dizilerin toplam bayt sayısı (nesne dizilerinde
+        yalnızca işaretçiler)
+        """
+        last = 0 if self._last is None else self._last.nbytes
+        return (self._keyframes.nbytes + last + self._event_index.nbytes
+                + self._event_value.nbytes + self._bounds.itemsize * len(self._bounds))
+
+    def _check_writable(self):
+        """
+        İze yeni adım eklenebildiğini denetler.
+
+        Raises:
+            TypeError: İz dosyadan okunduysa (salt okunur)
+        """
+        if self._last is None:
+            raise TypeError("Dosyadan okunan izlere adım eklenemez")
+
+    def _reserve(self, count):
+        """
+        Yazım dizilerinde count yeni yazımlık yer açar; gerekirse kapasite
+        ikiye katlanır.
+        """
+        need = self._event_count + count
+        if need > self._event_index.size:
+            capacity = max(need, 2 * self._event_index.size)
+            self._event_index = np.resize(self._event_index, capacity)
+            self._event_value = np.resize(self._event_value, capacity)
+
+    def _record_region(self, state, lo, hi):
+        """
+        state[lo:hi] bölgesinde son durumdan farklı olan konumları yazım
+        dizilerine ekler.
+        """
+        self._check_writable()
+        if hi is None:
+            hi = self._last.size
+        region = state if lo == 0 and hi == len(state) else state[lo:hi]
+        current = _to_array(region, self.dtype)
+        changed = np.flatnonzero(current != self._last[lo:hi])
+        count = changed.size
+        if count:
+            self._reserve(count)
+            end = self._event_count + count
+            values = current[changed]
+            changed += lo
+            self._event_index[self._event_count:end] = changed
+            self._event_value[self._event_count:end] = values
+            self._last[changed] = values
+            self._event_count = end
+
+    def append(self, state, lo=0, hi=None):
+        """
+        Yeni bir adım kaydeder; değişen konumlar vektörel karşılaştırmayla
+        bulunur.
+
+        Args:
+            state (list veya tampon): Algoritmanın o anki çalışma dizisi;
+                kopyalanmaz, yalnızca [lo, hi) bölgesi okunur
+            lo (int): Değişmiş olabilecek bölgenin başlangıcı
+            hi (int, optional): Değişmiş olabilecek bölgenin sonu. Verilmezse
+                dizinin sonu. Bölge dışındaki konumların değişmediği kabul edilir.
+        """
+        self._record_region(state, lo, hi)
+        self._end_step()
+
+    def amend(self, state, lo=0, hi=None):
+        """
+        Son kaydedilen adıma [lo, hi) bölgesindeki değişiklikleri ekler. Bir
+        adımda birbirinden uzak iki bölge değiştiğinde append ile birlikte
+        kullanılır.
+
+        Args:
+            state (list veya tampon): Algoritmanın o anki çalışma dizisi
+            lo (int): Değişmiş olabilecek bölgenin başlangıcı
+            hi (int, optional): Değişmiş olabilecek bölgenin sonu
+
+        Raises:
+            IndexError: Henüz ilk durumdan sonra bir adım kaydedilmemişse
+            TypeError: İz dosyadan okunduysa
+        """
+        if len(self) < 2:
+            raise IndexError("İlk durum değiştirilemez; önce bir adım kaydedilmelidir")
+        self._record_region(state, lo, hi)
+        self._bounds[-1] = self._event_count
+        if self._keyframe_steps[-1] == len(self) - 1:
+            # Son adımın anahtar karesi alınmışsa güncel tutulur
+            self._keyframes[len(self._keyframe_steps) - 1] = self._last
+
+    def append_at(self, state, *positions):
+        """
+        Yalnızca verilen konumların değişmiş olabileceği yeni bir adım kaydeder
+        (ör. bir takas). Konum başına sabit iş yapılır.
+
+        Args:
+            state (list veya tampon): Algoritmanın o anki çalışma dizisi
+            *positions (int): Değişmiş olabilecek konumlar
+
+        Raises:
+            TypeError: İz dosyadan okunduysa
+        """
+        self._check_writable()
+        self._reserve(len(positions))
+        last = self._last
+        k = self._event_count
+        for p in positions:
+            x = state[p]
+            if x != last[p]:
+                last[p] = x
+                self._event_index[k] = p
+                self._event_value[k] = x
+                k += 1
+        self._event_count = k
+        self._end_step()
+
+    def _end_step(self):
+        """
+        Adımı kapatır; son anahtar kareden bu yana en az K yazım yapıldıysa
+        yeni bir anahtar kare alır.
+        """
+        self._bounds.append(self._event_count)
+        since = self._event_count - self._bounds[self._keyframe_steps[-1] + 1]
+        if since >= self.keyframe_interval:
+            count = len(self._keyframe_steps)
+            if count == self._keyframes.shape[0]:
+                grown = np.empty((2 * count, self.size), dtype=self.dtype)
+                grown[:count] = self._keyframes
+                self._keyframes = grown
+            self._keyframes[count] = self._last
+            self._keyframe_steps.append(len(self) - 1)
+
+    def events(self, step):
+        """
+        Bir adımdaki yazımları döndürür.
+
+        Args:
+            step (int): Adım indeksi; 0. adımın yazımı yoktur
+
+        Returns:
+            tuple: (indeksler, değerler) NumPy dizileri
+        """
+        step = range(len(self))[step]
+        lo, hi = self._bounds[step], self._bounds[step + 1]
+        return self._event_index[lo:hi], self._event_value[lo:hi]
+
+    def changes(self, step):
+        """
+        Bir adımda değişen eleman sayısını döndürür.
+        """
+        step = range(len(self))[step]
+        return self._bounds[step + 1] - self._bounds[step]
+
+    def map(self, func):
+        """
+        Her değere func uygulanmış yeni bir iz döndürür. Yazımların konumları
+        aynı kalır.
+
+        Args:
+            func (callable): Bir değerden yeni değeri üreten fonksiyon
+
+        Returns:
+            Trace: Dönüştürülmüş iz
+        """
+        keyframes = [[func(x) for x in self._keyframes[k].tolist()] for k in range(self.keyframe_count)]
+        mapped = Trace(keyframes[0], self.keyframe_interval)
+        mapped._keyframes = np.empty((len(keyframes), self.size), dtype=mapped.dtype)
+        for row, keyframe in zip(mapped._keyframes, keyframes):
+            row[:] = _to_array(keyframe, mapped.dtype)
+        mapped._keyframe_steps = array("q", self._keyframe_steps)
+        values = [func(x) for x in self._event_value[:self._event_count].tolist()]
+        mapped._event_index = self._event_index[:self._event_count].copy()
+        mapped._event_value = _to_array(values, mapped.dtype)
+        mapped._event_count = self._event_count
+        mapped._bounds = array("q", self._bounds)
+        mapped._last = mapped.state(-1).copy()
+        return mapped
+
+    def _replay(self, state, start, stop):
+        """
+        start ile stop adımları arasındaki (start hariç) yazımları state
+        üzerine uygular. Bir konuma birden çok yazım varsa sonuncusu geçerlidir.
+        """
+        lo, hi = self._bounds[start + 1], self._bounds[stop + 1]
+        if lo == hi:
+            return
+        # Sondan başa bakıldığında her konumun ilk görülen yazımı en sonuncusudur
+        indices = self._event_index[lo:hi][::-1]
+        positions, first = np.unique(indices, return_index=True)
+        state[positions] = self._event_value[lo:hi][::-1][first]
+
+    def state(self, step):
+        """
+        Bir adımdaki durumu, önceki en yakın anahtar kareden (ya da daha
+        yakınsa son üretilen durumdan) yazımları yeniden oynatarak üretir.
+
+        Args:
+            step (int): Adım indeksi; negatif indeksler sondan sayılır
+
+        Returns:
+            np.ndarray: Durum; iz tarafından yeniden kullanıldığından
+            değiştirilmemeli ya da saklanacaksa kopyalanmalıdır
+        """
+        step = range(len(self))[step]
+        k = bisect_right(self._keyframe_steps, step) - 1
+        base = self._keyframe_steps[k]
+        if self._cursor_state is None:
+            self._cursor_state = self._keyframes[k].copy()
+            self._cursor = base
+        elif not base <= self._cursor <= step:
+            self._cursor_state[:] = self._keyframes[k]
+            self._cursor = base
+        self._replay(self._cursor_state, self._cursor, step)
+        self._cursor = step
+        return self._cursor_state
+
+    def __len__(self):
+        return len(self._bounds) - 1
+
+    def __getitem__(self, step):
+        if isinstance(step, slice):
+            return [self[i] for i in range(len(self))[step]]
+        return self.state(step).tolist()
@@ -0,0 +1,281 @@
+"""
+İz Dosyası Modülü
+
+Bu modül, sayısal Trace izlerini ikili bir dosyaya yazan ve dosyadan bellek
+eşlemeli (np.memmap) olarak okuyan fonksiyonları içerir. Büyük girdilerin izi
+bir kez kaydedilip Animasyonlar sekmesinde belleğe yüklenmeden defalarca
+oynatılabilir.
+
+Dosya düzeni (küçük endian):
+
+- Başlık: sihirli sayı, sürüm, bayraklar, eleman / adım / yazım / anahtar
+  kare sayıları, anahtar kare aralığı, blok boyutu, değer ve indeks türleri ve
+  bölümlerin dosya içindeki konumları (_HEADER)
+- Adım sınırları: int64, adım sayısı + 1
+- Anahtar kare adımları: int64, anahtar kare sayısı
+- Anahtar kareler: anahtar kare sayısı x eleman sayısı değer
+- Yazımlar: (index, value) alanlı paketlenmiş yapı dizisi
+
+Bölümler 64 baytlık sınırlara hizalanır. Sıkıştırma istenirse anahtar kareler
+satır başına, yazımlar block_events yazımlık bloklar halinde zlib ile
+sıkıştırılır; her bölümün ardından blokların başlangıçlarını tutan bir int64
+tablo yazılır. Sıkıştırılmış dosyalar da bellek eşlemeli okunur; yalnızca
+erişilen bloklar açılır ve son açılan birkaç blok önbellekte tutulur.
+
+Nesne türündeki izler (metinler, karışık türler) dosyaya yazılamaz.
+"""
+
+import struct
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+from .trace import Trace
+
+_MAGIC = b"SATRACE\0"
+_VERSION = 1
+
+# Bayraklar
+_COMPRESSED = 1
+
+# sihirli sayı, sürüm, bayraklar, eleman, adım, yazım, anahtar kare sayıları,
+# anahtar kare aralığı, blok boyutu, değer türü, indeks türü, bölüm konumları
+# (sınırlar, anahtar kare adımları, anahtar kareler, anahtar kare tablosu,
+# yazımlar, yazım tablosu)
+_HEADER = struct.Struct("<8sHH4x6q16s16s6q")
+
+# Bölümlerin hizalandığı bayt sınırı
+_ALIGNMENT = 64
+
+# Sıkıştırmada blok başına varsayılan yazım sayısı
+_BLOCK_EVENTS = 1 << 16
+
+# Okurken önbellekte tutulan açılmış blok sayısı
+_CACHED_BLOCKS = 8
+
+
+def _event_dtype(index_dtype, value_dtype):
+    """
+    Yazım kaydının paketlenmiş (hizalamasız) yapı türü.
+    """
+    return np.dtype([("index", index_dtype), ("value", value_dtype)])
+
+
+def _align(f):
+    """
+    Dosyayı sıfırlarla bir sonraki hizalama sınırına kadar doldurur ve konumu
+    döndürür.
+    """
+    pos = f.tell()
+    pad = -pos % _ALIGNMENT
+    f.write(b"\0" * pad)
+    return pos + pad
+
+
+def _write_blocks(f, blocks, level):
+    """
+    Blokları zlib ile sıkıştırarak yazar, ardından blok başlangıçlarının
+    tablosunu ekler.
+
+    Returns:
+        tuple: (ilk bloğun konumu, tablonun konumu)
+    """
+    start = _align(f)
+    offsets = [0]
+    for block in blocks:
+        payload = zlib.compress(block.tobytes(), level)
+        f.write(payload)
+        offsets.append(offsets[-1] + len(payload))
+    table = _align(f)
+    np.asarray(offsets, dtype="<i8").tofile(f)
+    return start, table
+
+
+def _event_blocks(trace, dtype, block_events):
+    """
+    Yazımları block_events kayıtlık yapı dizileri olarak üretir.
+    """
+    for lo in range(0, trace.event_count, block_events):
+        hi = min(lo + block_events, trace.event_count)
+        records = np.empty(hi - lo, dtype=dtype)
+        records["index"] = trace._event_index[lo:hi]
+        records["value"] = trace._event_value[lo:hi]
+        yield records
+
+
+def save_trace(trace, path, compress=False, block_events=_BLOCK_EVENTS, level=6):
+    """
+    İzi ikili iz dosyasına yazar.
+
+    Yazımlar block_events kayıtlık parçalar halinde yazıldığından dosyadan
+    okunmuş bir iz de belleğe yüklenmeden yeniden (ör. sıkıştırılarak)
+    kaydedilebilir.
+
+    Args:
+        trace (Trace): Kaydedilecek iz
+        path (str): Dosya yolu
+        compress (bool): True ise anahtar kareler ve yazımlar zlib ile blok
+            blok sıkıştırılır
+        block_events (int): Blok başına yazım sayısı
+        level (int): zlib sıkıştırma düzeyi (1-9)
+
+    Raises:
+        TypeError: İz nesne türündeyse
+    """
+    if trace.dtype == object:
+        raise TypeError("Nesne türündeki izler dosyaya yazılamaz")
+    block_events = max(1, block_events)
+    dtype = _event_dtype(trace._event_index.dtype, trace.dtype)
+    keyframes = (trace._keyframes[k] for k in range(trace.keyframe_count))
+
+    with open(path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        bounds_at = _align(f)
+        np.asarray(trace._bounds, dtype="<i8").tofile(f)
+        steps_at = _align(f)
+        np.asarray(trace._keyframe_steps, dtype="<i8").tofile(f)
+
+        if compress:
+            keyframes_at, keyframe_table_at = _write_blocks(f, keyframes, level)
+            events_at, event_table_at = _write_blocks(
+                f, _event_blocks(trace, dtype, block_events), level)
+        else:
+            keyframes_at = _align(f)
+            for row in keyframes:
+                np.asarray(row).tofile(f)
+            events_at = _align(f)
+            for records in _event_blocks(trace, dtype, block_events):
+                records.tofile(f)
+            keyframe_table_at = event_table_at = 0
+
+        f.seek(0)
+        f.write(_HEADER.pack(
+            _MAGIC, _VERSION, _COMPRESSED if compress else 0,
+            trace.size, len(trace), trace.event_count, trace.keyframe_count,
+            trace.keyframe_interval, block_events if compress else 0,
+            trace.dtype.str.encode(), trace._event_index.dtype.str.encode(),
+            bounds_at, steps_at, keyframes_at, keyframe_table_at, events_at, event_table_at,
+        ))
+
+
+class _Blocks:
+    """
+    Bellek eşlemeli dosyadaki zlib bloklarını isteğe bağlı açar.
+    """
+
+    def __init__(self, mapped, start, table_at, count, dtype):
+        self._mapped = mapped
+        self._start = start
+        self._table = _view(mapped, table_at, "<i8", (count + 1,))
+        self._dtype = dtype
+        self.block = lru_cache(maxsize=_CACHED_BLOCKS)(self._decompress)
+
+    def _decompress(self, b):
+        lo = self._start + int(self._table[b])
+        hi = self._start + int(self._table[b + 1])
+        return np.frombuffer(zlib.decompress(self._mapped[lo:hi]), dtype=self._dtype)
+
+
+class _CompressedRows:
+    """
+    Sıkıştırılmış anahtar kareleri satır satır açan salt okunur dizi.
+    """
+
+    def __init__(self, blocks, count, n, dtype):
+        self._blocks = blocks
+        self.shape = (count, n)
+        self.dtype = dtype
+        self.nbytes = count * n * dtype.itemsize
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, k):
+        return self._blocks.block(range(self.shape[0])[k])
+
+
+class _CompressedColumn:
+    """
+    Sıkıştırılmış yazım bloklarının bir alanını dilim diliminde açan salt
+    okunur dizi.
+    """
+
+    def __init__(self, blocks, field, count, block_events, dtype):
+        self._blocks = blocks
+        self._field = field
+        self._block_events = block_events
+        self.size = count
+        self.dtype = dtype
+        self.nbytes = count * dtype.itemsize
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        lo, hi, stride = index.indices(self.size)
+        if lo >= hi:
+            return np.empty(0, dtype=self.dtype)
+        first = lo // self._block_events
+        last = (hi - 1) // self._block_events
+        parts = [self._blocks.block(b)[self._field] for b in range(first, last + 1)]
+        values = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        offset = first * self._block_events
+        return values[lo - offset:hi - offset:stride]
+
+
+def _view(mapped, offset, dtype, shape):
+    """
+    Bellek eşlemeli dosyanın bir bölümünü kopyalamadan verilen tür ve
+    biçimde gösterir.
+    """
+    dtype = np.dtype(dtype)
+    size = dtype.itemsize * int(np.prod(shape))
+    return mapped[offset:offset + size].view(dtype).reshape(shape)
+
+
+def load_trace(path):
+    """
+    İz dosyasını bellek eşlemeli olarak açar.
+
+    Veri belleğe yüklenmez; durumlar istendikçe dosyadan okunur. Dönen iz salt
+    okunurdur.
+
+    Args:
+        path (str): Dosya yolu
+
+    Returns:
+        Trace: Dosyadaki iz
+
+    Raises:
+        ValueError: Dosya bir iz dosyası değilse ya da sürümü desteklenmiyorsa
+    """
+    mapped = np.memmap(path, dtype=np.uint8, mode="r")
+    if mapped.size < _HEADER.size:
+        raise ValueError(f"{path} bir iz dosyası değil")
+    (magic, version, flags, n, steps, events, keyframes, interval, block_events,
+     value_dtype, index_dtype, bounds_at, steps_at, keyframes_at, keyframe_table_at,
+     events_at, event_table_at) = _HEADER.unpack(mapped[:_HEADER.size].tobytes())
+    if magic != _MAGIC:
+        raise ValueError(f"{path} bir iz dosyası değil")
+    if version != _VERSION:
+        raise ValueError(f"Desteklenmeyen iz dosyası sürümü: {version}")
+    value_dtype = np.dtype(value_dtype.rstrip(b"\0").decode())
+    index_dtype = np.dtype(index_dtype.rstrip(b"\0").decode())
+    dtype = _event_dtype(index_dtype, value_dtype)
+
+    bounds = _view(mapped, bounds_at, "<i8", (steps + 1,))
+    keyframe_steps = _view(mapped, steps_at, "<i8", (keyframes,))
+    if flags & _COMPRESSED:
+        rows = _Blocks(mapped, keyframes_at, keyframe_table_at, keyframes, value_dtype)
+        keyframe_rows = _CompressedRows(rows, keyframes, n, value_dtype)
+        blocks = _Blocks(mapped, events_at, event_table_at, -(-events // block_events), dtype)
+        event_index = _CompressedColumn(blocks, "index", events, block_events, index_dtype)
+        event_value = _CompressedColumn(blocks, "value", events, block_events, value_dtype)
+    else:
+        keyframe_rows = _view(mapped, keyframes_at, value_dtype, (keyframes, n))
+        records = _view(mapped, events_at, dtype, (events,))
+        event_index = records["index"]
+        event_value = records["value"]
+    return Trace._from_arrays(keyframe_rows, keyframe_steps, event_index, event_value,
+                              bounds, interval)
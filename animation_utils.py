@@ -11,7 +11,23 @@ from plotly.subplots import make_subplots
 import numpy as np
 import pandas as pd
 import time
-from typing import List, Dict, Tuple, Any, Optional, Union
+import functools
+import hashlib
+import inspect
+import os
+from typing import List, Dict, Tuple, Any, Optional, Sequence, Union
+
+import algorithms
+from algorithms.trace import Trace
+from algorithms.trace_file import load_trace, save_trace
+
+# Kaydedilen izlerin tutulduğu dizin; aynı algoritma ve veri için iz bir kez
+# kaydedilip sonraki gösterimlerde dosyadan bellek eşlemeli okunur
+TRACE_CACHE_DIR = os.path.join("results", "traces")
+
+# İz önbelleğinin sınırları; aşılınca en uzun süredir kullanılmayan izler silinir
+TRACE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+TRACE_CACHE_MAX_FILES = 64
 
 # Tutarlı renk şeması - Algoritma renklerini burada tanımlayalım (app.py ile uyumlu olması için)
 ALGORITHM_COLORS = {
@@ -20,13 +36,19 @@ ALGORITHM_COLORS = {
     "RadixSort": "#00C853",
     "Cache-Oblivious": "#2196F3",
     "Adaptive MergeSort": "#FF9800",
-    "SmoothSort": "#9c27b0"
+    "SmoothSort": "#9c27b0",
+    "Parallel SampleSort": "#00BCD4",
+    "PdqSort": "#FFC107",
+    "BlockQuicksort": "#607D8B",
+    "Block MergeSort": "#8BC34A",
+    "Auto": "#FF5722",
+    "Threaded Sort": "#795548"
 }
 
 # Varsayılan renk seti
 DEFAULT_COLORS = px.colors.qualitative.Plotly
 
-def create_sorting_animation_plotly(algo_name: str, data: List[int], states: List[List[int]], 
+def create_sorting_animation_plotly(algo_name: str, data: List[int], states: Sequence[List[int]], 
                                    speed_factor: int = 1) -> Tuple[go.Figure, int]:
     """
     Plotly ile sıralama animasyonu oluşturur.
@@ -34,7 +56,7 @@ def create_sorting_animation_plotly(algo_name: str, data: List[int], states: Lis
     Args:
         algo_name: Algoritma adı
         data: Başlangıç verileri
-        states: Algoritmanın ara durumlarının listesi
+        states: Algoritmanın ara durumları (liste ya da Trace)
         speed_factor: Animasyon hızı çarpanı (1-100 arası değer)
         
     Returns:
@@ -212,37 +234,144 @@ def calculate_animation_duration(speed_factor: int) -> int:
     # 1-100 aralığındaki hız değerini 500-50 aralığındaki süreye dönüştür
     return 500 - ((speed_factor - 1) * 450 // 99)
 
-def sample_states(states: List[List[int]], max_states: int = 100) -> List[List[int]]:
+def sample_states(states: Sequence[List[int]], max_states: int = 100) -> List[List[int]]:
     """
     Çok uzun durum listelerini daha yönetilebilir bir boyuta örnekler.
     Bu, animasyon performansını iyileştirir.
     
     Args:
-        states: Tüm algoritmik durumlar listesi
+        states: Tüm algoritmik durumlar (liste ya da Trace)
         max_states: Maksimum durum sayısı (varsayılan: 100)
         
     Returns:
         List[List[int]]: Örneklenmiş durumlar
     """
+    # Durumlar artan sırada okunur; Trace bu sayede yazımları bir kez oynatır
     if len(states) <= max_states:
-        return states
+        return list(states)
+    
+    step = len(states) // max_states
     
     # İlk ve son durumu her zaman dahil et, aradakileri örnekle
-    if len(states) > max_states:
-        step = len(states) // max_states
-        
-        # İlk ve son durumu ve önemli ara durumları seç
-        sampled = [states[0]]  # Her zaman ilk durumu al
-        
-        # Ara durumlar için örnekleme yap
-        indices = list(range(1, len(states) - 1, step))
-        sampled.extend([states[i] for i in indices])
-        
-        if indices and indices[-1] < len(states) - 1:
-            sampled.append(states[-1])  # Son durumu ekle
-        
-        return sampled
+    indices = [0] + list(range(1, len(states) - 1, step))
+    if indices[-1] < len(states) - 1:
+        indices.append(len(states) - 1)
+    
+    return [states[i] for i in indices]
+
+@functools.lru_cache(maxsize=32)
+def _hash_files(stamps: Tuple[Tuple[str, int, int], ...]) -> str:
+    """
+    Dosyaların içeriğinden özet üretir. (yol, değişme zamanı, boyut)
+    üçlüleriyle önbelleklenir; dosyalar değişince yeniden okunur.
+    """
+    digest = hashlib.sha1()
+    for path, _, _ in stamps:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def _engine_version(algo_func: callable) -> str:
+    """
+    Algoritmayı ve kodunun sürümünü tanımlayan metin döndürür.
     
+    functools.partial ile sarılmış fonksiyonlar açılır, bağlı argümanlar
+    metne eklenir. Sürüm, algorithms paketinin ve fonksiyonun tanımlandığı
+    modülün kaynak dosyalarının içeriğinden türetilir; motorlardan biri
+    değişince eski izler kullanılmaz.
+    """
+    bound = []
+    while isinstance(algo_func, functools.partial):
+        bound.append(repr((algo_func.args, sorted(algo_func.keywords.items()))))
+        algo_func = algo_func.func
+    name = getattr(algo_func, "__qualname__", type(algo_func).__qualname__)
+    
+    package_dir = os.path.dirname(algorithms.__file__)
+    paths = {os.path.join(package_dir, f) for f in os.listdir(package_dir) if f.endswith((".py", ".pyc"))}
+    module_file = getattr(inspect.getmodule(algo_func), "__file__", None)
+    if module_file:
+        paths.add(module_file)
+    stamps = []
+    for path in sorted(paths):
+        st = os.stat(path)
+        stamps.append((path, st.st_mtime_ns, st.st_size))
+    return f"{getattr(algo_func, '__module__', None)}.{name}{''.join(bound)}@{_hash_files(tuple(stamps))}"
+
+def _evict_traces(cache_dir: str, keep: str, max_bytes: int, max_files: int) -> None:
+    """
+    Önbellek sınırları aşıldıysa en uzun süredir kullanılmayan iz dosyalarını
+    siler; keep dosyası silinmez.
+    """
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(".trace"):
+            path = os.path.join(cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    count = len(entries)
+    for _, size, path in entries:
+        if total <= max_bytes and count <= max_files:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            # Başka bir süreçte açık (ör. Windows'ta bellek eşlemeli) dosyalar atlanır
+            continue
+        total -= size
+        count -= 1
+
+def record_trace(algo_func: callable, data: List[int],
+                 cache_dir: Optional[str] = TRACE_CACHE_DIR,
+                 max_bytes: int = TRACE_CACHE_MAX_BYTES,
+                 max_files: int = TRACE_CACHE_MAX_FILES) -> Sequence[List[int]]:
+    """
+    Algoritmanın veri üzerindeki izini döndürür; iz daha önce kaydedildiyse
+    algoritma çalıştırılmadan dosyadan okunur.
+    
+    İz dosyasının adı algoritmadan, algoritma kodunun sürümünden ve veriden
+    türetilir. Önbellek max_bytes ya da max_files sınırını aşınca en uzun
+    süredir kullanılmayan izler silinir.
+    
+    Args:
+        algo_func: Sıralama algoritması fonksiyonu (functools.partial olabilir)
+        data: Başlangıç verileri (değiştirilmez)
+        cache_dir: İz dosyalarının dizini; None ise önbellek kullanılmaz
+        max_bytes: Önbellekteki iz dosyalarının toplam boyut sınırı
+        max_files: Önbellekteki iz dosyası sayısı sınırı
+        
+    Returns:
+        Sequence[List[int]]: Algoritmanın ara durumları (Trace)
+    """
+    values = np.asarray(data)
+    if cache_dir is None or values.dtype == object:
+        return algo_func(list(data), collect_states=True)[1]
+    
+    digest = hashlib.sha1(f"{_engine_version(algo_func)}:{values.dtype.str}".encode())
+    digest.update(values.tobytes())
+    path = os.path.join(cache_dir, digest.hexdigest() + ".trace")
+    if os.path.exists(path):
+        try:
+            # Kullanım zamanı silme sırasını belirler
+            os.utime(path)
+        except OSError:
+            pass
+        return load_trace(path)
+    
+    states = algo_func(list(data), collect_states=True)[1]
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        save_trace(states, path, compress=True)
+        _evict_traces(cache_dir, path, max_bytes, max_files)
+    except (OSError, TypeError):
+        # Yazılamayan dizin ya da nesne türündeki iz: iz yalnızca bellekte kullanılır
+        pass
     return states
 
 def create_sorting_animation_comparison(algorithms: Dict[str, callable], data: List[int], 
@@ -398,13 +527,13 @@ def create_sorting_animation_comparison(algorithms: Dict[str, callable], data: L
     
     return fig
 
-def create_algorithm_step_visualization(states: List[List[int]], step_idx: int, 
+def create_algorithm_step_visualization(states: Sequence[List[int]], step_idx: int, 
                                       title: str) -> go.Figure:
     """
     Algoritmanın belirli bir adımını görselleştirir.
     
     Args:
-        states: Algoritmanın ara durumlarının listesi
+        states: Algoritmanın ara durumları (liste ya da Trace)
         step_idx: Görselleştirilecek adım indeksi
         title: Grafik başlığı
         
@@ -435,18 +564,21 @@ def create_algorithm_step_visualization(states: List[List[int]], step_idx: int,
     
     return fig
 
-def get_algorithm_statistics(states: List[List[int]]) -> Dict[str, Any]:
+def get_algorithm_statistics(states: Sequence[List[int]]) -> Dict[str, Any]:
     """
     Algoritmanın istatistiklerini hesaplar.
     
     Args:
-        states: Algoritmanın ara durumlarının listesi
+        states: Algoritmanın ara durumları (liste ya da Trace)
         
     Returns:
         dict: İstatistikler (adım sayısı, yer değiştirme sayısı, doğru sıralanmış mı)
     """
+    # Değişimler izin adım başına yazımlarından okunur; durumlar yeniden oluşturulmaz
+    trace = Trace.from_states(states)
+    
     # Adım sayısı
-    step_count = len(states)
+    step_count = len(trace)
     
     # Yer değiştirme sayısı
     swap_count = 0
@@ -455,15 +587,9 @@ def get_algorithm_statistics(states: List[List[int]]) -> Dict[str, Any]:
     comparison_count = 0
     
     # Ara durumlar arasındaki değişimleri say
-    for i in range(1, len(states)):
-        prev_state = states[i-1]
-        curr_state = states[i]
-        
-        # İki durum arasında değişen eleman sayısını say
-        changes_in_step = 0
-        for j in range(min(len(prev_state), len(curr_state))):
-            if prev_state[j] != curr_state[j]:
-                changes_in_step += 1
+    for i in range(1, step_count):
+        # İki durum arasında değişen eleman sayısı
+        changes_in_step = trace.changes(i)
         
         swap_count += changes_in_step
         
@@ -472,15 +598,15 @@ def get_algorithm_statistics(states: List[List[int]]) -> Dict[str, Any]:
         comparison_count += max(1, changes_in_step * 2)
     
     # İlk ve son durumu kontrol et
-    initial_state = states[0]
-    final_state = states[-1]
+    initial_state = trace[0]
+    final_state = trace[-1]
     sorted_correctly = sorted(initial_state) == final_state
     
     # Sıralama süresi analizi (varsayılan değerler, gerçek süre ölçümü için kullanılmaz)
     time_complexity = "O(n log n)"  # varsayılan
-    if step_count < len(states[0]):
+    if step_count < trace.size:
         time_complexity = "O(n)" # Çok hızlı sıralama
-    elif step_count > len(states[0]) * len(states[0]):
+    elif step_count > trace.size * trace.size:
         time_complexity = "O(n²)" # Yavaş sıralama
     
     return {
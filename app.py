@@ -38,10 +38,17 @@ from algorithms.radixsort import radixsort
 from algorithms.cache_oblivious import cache_oblivious_sort
 from algorithms.adaptive_mergesort import adaptive_mergesort
 from algorithms.smoothsort import smoothsort
+from algorithms.parallel_samplesort import parallel_samplesort
+from algorithms.pdqsort import pdqsort
+from algorithms.block_quicksort import block_quicksort
+from algorithms.block_mergesort import block_mergesort
+from algorithms.auto_sort import auto_sort
+from algorithms.threaded_sort import threaded_sort
 
 # Yardımcı fonksiyonları import et
 from utils.data_generator import generate_random_data, generate_nearly_sorted_data
 from utils.metrics import measure_time, measure_memory, measure_comparisons
+from utils.presortedness import presortedness_summary
 from utils.visualizer import create_comparison_chart, create_bar_chart, create_comparison_chart_melted
 
 # Veri tipi bilgileri
@@ -155,6 +162,96 @@ ALGORITHM_INFO = {
         "yaratıcı": "Edsger Dijkstra",
         "ikon": "🧩",
         "plot_color": "#9c27b0"
+    },
+    "Parallel SampleSort": {
+        "func": parallel_samplesort,
+        "description": "Örnekleme ile seçilen ayırıcılara göre veriyi kovalara böler ve her kovayı ayrı bir işlemci çekirdeğinde sıralar. Veri süreçler arasında paylaşılan bellek üzerinden taşınır.",
+        "best_case": "O(n log n / p)",
+        "avg_case": "O(n log n / p)",
+        "worst_case": "O(n log n)",
+        "adım_sayısı": "Düşük",
+        "bellek_kullanımı": "Orta",
+        "kararlılık": "Kararsız",
+        "özellik": "Paralel",
+        "yıl": "1970",
+        "yaratıcı": "Frazer ve McKellar",
+        "ikon": "🖥️",
+        "plot_color": "#00BCD4"
+    },
+    "PdqSort": {
+        "func": pdqsort,
+        "description": "IntroSort'un desenlere dayanıklı modern sürümüdür. Tekrar eden anahtarları tek bölümlemede ayıklar, sıralı aralıkları erkenden tanır ve dengesiz bölümlemelerde deseni bozarak en kötü durumu HeapSort ile sınırlar.",
+        "best_case": "O(n)",
+        "avg_case": "O(n log n)",
+        "worst_case": "O(n log n)",
+        "adım_sayısı": "Düşük",
+        "bellek_kullanımı": "Düşük",
+        "kararlılık": "Kararsız",
+        "özellik": "Hibrit",
+        "yıl": "2016",
+        "yaratıcı": "Orson Peters",
+        "ikon": "🛡️",
+        "plot_color": "#FFC107"
+    },
+    "BlockQuicksort": {
+        "func": block_quicksort,
+        "description": "Bölümlemeyi iki uçtan alınan sabit boyutlu bloklar üzerinde yapar. Yanlış taraftaki elemanlar eleman başına dallanma yerine vektörel maskelerle bulunur ve toplu olarak takas edilir.",
+        "best_case": "O(n log n)",
+        "avg_case": "O(n log n)",
+        "worst_case": "O(n log n)",
+        "adım_sayısı": "Düşük",
+        "bellek_kullanımı": "Düşük",
+        "kararlılık": "Kararsız",
+        "özellik": "Vektörel",
+        "yıl": "2016",
+        "yaratıcı": "Stefan Edelkamp ve Armin Weiß",
+        "ikon": "🧱",
+        "plot_color": "#607D8B"
+    },
+    "Block MergeSort": {
+        "func": block_mergesort,
+        "description": "Yardımcı tamponu girdinin kendisinden toplanan benzersiz anahtarlardan oluşturur. Run'ları bloklara ayırıp etiketleyerek ve rotasyonlarla birleştirir; ek bellek kullanmadan kararlı sıralama yapar.",
+        "best_case": "O(n)",
+        "avg_case": "O(n log n)",
+        "worst_case": "O(n log n)",
+        "adım_sayısı": "Orta-Yüksek",
+        "bellek_kullanımı": "Çok Düşük",
+        "kararlılık": "Kararlı",
+        "özellik": "Yerinde",
+        "yıl": "2008",
+        "yaratıcı": "Pok-Son Kim ve Arne Kutzner",
+        "ikon": "🔗",
+        "plot_color": "#8BC34A"
+    },
+    "Auto": {
+        "func": auto_sort,
+        "description": "Her çağrıda verinin küçük bir örneğinden run uzunluğunu, ters çevrim oranını, anahtar aralığını ve farklı değer oranını tahmin eder; buna göre RadixSort, TimSort, Adaptive MergeSort, PdqSort ya da IntroSort'u seçer.",
+        "best_case": "O(n)",
+        "avg_case": "O(n log n)",
+        "worst_case": "O(n log n)",
+        "adım_sayısı": "Düşük",
+        "bellek_kullanımı": "Duruma göre",
+        "kararlılık": "Duruma göre",
+        "özellik": "Uyarlanabilir",
+        "yıl": "2026",
+        "yaratıcı": "Proje ekibi",
+        "ikon": "🎯",
+        "plot_color": "#FF5722"
+    },
+    "Threaded Sort": {
+        "func": threaded_sort,
+        "description": "Sayısal diziyi çekirdek başına parçalara bölüp parçaları bir iş parçacığı havuzunda GIL'i bırakan NumPy çekirdekleriyle eşzamanlı sıralar; ardından parçaları np.searchsorted ile merge path bölmelerine ayrılan paralel bir birleştirme ağacıyla birleştirir.",
+        "best_case": "O(n log n / p)",
+        "avg_case": "O(n log n / p + n log p)",
+        "worst_case": "O(n log n)",
+        "adım_sayısı": "Düşük",
+        "bellek_kullanımı": "O(n)",
+        "kararlılık": "Kararsız",
+        "özellik": "Paralel",
+        "yıl": "2026",
+        "yaratıcı": "Proje ekibi",
+        "ikon": "🧵",
+        "plot_color": "#795548"
     }
 }
 
@@ -208,9 +305,11 @@ def run_performance_analysis(data, selected_algos):
             )
             results.append(perf)
     
-    # Sonuçları DataFrame'e dönüştür
+    # Sonuçları DataFrame'e dönüştür; girdinin ön sıralılık ölçüleri
+    # (inversions, runs, rem, max_displacement) veri kümesi başına bir kez
+    # hesaplanıp her satıra eklenir
     if results:
-        return pd.DataFrame(results).set_index("algorithm")
+        return pd.DataFrame(results).set_index("algorithm").assign(**presortedness_summary(data))
     else:
         return pd.DataFrame()
 
@@ -241,6 +340,11 @@ def load_app_styles():
         --algo-cache-oblivious: #2196F3;
         --algo-adaptive-mergesort: #FF9800;
         --algo-smoothsort: #9c27b0;
+        --algo-parallel-samplesort: #00BCD4;
+        --algo-pdqsort: #FFC107;
+        --algo-blockquicksort: #607D8B;
+        --algo-block-mergesort: #8BC34A;
+        --algo-auto: #FF5722;
         
         /* Vurgu Renkleri */
         --accent1: #3399FF;
@@ -726,7 +830,13 @@ def load_app_styles():
     .animation-card.radixsort::before,
     .animation-card.cache-oblivious::before,
     .animation-card.adaptive-mergesort::before,
-    .animation-card.smoothsort::before {
+    .animation-card.smoothsort::before,
+    .animation-card.parallel-samplesort::before,
+    .animation-card.pdqsort::before,
+    .animation-card.blockquicksort::before,
+    .animation-card.block-mergesort::before,
+    .animation-card.auto::before,
+    .animation-card.threaded-sort::before {
         content: "";
         position: absolute;
         top: 0;
@@ -760,6 +870,26 @@ def load_app_styles():
         background: var(--algo-smoothsort);
     }
     
+    .animation-card.parallel-samplesort::before {
+        background: var(--algo-parallel-samplesort);
+    }
+    
+    .animation-card.pdqsort::before {
+        background: var(--algo-pdqsort);
+    }
+    
+    .animation-card.blockquicksort::before {
+        background: var(--algo-blockquicksort);
+    }
+    
+    .animation-card.block-mergesort::before {
+        background: var(--algo-block-mergesort);
+    }
+    
+    .animation-card.auto::before {
+        background: var(--algo-auto);
+    }
+    
     /* Kart Başlığı */
     .card-header {
         display: flex;
@@ -1274,6 +1404,16 @@ with tab4:
             with col1:
                 st.write(f"**İlk 10 eleman:**")
                 st.json(data[:10])
+                
+                # Ön sıralılık ölçüleri
+                measures = presortedness_summary(data)
+                st.markdown(f"""
+                **Ön sıralılık ölçüleri:**
+                - Ters çevrim: {measures['inversions']:,}
+                - Run sayısı: {measures['runs']:,}
+                - Rem (LIS dışı): {measures['rem']:,}
+                - En büyük yer değiştirme: {measures['max_displacement']:,}
+                """)
             
             with col2:
                 # Veri dağılımını göster - Tema renklerine uyumlu
@@ -17,5 +17,5 @@ setup(
         "numpy>=1.20.0",
         "matplotlib>=3.5.0",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
 )
\ No newline at end of file
@@ -0,0 +1,923 @@
+"""
+Sıralama algoritmaları için testler.
+"""
+
+import random
+
+import pytest
+
+from algorithms import (
+    timsort,
+    introsort,
+    radixsort,
+    cache_oblivious_sort,
+    adaptive_mergesort,
+    smoothsort,
+    pdqsort,
+    block_quicksort,
+    block_mergesort,
+    auto_sort,
+    parallel_samplesort,
+    threaded_sort,
+    external_sort,
+    segmented_sort,
+    partial_sort,
+    nth_element,
+    argsort,
+    iter_events,
+)
+from algorithms.events import Compare, Phase, Swap, Write
+from algorithms.trace import Trace
+from algorithms.trace_file import load_trace, save_trace
+from utils.data_generator import (
+    generate_random_data,
+    generate_nearly_sorted_data,
+    generate_sorted_data,
+    generate_reverse_sorted_data,
+)
+from utils.presortedness import (
+    count_inversions,
+    count_rem,
+    count_runs,
+    max_displacement,
+    presortedness_summary,
+)
+
+ALGORITHMS = [timsort, introsort, radixsort, cache_oblivious_sort, adaptive_mergesort, smoothsort,
+              pdqsort, block_quicksort, block_mergesort, auto_sort]
+STABLE_ALGORITHMS = [timsort, cache_oblivious_sort, adaptive_mergesort, block_mergesort]
+GENERATORS = [
+    generate_random_data,
+    generate_nearly_sorted_data,
+    generate_sorted_data,
+    generate_reverse_sorted_data,
+    lambda size: [7] * size,
+]
+SIZES = [0, 1, 2, 3, 15, 16, 17, 31, 32, 33, 100, 1000, 5000]
+
+
+class Record:
+    """Yalnızca anahtara göre karşılaştırılan, kararlılık testi için kayıt."""
+
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("generator", GENERATORS)
+@pytest.mark.parametrize("size", SIZES)
+def test_sorts_in_place(algorithm, generator, size):
+    data = generator(size)
+    expected = sorted(data)
+    result = algorithm(data)
+    assert result is data
+    assert data == expected
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_collect_states(algorithm):
+    data = generate_random_data(200)
+    original = data[:]
+    result, states = algorithm(data, collect_states=True)
+    assert result == sorted(original)
+    assert states[0] == original
+    assert states[-1] == result
+
+
+@pytest.mark.parametrize("algorithm", STABLE_ALGORITHMS)
+@pytest.mark.parametrize("size", [10, 100, 3000])
+def test_stability(algorithm, size):
+    records = [Record(random.randint(0, 10), i) for i in range(size)]
+    algorithm(records)
+    assert [(r.key, r.tag) for r in records] == sorted((r.key, r.tag) for r in records)
+
+
+def test_radixsort_negative_and_large_values():
+    data = [random.randint(-2 ** 62, 2 ** 62) for _ in range(5000)]
+    expected = sorted(data)
+    assert radixsort(data) == expected
+
+
+def test_radixsort_numpy_in_place():
+    np = pytest.importorskip("numpy")
+    arr = np.random.default_rng(0).integers(-1000, 1000, size=10000)
+    expected = np.sort(arr)
+    assert radixsort(arr) is arr
+    assert (arr == expected).all()
+
+
+def test_radixsort_rejects_non_integers():
+    with pytest.raises(TypeError):
+        radixsort([1.5, 0.5])
+
+
+@pytest.mark.parametrize("base_case_size", [1, 2, 8, 64])
+def test_cache_oblivious_base_case_size(base_case_size):
+    data = generate_random_data(2000)
+    expected = sorted(data)
+    assert cache_oblivious_sort(data, base_case_size=base_case_size) == expected
+
+
+@pytest.mark.parametrize("data", [
+    list(range(2000)) + list(range(2000, 0, -1)),
+    [i % 5 for i in range(3000)],
+    list(range(1500, 3000)) + list(range(1500)),
+    [i ^ 0x55 for i in range(4096)],
+])
+def test_pdqsort_patterns(data):
+    expected = sorted(data)
+    assert pdqsort(data) == expected
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 64, 1024])
+@pytest.mark.parametrize("size", [300, 5000])
+def test_block_quicksort_block_size(block_size, size):
+    data = generate_random_data(size) + [7] * size
+    expected = sorted(data)
+    assert block_quicksort(data, block_size=block_size) == expected
+
+
+def test_block_quicksort_numpy_in_place():
+    np = pytest.importorskip("numpy")
+    arr = np.random.default_rng(0).random(100000)
+    expected = np.sort(arr)
+    assert block_quicksort(arr) is arr
+    assert (arr == expected).all()
+
+
+@pytest.mark.parametrize("distinct", [1, 3, 40, 10 ** 9])
+@pytest.mark.parametrize("size", [17, 1000, 20000])
+def test_block_mergesort_stability_with_few_keys(distinct, size):
+    # Az sayıda benzersiz değer tamponu küçültür ve rotasyonlu birleştirmeye düşürür
+    records = [Record(random.randint(0, distinct), i) for i in range(size)]
+    block_mergesort(records)
+    assert [(r.key, r.tag) for r in records] == sorted((r.key, r.tag) for r in records)
+
+
+def test_block_mergesort_constant_memory():
+    import tracemalloc
+    data = generate_random_data(20000)
+    tracemalloc.start()
+    block_mergesort(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < 16 * 1024
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("size", [0, 1, 100, 70000])
+def test_parallel_samplesort(workers, size):
+    data = generate_random_data(size)
+    expected = sorted(data)
+    assert parallel_samplesort(data, workers=workers) == expected
+
+
+def test_parallel_samplesort_numpy_in_place():
+    np = pytest.importorskip("numpy")
+    arr = np.random.default_rng(0).random(100000)
+    expected = np.sort(arr)
+    assert parallel_samplesort(arr, workers=2) is arr
+    assert (arr == expected).all()
+
+
+def test_parallel_samplesort_shuts_down_replaced_executor():
+    import sys
+    module = sys.modules["algorithms.parallel_samplesort"]
+    first = module._get_executor(1)
+    second = module._get_executor(2)
+    assert first is not second
+    # Kapatılmış havuz yeni iş kabul etmez
+    with pytest.raises(RuntimeError):
+        first.submit(int)
+    module._shutdown_executor()
+    with pytest.raises(RuntimeError):
+        second.submit(int)
+    assert module._executor is None
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 8])
+@pytest.mark.parametrize("size", [0, 1, 100, 70000])
+def test_threaded_sort(workers, size):
+    data = generate_random_data(size)
+    expected = sorted(data)
+    assert threaded_sort(data, workers=workers) == expected
+
+
+def test_threaded_sort_numpy_in_place():
+    np = pytest.importorskip("numpy")
+    arr = np.random.default_rng(0).integers(0, 50, size=100000)
+    expected = np.sort(arr)
+    assert threaded_sort(arr, workers=4) is arr
+    assert (arr == expected).all()
+
+
+def test_threaded_sort_states_follow_merge_levels():
+    data = generate_random_data(70000)
+    result, states = threaded_sort(data[:], collect_states=True, workers=4)
+    assert states[0] == data and states[-1] == sorted(data) == result
+    # Başlangıç, parça sıralaması ve iki birleştirme seviyesi
+    assert len(states) == 4
+
+
+def test_threaded_sort_rejects_non_numeric():
+    with pytest.raises(TypeError):
+        threaded_sort(["b", "a"])
+
+
+@pytest.mark.parametrize("algorithm", [None, timsort, introsort])
+def test_external_sort(tmp_path, algorithm):
+    np = pytest.importorskip("numpy")
+    values = np.random.default_rng(0).integers(-10 ** 9, 10 ** 9, size=50000)
+    input_path = tmp_path / "input.bin"
+    output_path = tmp_path / "output.bin"
+    values.tofile(input_path)
+
+    # 16 KB bütçe: çok sayıda run ve birden fazla birleştirme geçişi
+    count = external_sort(str(input_path), str(output_path), algorithm=algorithm,
+                          memory_budget=16 * 1024, temp_dir=str(tmp_path))
+
+    assert count == values.size
+    assert (np.fromfile(output_path, dtype="int64") == np.sort(values)).all()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["input.bin", "output.bin"]
+
+
+@pytest.mark.parametrize("algorithm", [None, radixsort, timsort, adaptive_mergesort])
+@pytest.mark.parametrize("dtype", ["int64", "int32", "float64"])
+def test_external_sort_peak_memory_within_budget(tmp_path, algorithm, dtype):
+    import tracemalloc
+    np = pytest.importorskip("numpy")
+    if algorithm is radixsort and dtype == "float64":
+        pytest.skip("radixsort yalnızca tam sayıları sıralar")
+    budget = 64 * 1024
+    values = (np.random.default_rng(1).random(30000) * 10 ** 6).astype(dtype)
+    input_path = tmp_path / "input.bin"
+    output_path = tmp_path / "output.bin"
+    values.tofile(input_path)
+    # İlk çağrıdaki tembel içe aktarmalar ölçüme karışmasın
+    external_sort(str(input_path), str(output_path), algorithm=algorithm,
+                  memory_budget=budget, dtype=dtype, temp_dir=str(tmp_path))
+
+    tracemalloc.start()
+    try:
+        external_sort(str(input_path), str(output_path), algorithm=algorithm,
+                      memory_budget=budget, dtype=dtype, temp_dir=str(tmp_path))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < budget
+    assert (np.fromfile(output_path, dtype=dtype) == np.sort(values)).all()
+
+
+@pytest.mark.parametrize("algorithm", [timsort, introsort, radixsort, cache_oblivious_sort,
+                                       adaptive_mergesort, smoothsort, pdqsort, block_mergesort])
+def test_key_computed_once_and_stable(algorithm):
+    records = [{"id": i, "score": random.randint(0, 20)} for i in range(500)]
+    expected = sorted(records, key=lambda r: r["score"])
+    calls = []
+
+    def key(record):
+        calls.append(record["id"])
+        return record["score"]
+
+    assert algorithm(records, key=key) is records
+    assert records == expected
+    assert sorted(calls) == list(range(500))
+
+
+@pytest.mark.parametrize("algorithm", [timsort, introsort, radixsort, smoothsort])
+def test_key_collect_states(algorithm):
+    data = [str(x) for x in generate_random_data(100)]
+    original = data[:]
+    result, states = algorithm(data, collect_states=True, key=int)
+    assert result == sorted(original, key=int)
+    assert states[0] == original
+    assert states[-1] == result
+
+
+@pytest.mark.parametrize("kind", ["int", "float", "str"])
+@pytest.mark.parametrize("threshold", [1, 64, 4096])
+def test_segmented_sort(kind, threshold):
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    lengths = rng.integers(0, 300, size=200)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    values = rng.integers(-10 ** 12, 10 ** 12, size=offsets[-1])
+    if kind == "float":
+        values = values / 7.0
+    elif kind == "str":
+        values = values.astype(str)
+    expected = values.copy()
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        expected[start:end].sort()
+    assert segmented_sort(values, offsets, small_segment_threshold=threshold) is values
+    assert (values == expected).all()
+
+
+def test_segmented_sort_list_and_partial_offsets():
+    data = [9, 8, 7, 3, 1, 2, 6, 5, 4]
+    assert segmented_sort(data, [1, 3, 6]) == [9, 7, 8, 1, 2, 3, 6, 5, 4]
+
+
+@pytest.mark.parametrize("offsets", [[], [0, 5, 3], [-1, 2], [0, 10]])
+def test_segmented_sort_rejects_invalid_offsets(offsets):
+    with pytest.raises(ValueError):
+        segmented_sort([3, 2, 1, 0, 5], offsets)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS + [parallel_samplesort, threaded_sort])
+@pytest.mark.parametrize("k", [0, 1, 10, 999, 1000, 5000])
+def test_partial_sort(algorithm, k):
+    data = [random.randint(0, 100) for _ in range(1000)]
+    expected = sorted(data)
+    assert partial_sort(data, k, algorithm=algorithm) is data
+    assert data[:k] == expected[:k]
+    assert sorted(data) == expected
+
+
+@pytest.mark.parametrize("algorithm", STABLE_ALGORITHMS)
+def test_partial_sort_stability(algorithm):
+    records = [Record(random.randint(0, 10), i) for i in range(2000)]
+    expected = sorted((r.key, r.tag) for r in records)[:150]
+    partial_sort(records, 150, algorithm=algorithm)
+    assert [(r.key, r.tag) for r in records[:150]] == expected
+
+
+@pytest.mark.parametrize("size", [1, 16, 17, 1000])
+def test_nth_element(size):
+    data = generate_random_data(size)
+    expected = sorted(data)
+    for k in {0, size // 2, size - 1}:
+        nth_element(data, k)
+        assert data[k] == expected[k]
+        assert all(x <= data[k] for x in data[:k])
+        assert all(data[k] <= x for x in data[k + 1:])
+
+
+def test_nth_element_rejects_out_of_range():
+    with pytest.raises(IndexError):
+        nth_element([1, 2, 3], 3)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS + [parallel_samplesort, threaded_sort])
+@pytest.mark.parametrize("size", [0, 1, 17, 3000])
+def test_argsort_does_not_move_data(algorithm, size):
+    np = pytest.importorskip("numpy")
+    data = [random.randint(-20, 20) for _ in range(size)]
+    original = data[:]
+    perm = argsort(data, algorithm=algorithm)
+    assert data == original
+    assert perm.dtype == np.int32
+    assert perm.tolist() == sorted(range(size), key=data.__getitem__)
+
+
+@pytest.mark.parametrize("algorithm", [block_quicksort, parallel_samplesort, threaded_sort, radixsort])
+def test_argsort_numeric_engines_on_wide_values(algorithm):
+    np = pytest.importorskip("numpy")
+    data = np.random.default_rng(0).integers(-2 ** 62, 2 ** 62, size=5000)
+    data[::3] = 42
+    assert (argsort(data, algorithm=algorithm) == np.argsort(data, kind="stable")).all()
+
+
+@pytest.mark.parametrize("algorithm", STABLE_ALGORITHMS)
+def test_argsort_stability(algorithm):
+    records = [Record(random.randint(0, 10), i) for i in range(1000)]
+    perm = argsort(records, algorithm=algorithm)
+    assert [(records[i].key, records[i].tag) for i in perm] == sorted((r.key, r.tag) for r in records)
+
+
+def test_argsort_key():
+    records = [{"id": i, "score": random.randint(0, 5)} for i in range(300)]
+    expected = sorted(range(300), key=lambda i: records[i]["score"])
+    assert argsort(records, algorithm=radixsort, key=lambda r: r["score"]).tolist() == expected
+    assert argsort(records, algorithm=introsort, key=lambda r: r["score"]).tolist() == expected
+
+
+@pytest.mark.parametrize("data, expected", [
+    ([x / 3 for x in range(1000)], timsort),
+    ([x / 3 for x in range(1000, 0, -1)], timsort),
+    (sorted(random.random() for _ in range(500)) + sorted(random.random() for _ in range(500)),
+     adaptive_mergesort),
+    ([random.random() for _ in range(1000)], introsort),
+    ([random.choice("abc") for _ in range(1000)], pdqsort),
+    (generate_random_data(1000), radixsort),
+    (generate_random_data(5000, 0, 30000), radixsort),
+    ([random.randint(-2 ** 40, 2 ** 40) for _ in range(1000)], introsort),
+    (list(range(1000)), timsort),
+    (list(range(1000, 0, -1)), timsort),
+    ([i % 250 for i in range(1000)], adaptive_mergesort),
+    ([str(x) for x in range(20)], timsort),
+])
+def test_auto_sort_dispatch(data, expected):
+    from algorithms.auto_sort import choose_algorithm
+    assert choose_algorithm(data) is expected
+
+
+def test_auto_sort_falls_back_when_sample_misses_non_integers():
+    data = generate_random_data(5000)
+    data[1234] = 0.5
+    expected = sorted(data)
+    assert auto_sort(data) == expected
+
+
+@pytest.mark.parametrize("algorithm", [introsort, pdqsort])
+@pytest.mark.parametrize("cardinality", [1, 5, 1000])
+def test_low_cardinality_counting_path(algorithm, cardinality):
+    data = [random.randrange(cardinality) for _ in range(20000)]
+    expected = sorted(data)
+    assert algorithm(data) == expected
+
+
+@pytest.mark.parametrize("algorithm", [introsort, pdqsort])
+def test_counting_path_keeps_original_objects(algorithm):
+    # 1, 1.0 ve True eşittir; sayma sıralaması birini diğerine dönüştürmemelidir
+    data = [random.choice([1, 1.0, True, 0, 2.5]) for _ in range(5000)]
+    result = algorithm(data[:])
+    assert result == sorted(data)
+    assert sorted(map(repr, result)) == sorted(map(repr, data))
+
+
+def test_counting_sort_aborts_without_changing_data():
+    from algorithms._counting import counting_sort
+    # Farklı değer sayısı sınırı aşar
+    data = list(range(100, 0, -1))
+    assert counting_sort(data, introsort) is False
+    assert data == list(range(100, 0, -1))
+    # Hashlenemeyen değerler
+    data = [[2], [1]] * 100
+    assert counting_sort(data, introsort) is False
+    assert data == [[2], [1]] * 100
+    # Hashlenemeyen değerler örneklemede de yolu kapatır
+    lists = [[random.randint(0, 3)] for _ in range(5000)]
+    assert introsort(lists[:]) == sorted(lists)
+
+
+def test_introsort_fat_pivot_keeps_equal_records():
+    records = [Record(random.randint(0, 3), i) for i in range(3000)]
+    result = introsort(records[:])
+    assert [r.key for r in result] == sorted(r.key for r in records)
+    assert sorted(r.tag for r in result) == list(range(3000))
+
+
+def _brute_presortedness(a):
+    n = len(a)
+    lis = [1] * n
+    for i in range(n):
+        for j in range(i):
+            if not a[i] < a[j]:
+                lis[i] = max(lis[i], lis[j] + 1)
+    order = sorted(range(n), key=lambda i: a[i])
+    return {
+        "inversions": sum(1 for i in range(n) for j in range(i + 1, n) if a[j] < a[i]),
+        "runs": sum(1 for i in range(1, n) if a[i] < a[i - 1]) + 1 if n else 0,
+        "rem": n - max(lis, default=0),
+        "max_displacement": max((abs(p - i) for p, i in enumerate(order)), default=0),
+    }
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 17, 64, 100])
+@pytest.mark.parametrize("distinct", [2, 1000])
+def test_presortedness_matches_brute_force(size, distinct):
+    data = [random.randint(0, distinct) for _ in range(size)]
+    expected = _brute_presortedness(data)
+    assert presortedness_summary(data) == expected
+    assert presortedness_summary([str(x) for x in data]) == _brute_presortedness([str(x) for x in data])
+    assert count_inversions(data) == expected["inversions"]
+    assert count_runs(data) == expected["runs"]
+    assert count_rem(data) == expected["rem"]
+    assert max_displacement(data) == expected["max_displacement"]
+
+
+def test_presortedness_extremes():
+    n = 5000
+    assert presortedness_summary(list(range(n))) == {
+        "inversions": 0, "runs": 1, "rem": 0, "max_displacement": 0,
+    }
+    assert presortedness_summary(list(range(n, 0, -1))) == {
+        "inversions": n * (n - 1) // 2, "runs": n, "rem": n - 1, "max_displacement": n - 1,
+    }
+
+
+def test_presortedness_ranks_once_and_rejects_nested_lists(monkeypatch):
+    import utils.presortedness as presortedness
+    calls = []
+    ranks = presortedness._stable_ranks
+    monkeypatch.setattr(presortedness, "_stable_ranks", lambda data: calls.append(1) or ranks(data))
+    assert presortedness.presortedness_summary([3, 1, 2])["rem"] == 1
+    assert len(calls) == 1
+    for data in ([(3, 1), (1, 2)], [[1], [2, 3]]):
+        with pytest.raises(TypeError):
+            presortedness_summary(data)
+
+
+def _buffers(values):
+    import array
+    np = pytest.importorskip("numpy")
+    return [
+        np.array(values, dtype=np.int64),
+        array.array("q", values),
+        memoryview(array.array("q", values)),
+        np.array(values, dtype=np.int64).reshape(2, -1),
+    ]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS + [parallel_samplesort, threaded_sort])
+@pytest.mark.parametrize("index", range(4))
+def test_sorts_buffers_in_place(algorithm, index):
+    values = [random.randint(-10 ** 6, 10 ** 6) for _ in range(3000)]
+    buf = _buffers(values)[index]
+    assert algorithm(buf) is buf
+    assert memoryview(buf).cast("B").cast("q").tolist() == sorted(values)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_buffer_collect_states_and_key(algorithm):
+    import array
+    values = [random.randint(-50, 50) for _ in range(500)]
+    buf = array.array("q", values)
+    result, states = algorithm(buf, collect_states=True)
+    assert result is buf and list(buf) == sorted(values)
+    assert states[0] == values and states[-1] == sorted(values)
+
+    if algorithm not in (block_quicksort,):
+        view = memoryview(array.array("q", values))
+        algorithm(view, key=abs)
+        assert view.tolist() == sorted(values, key=abs)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS + [parallel_samplesort, threaded_sort])
+def test_rejects_read_only_buffers(algorithm):
+    np = pytest.importorskip("numpy")
+    arr = np.arange(100)[::-1].copy()
+    arr.flags.writeable = False
+    with pytest.raises(TypeError):
+        algorithm(arr)
+
+
+@pytest.mark.parametrize("data", [[(3, 1), (1, 2), (2, 0)], [[1], [2, 3]]])
+def test_radixsort_rejects_nested_lists(data):
+    original = list(data)
+    with pytest.raises(TypeError):
+        radixsort(data)
+    assert data == original
+    with pytest.raises(TypeError):
+        radixsort([3, 1, 2], key=lambda x: (x, x))
+
+
+@pytest.mark.parametrize("data", [[2**63 + 5, 2**63 + 6, 1], [2**53 + 1, 0.5]])
+def test_block_quicksort_rejects_lossy_conversion(data):
+    with pytest.raises(TypeError):
+        block_quicksort(list(data))
+    assert block_quicksort([2.5, -1, 3, 2**53]) == [-1, 2.5, 3, 2**53]
+
+
+@pytest.mark.parametrize("data", [[(3, 1), (1, 2), (2, 0)], [2**63 + 5, 2**63 + 6, 1], [2**53 + 1, 0.5]])
+def test_parallel_samplesort_rejects_unconvertible_lists(data):
+    original = list(data)
+    with pytest.raises(TypeError):
+        parallel_samplesort(data)
+    assert data == original
+
+
+def test_threaded_sort_rejects_unconvertible_lists():
+    with pytest.raises(TypeError):
+        threaded_sort([2**53 + 1, 0.5])
+    with pytest.raises(TypeError):
+        threaded_sort([(3, 1), (1, 2), (2, 0)])
+    assert threaded_sort([2**53, 0.5]) == [0.5, 2**53]
+
+
+def test_metrics_accept_buffers():
+    import array
+    from utils.metrics import measure_comparisons, measure_memory, measure_time
+    values = [random.random() for _ in range(1000)]
+    for buf in (array.array("d", values), memoryview(array.array("d", values))):
+        assert measure_time(timsort, buf) >= 0
+        assert measure_memory(timsort, buf) >= 0
+        assert measure_comparisons(timsort, buf) > 0
+        assert list(buf) == values
+
+
+def test_trace_reconstructs_every_step():
+    snapshots = [[random.randint(0, 9) for _ in range(50)]]
+    for _ in range(200):
+        state = snapshots[-1][:]
+        for _ in range(random.randint(0, 5)):
+            state[random.randrange(50)] = random.randint(0, 9)
+        snapshots.append(state)
+    trace = Trace.from_states(snapshots)
+    assert len(trace) == len(snapshots)
+    assert list(trace) == snapshots
+    # Geriye doğru rastgele erişim
+    for step in random.sample(range(len(snapshots)), 50):
+        assert trace[step] == snapshots[step]
+    assert trace[-1] == snapshots[-1]
+
+
+def test_trace_hints_and_value_types():
+    data = [3, 1.5, "x", None]
+    trace = Trace(data)
+    data[0], data[1] = data[1], data[0]
+    trace.append_at(data, 0, 1)
+    data[3] = 7
+    trace.append(data, 2, 4)
+    data[2] = 2
+    trace.amend(data, 2, 3)
+    assert trace[1] == [1.5, 3, "x", None]
+    assert trace[2] == [1.5, 3, 2, 7]
+    assert [type(x) for x in trace[2]] == [float, int, int, int]
+    assert [trace.changes(i) for i in range(3)] == [0, 2, 2]
+
+
+@pytest.mark.parametrize("algorithm", [introsort, timsort, smoothsort])
+def test_trace_keeps_integers_beyond_int64(algorithm):
+    data = [2**63 + 5, 1, 3, -2**63 - 7, 2**63 + 6]
+    assert Trace(list(data))[0] == data
+    _, states = algorithm(list(data), collect_states=True)
+    assert states[0] == data
+    assert states[-1] == sorted(data)
+
+
+def test_trace_keyframes_bound_random_seek():
+    data = generate_random_data(2000)
+    _, states = introsort(data, collect_states=True)
+    snapshots = list(states)
+    assert states.keyframe_interval == 2000
+    assert states.keyframe_count >= states.event_count // states.keyframe_interval
+    for step in random.sample(range(len(states)), 200):
+        assert states[step] == snapshots[step]
+
+
+def test_trace_amend_updates_keyframe():
+    data = [0] * 8
+    trace = Trace(data, keyframe_interval=1)
+    data[7] = 1
+    trace.append(data, 7, 8)
+    data[0] = 2
+    trace.amend(data, 0, 1)
+    data[3] = 3
+    trace.append_at(data, 3)
+    assert trace.keyframe_count == 3
+    assert trace[1] == [2, 0, 0, 0, 0, 0, 0, 1]
+    assert trace[0] == [0] * 8
+    assert trace[2] == [2, 0, 0, 3, 0, 0, 0, 1]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS + [parallel_samplesort, threaded_sort])
+def test_trace_is_compact(algorithm):
+    data = generate_random_data(20000)
+    _, states = algorithm(data, collect_states=True)
+    assert isinstance(states, Trace)
+    # Bellek adım sayısıyla değil yazım sayısıyla orantılıdır
+    assert states.nbytes < 32 * (states.event_count + len(states) + len(data))
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS + [parallel_samplesort, threaded_sort])
+def test_trace_ends_in_sorted_state(algorithm):
+    data = generate_random_data(3000, 0, 10 ** 6)
+    result, states = algorithm(data[:], collect_states=True)
+    assert states[0] == data
+    assert states[-1] == result == sorted(data)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_trace_file_round_trip(tmp_path, compress):
+    data = generate_random_data(3000)
+    _, states = introsort(data, collect_states=True)
+    snapshots = list(states)
+    path = tmp_path / "introsort.trace"
+    save_trace(states, path, compress=compress, block_events=256)
+    loaded = load_trace(path)
+    assert len(loaded) == len(states)
+    assert loaded.event_count == states.event_count
+    assert loaded.keyframe_count == states.keyframe_count
+    assert list(loaded) == snapshots
+    for step in random.sample(range(len(snapshots)), 50):
+        assert loaded[step] == snapshots[step]
+        assert loaded.changes(step) == states.changes(step)
+    with pytest.raises(TypeError):
+        loaded.append(data)
+
+
+def test_trace_file_is_memory_mapped_and_compressible(tmp_path):
+    import numpy as np
+    data = generate_random_data(5000)
+    _, states = timsort(data, collect_states=True)
+    raw = tmp_path / "raw.trace"
+    packed = tmp_path / "packed.trace"
+    save_trace(states, raw)
+    save_trace(states, packed, compress=True)
+    values = load_trace(raw)._event_value
+    while not isinstance(values, np.memmap):
+        values = values.base
+        assert values is not None
+    assert packed.stat().st_size < raw.stat().st_size
+    # Sıkıştırılmış dosyadan okunan iz yeniden sıkıştırmasız yazılabilir
+    again = tmp_path / "again.trace"
+    save_trace(load_trace(packed), again)
+    assert list(load_trace(again)) == list(states)
+
+
+def test_trace_file_rejects_other_files(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("[1, 2, 3]" * 20)
+    with pytest.raises(ValueError):
+        load_trace(path)
+    _, states = timsort(["b", "a"], collect_states=True)
+    with pytest.raises(TypeError):
+        save_trace(states, tmp_path / "objects.trace")
+
+
+def test_animation_statistics_from_trace():
+    pytest.importorskip("plotly")
+    from animation_utils import get_algorithm_statistics, sample_states
+    data = generate_random_data(300)
+    _, states = introsort(data[:], collect_states=True)
+    snapshots = list(states)
+    assert get_algorithm_statistics(states) == get_algorithm_statistics(snapshots)
+    assert sample_states(states, 10) == sample_states(snapshots, 10)
+
+
+def _replay_events(data, events):
+    a = list(data)
+    for event in events:
+        if isinstance(event, Swap):
+            a[event.i], a[event.j] = a[event.j], a[event.i]
+        elif isinstance(event, Write):
+            a[event.i] = event.value
+    return a
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS + [parallel_samplesort, threaded_sort])
+@pytest.mark.parametrize("generator", [generate_random_data, generate_reverse_sorted_data])
+def test_iter_events_replay_to_sorted(algorithm, generator):
+    data = generator(3000)
+    original = data[:]
+    events = list(iter_events(data, algorithm, batch_size=100))
+    assert data == original
+    assert _replay_events(original, events) == sorted(original)
+
+
+def test_iter_events_types_and_phases():
+    events = list(iter_events(generate_random_data(500), introsort))
+    assert {Compare, Swap, Write} <= {type(e) for e in events}
+    events = list(iter_events(generate_reverse_sorted_data(500), timsort))
+    assert Phase("run_detected", 0, 500) in events
+    events = list(iter_events(generate_reverse_sorted_data(500), adaptive_mergesort))
+    assert Phase("run_detected", 0, 500) in events
+
+    data = [random.randrange(4) for _ in range(5000)]
+    assert Phase("counting_sort", 0, 5000) in list(iter_events(data, introsort))
+
+    phases = [e.name for e in iter_events(generate_random_data(2000), smoothsort) if isinstance(e, Phase)]
+    assert phases == ["heap_build", "heap_shrink"]
+
+
+def test_iter_events_is_lazy_and_stoppable():
+    events = iter_events(generate_random_data(100000), introsort, batch_size=16)
+    first = [next(events) for _ in range(10)]
+    assert all(isinstance(e, (Compare, Swap, Write, Phase)) for e in first)
+    events.close()
+
+
+def test_iter_events_propagates_errors():
+    with pytest.raises(TypeError):
+        list(iter_events([1.5, "a", 2], block_quicksort))
+
+
+def test_record_trace_reuses_trace_file(tmp_path):
+    pytest.importorskip("plotly")
+    from animation_utils import record_trace
+    data = generate_random_data(500)
+    first = record_trace(pdqsort, data, cache_dir=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
+    second = record_trace(pdqsort, data, cache_dir=str(tmp_path))
+    assert list(second) == list(first)
+    assert second[-1] == sorted(data)
+
+
+TWIN_MODULES = ["introsort", "pdqsort", "timsort", "smoothsort", "adaptive_mergesort"]
+
+
+def _median_first(values):
+    """Ortanca elemanı pivot olarak başa taşır."""
+    values = list(values)
+    m = sorted(range(len(values)), key=values.__getitem__)[len(values) // 2]
+    values[0], values[m] = values[m], values[0]
+    return values
+
+
+def _nearly_sorted(values):
+    values = sorted(values)
+    for i in range(0, len(values) - 1, 97):
+        values[i], values[i + 1] = values[i + 1], values[i]
+    return values
+
+
+# (modül, kayıtlı çekirdek, girdiyi hazırlayan fonksiyon, diziden ek argümanlar,
+# süre karşılaştırmasına uygun mu); O(log n) süren çekirdekler ölçülmez
+TWIN_CASES = [
+    ("introsort", "_partition", _median_first, lambda a: (0, len(a)), True),
+    ("introsort", "_partition3", _median_first, lambda a: (0, len(a)), True),
+    ("introsort", "_insertion_sort", list, lambda a: (0, len(a)), True),
+    ("introsort", "_heapsort", list, lambda a: (0, len(a)), True),
+    ("pdqsort", "_unguarded_insertion_sort", lambda v: [min(v)] + v, lambda a: (1, len(a)), True),
+    ("pdqsort", "_partial_insertion_sort", _nearly_sorted, lambda a: (0, len(a)), True),
+    ("pdqsort", "_partition_right", _median_first, lambda a: (0, len(a)), True),
+    ("pdqsort", "_partition_left", lambda v: [min(v)] * 2 + v, lambda a: (1, len(a)), True),
+    ("timsort", "_binary_insertion_sort", lambda v: sorted(v[:32]) + v[32:], lambda a: (0, len(a), 32), True),
+    ("smoothsort", "_sift", list, lambda a: (15, 1972), False),
+    ("smoothsort", "_trinkle", lambda v: v[:12], lambda a: (0b101, 2, 11, False), False),
+    ("smoothsort", "_smoothsort", list, lambda a: (), True),
+    ("adaptive_mergesort", "_detect_runs", list, lambda a: (len(a),), True),
+    ("adaptive_mergesort", "_adaptive_mergesort", _nearly_sorted, lambda a: (), True),
+]
+
+
+@pytest.mark.parametrize("module", TWIN_MODULES)
+def test_untraced_helpers_have_no_tracing(module):
+    import inspect
+    import sys
+    mod = sys.modules[f"algorithms.{module}"]
+    helpers = [f for name, f in vars(mod).items() if name.endswith("_untraced") and inspect.isfunction(f)]
+    assert helpers
+    for helper in helpers:
+        code = helper.__code__
+        assert not {"states", "written", "append_at", "amend"} & set(code.co_varnames + code.co_names)
+        # Kayıtlı eşi yalnızca states verildiğinde kendi döngüsünü çalıştırır
+        traced = vars(mod)[helper.__name__[:-len("_untraced")]]
+        assert helper.__name__ in traced.__code__.co_names
+        assert (module, traced.__name__) in {(m, name) for m, name, *_ in TWIN_CASES}
+
+
+@pytest.mark.parametrize("module, name, prepare, extra, timed", TWIN_CASES)
+@pytest.mark.parametrize("seed", range(3))
+def test_traced_kernels_match_untraced_twins(module, name, prepare, extra, timed, seed):
+    import inspect
+    import sys
+    mod = sys.modules[f"algorithms.{module}"]
+    traced = vars(mod)[name]
+    twin = vars(mod)[f"{name}_untraced"]
+    rng = random.Random(seed)
+    # Eşit anahtarlı kayıtlar iki yolun aynı taşımaları yaptığını gösterir
+    base = prepare([Record(rng.randrange(50), i) for i in range(2000)])
+
+    expected_data = list(base)
+    expected = twin(expected_data, *extra(expected_data))
+    written = list(inspect.signature(traced).parameters)[-1] == "written"
+    recorders = [None, [] if written else Trace(list(base))]
+    for recorder in recorders:
+        data = list(base)
+        assert traced(data, *extra(data), recorder) == expected
+        assert [(r.key, r.tag) for r in data] == [(r.key, r.tag) for r in expected_data]
+
+
+@pytest.mark.parametrize("algorithm", [a for a in ALGORITHMS if a not in (radixsort, block_quicksort)])
+def test_untraced_and_traced_paths_agree(algorithm):
+    # Eşit anahtarlı kayıtların sırası iki yolun aynı adımları izlediğini gösterir
+    data = [Record(random.randrange(50), i) for i in range(3000)]
+    plain = algorithm(list(data))
+    traced, _ = algorithm(list(data), collect_states=True)
+    assert [r.tag for r in plain] == [r.tag for r in traced]
+
+
+@pytest.mark.parametrize("module, name, prepare, extra",
+                         [case[:4] for case in TWIN_CASES if case[4]])
+def test_traced_kernels_have_no_overhead_when_untraced(module, name, prepare, extra):
+    import sys
+    from utils.metrics import measure_tracing_overhead
+    mod = sys.modules[f"algorithms.{module}"]
+    traced = vars(mod)[name]
+    twin = vars(mod)[f"{name}_untraced"]
+    data = prepare(generate_random_data(1000, 0, 10 ** 6))
+    result = measure_tracing_overhead(lambda a, states: traced(a, *extra(a), states),
+                                      lambda a: twin(a, *extra(a)), data, repeat=25)
+    assert set(result) == {"traced", "untraced", "overhead"}
+    # states=None yalnızca çağrı başında bir kontrol ve bir ek çağrı ekler
+    assert result["overhead"] < 1.5
+
+
+def test_record_trace_evicts_and_accepts_partials(tmp_path):
+    pytest.importorskip("plotly")
+    import functools
+    import time
+    from animation_utils import record_trace
+    engine = functools.partial(cache_oblivious_sort, base_case_size=4)
+    data = generate_random_data(300)
+    trace = record_trace(engine, data, cache_dir=str(tmp_path))
+    assert trace[-1] == sorted(data)
+    # Bağlı argümanlar farklıysa iz ayrı dosyada tutulur
+    record_trace(functools.partial(cache_oblivious_sort, base_case_size=8), data, cache_dir=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 2
+
+    for _ in range(3):
+        time.sleep(0.01)
+        record_trace(timsort, generate_random_data(300), cache_dir=str(tmp_path), max_files=3)
+    assert len(list(tmp_path.iterdir())) == 3
+    record_trace(timsort, data, cache_dir=str(tmp_path), max_bytes=0)
+    assert len(list(tmp_path.iterdir())) == 1
+
@@ -6,6 +6,7 @@ Bu paket, algoritma karşılaştırma arayüzü için yardımcı fonksiyonlar i
 from .data_generator import generate_random_data, generate_nearly_sorted_data
 from .metrics import measure_time, measure_memory, measure_comparisons
 from .visualizer import create_comparison_chart, create_bar_chart
+from .presortedness import presortedness_summary
 
 __all__ = [
     'generate_random_data',
@@ -14,5 +15,6 @@ __all__ = [
     'measure_memory',
     'measure_comparisons',
     'create_comparison_chart',
-    'create_bar_chart'
+    'create_bar_chart',
+    'presortedness_summary'
 ]
\ No newline at end of file
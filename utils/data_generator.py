@@ -8,6 +8,8 @@ import random
 import json
 from pathlib import Path
 
+import numpy as np
+
 def generate_random_data(size, min_val=0, max_val=1000):
     """
     Belirtilen boyutta rastgele tam sayı dizisi oluşturur.
@@ -133,6 +135,44 @@ def load_data_from_json(filename):
     with open(file_path, 'r') as f:
         return json.load(f)
 
+def save_data_to_binary(data, filename, dtype="int64"):
+    """
+    Veriyi ham ikili dosyaya kaydeder. JSON'a göre çok daha küçüktür ve
+    belleğe sığmayan veriler için harici sıralamanın girdi biçimidir.
+    
+    Args:
+        data (list veya np.ndarray): Kaydedilecek veri
+        filename (str): Dosya adı
+        dtype (str): Değerlerin NumPy türü
+    """
+    directory = Path("data")
+    directory.mkdir(exist_ok=True)
+    
+    file_path = directory / filename
+    np.asarray(data, dtype=dtype).tofile(file_path)
+    
+    return file_path
+
+def load_data_from_binary(filename, dtype="int64"):
+    """
+    Ham ikili dosyayı belleğe yüklemeden, bellek eşlemeli dizi olarak açar.
+    
+    Args:
+        filename (str): Dosya adı
+        dtype (str): Değerlerin NumPy türü
+        
+    Returns:
+        np.memmap: Salt okunur dizi veya None (dosya bulunamadıysa)
+    """
+    file_path = Path("data") / filename
+    
+    if not file_path.exists():
+        return None
+    
+    if file_path.stat().st_size == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(file_path, dtype=dtype, mode="r")
+
 def generate_data_by_type(data_type, size):
     """
     Belirtilen türe göre veri oluşturur.
@@ -8,42 +8,94 @@ import time
 import tracemalloc
 import copy
 import sys
+import array
 from functools import wraps
 
+import numpy as np
+
+def _copy_data(data):
+    """
+    Ölçüm için verinin bağımsız bir kopyasını oluşturur.
+
+    Tamponlar (NumPy dizileri, array.array, bytearray, memoryview) Python
+    nesnelerine çevrilmeden bayt düzeyinde ve aynı türde kopyalanır; diğer
+    veriler derin kopyalanır.
+
+    Args:
+        data: Kopyalanacak veri
+
+    Returns:
+        Verinin kopyası
+    """
+    if isinstance(data, (np.ndarray, array.array, bytearray)):
+        return copy.copy(data)
+    if isinstance(data, memoryview):
+        fmt = data.format.lstrip("@")
+        return memoryview(bytearray(data.tobytes())).cast(fmt, data.shape)
+    return copy.deepcopy(data)
+
 def measure_time(func, data):
     """
     Algoritmanın çalışma süresini ölçer.
     
     Args:
         func: Sıralama fonksiyonu
-        data: Sıralanacak veri
+        data: Sıralanacak veri (liste ya da NumPy dizisi, array.array,
+            memoryview gibi bir tampon)
         
     Returns:
         float: Saniye cinsinden çalışma süresi
     """
     # Veriyi kopyala
-    data_copy = copy.deepcopy(data)
+    data_copy = _copy_data(data)
     
-    # Zamanı ölç
-    start_time = time.time()
+    # Zamanı ölç; perf_counter monoton ve yüksek çözünürlüklüdür
+    start_time = time.perf_counter()
     func(data_copy)
-    end_time = time.time()
+    end_time = time.perf_counter()
     
     return end_time - start_time
 
+def measure_tracing_overhead(traced, untraced, data, repeat=5):
+    """
+    Bir çekirdeğin kayıt yapabilen sürümünü states=None ile ve kayıt kodu
+    içermeyen sürümünü aynı veri üzerinde ölçer.
+    
+    Kayıt kapalıyken kayıtlı çekirdek kontrolü çağrı başında bir kez yapıp
+    kayıtsız sürüme geçer; iki süre arasındaki fark bu kontrolün maliyetidir.
+    
+    Args:
+        traced: (veri, states) alan çekirdek; states=None ile çağrılır
+        untraced: Yalnızca veri alan kayıtsız çekirdek
+        data: Sıralanacak veri
+        repeat (int): Her ölçümün tekrar sayısı; en kısa süre alınır
+        
+    Returns:
+        dict: "traced" ve "untraced" süreleri (saniye) ile "overhead"
+        (traced / untraced) oranı
+    """
+    traced_time = untraced_time = float("inf")
+    # Ölçümler sırayla yapılır ki makine yükündeki değişim ikisine de yansısın
+    for _ in range(repeat):
+        traced_time = min(traced_time, measure_time(lambda d: traced(d, None), data))
+        untraced_time = min(untraced_time, measure_time(untraced, data))
+    overhead = traced_time / untraced_time if untraced_time else float("inf")
+    return {"traced": traced_time, "untraced": untraced_time, "overhead": overhead}
+
 def measure_memory(func, data):
     """
     Algoritmanın bellek kullanımını ölçer.
     
     Args:
         func: Sıralama fonksiyonu
-        data: Sıralanacak veri
+        data: Sıralanacak veri (liste ya da NumPy dizisi, array.array,
+            memoryview gibi bir tampon)
         
     Returns:
         float: MB cinsinden bellek kullanımı
     """
     # Veriyi kopyala
-    data_copy = copy.deepcopy(data)
+    data_copy = _copy_data(data)
     
     # Bellek kullanımını izlemeyi başlat
     tracemalloc.start()
@@ -104,13 +156,14 @@ def measure_comparisons(func, data):
     
     Args:
         func: Sıralama fonksiyonu
-        data: Sıralanacak veri
+        data: Sıralanacak veri (liste ya da NumPy dizisi, array.array,
+            memoryview gibi bir tampon)
         
     Returns:
         int: Karşılaştırma sayısı
     """
     # Veriyi kopyala
-    data_copy = copy.deepcopy(data)
+    data_copy = _copy_data(data)
     
     # Karşılaştırma sayısını ölçmek için bir kapsam (monkey patching)
     class ComparableElement:
@@ -142,7 +195,9 @@ def measure_comparisons(func, data):
             self.comparison_count += 1
             return self.value != other.value
     
-    # Veriyi ComparableElement'lerle sarmalama
+    # Veriyi ComparableElement'lerle sarmalama; çok boyutlu tamponlar düzleştirilir
+    if isinstance(data_copy, (np.ndarray, memoryview)):
+        data_copy = np.asarray(data_copy).ravel().tolist()
     wrapped_data = [ComparableElement(x) for x in data_copy]
     
     # Sarmalanmış veriyi sırala
@@ -218,7 +273,9 @@ if __name__ == "__main__":
         from algorithms.timsort import timsort
         from algorithms.introsort import introsort
         from algorithms.radixsort import radixsort
-        from utils.data_generator import generate_random_data
+        from algorithms.adaptive_mergesort import adaptive_mergesort
+        from algorithms.smoothsort import smoothsort
+        from utils.data_generator import generate_random_data, generate_nearly_sorted_data
         
         # Test verileri
         data = generate_random_data(1000)
@@ -235,6 +292,13 @@ if __name__ == "__main__":
         print(f"IntroSort: {measure_memory(introsort, data):.6f} MB")
         print(f"RadixSort: {measure_memory(radixsort, data):.6f} MB")
         
+        # Kısmen sıralı veride O(1) ek bellekli SmoothSort ile O(n) tamponlu
+        # Adaptive MergeSort'un bellek tepe değeri karşılaştırması
+        nearly_sorted = generate_nearly_sorted_data(100000)
+        print("\nBellek ölçümü (kısmen sıralı, 100000 eleman):")
+        print(f"SmoothSort: {measure_memory(smoothsort, nearly_sorted):.6f} MB")
+        print(f"Adaptive MergeSort: {measure_memory(adaptive_mergesort, nearly_sorted):.6f} MB")
+        
         # Karşılaştırma sayısı ölçümü
         print("\nKarşılaştırma sayısı ölçümü:")
         print(f"TimSort: {measure_comparisons(timsort, data)} karşılaştırma")
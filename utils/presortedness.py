@@ -0,0 +1,211 @@
+"""
+Ön Sıralılık (Presortedness) Ölçüleri Modülü
+
+Bu modül, bir verinin ne kadar sıralı olduğunu gösteren klasik ölçüleri tam
+olarak hesaplayan fonksiyonlar içerir:
+
+- Ters çevrim sayısı (Inv): i < j ve a[j] < a[i] olan çiftlerin sayısı
+- Run sayısı (Runs): verideki artan (azalmayan) run'ların sayısı
+- Rem: en uzun azalmayan alt dizi (LIS) dışında kalan eleman sayısı; veriyi
+  sıralı hale getirmek için çıkarılması gereken en az eleman sayısı
+- En büyük yer değiştirme (Max Displacement): bir elemanın bulunduğu konum
+  ile kararlı sıralamadaki konumu arasındaki en büyük fark
+
+Tüm ölçüler önce verinin kararlı sıra numaralarına (rank) çevrilmesiyle
+hesaplanır. Eşit değerler özgün konumlarına göre numaralandığından sıra
+numaraları 0..n-1 permütasyonudur ve eşit elemanlar ters çevrim sayılmaz.
+"""
+
+from bisect import bisect_left
+
+import numpy as np
+
+
+def _stable_ranks(data):
+    """
+    Verinin her elemanının kararlı sıralamadaki konumunu döndürür.
+
+    Returns:
+        np.ndarray: 0..n-1 değerlerinden oluşan int64 permütasyon
+
+    Raises:
+        TypeError: Liste elemanları demet ya da iç içe liste ise
+    """
+    if isinstance(data, np.ndarray):
+        arr = data.ravel()
+    else:
+        try:
+            arr = np.asarray(data)
+        except ValueError:
+            raise TypeError("Liste elemanları tek boyutlu bir diziye çevrilemiyor") from None
+        if arr.ndim != 1:
+            raise TypeError(f"Liste elemanları sayı olmalı; iç içe diziler {arr.ndim} boyutlu diziye açılıyor")
+    order = np.argsort(arr, kind="stable")
+    ranks = np.empty(arr.size, dtype=np.int64)
+    ranks[order] = np.arange(arr.size, dtype=np.int64)
+    return ranks
+
+
+def _permutation_inversions(perm):
+    """
+    0..n-1 permütasyonundaki ters çevrim sayısını O(n log n) sürede sayar.
+
+    Değerler en anlamlı bitten başlayarak bit bit ayrıştırılır (MSD radix).
+    Aynı üst bitlere sahip değerler grubu içinde, konum sırasıyla, bu bitte 1
+    olan bir elemandan sonra gelen ve 0 olan her eleman bir ters çevrimdir.
+    Her bit adımı kümülatif toplamlarla vektörel olarak yapılır; ardından
+    grup içi kararlı bölümlemeyle bir sonraki bit adımına geçilir.
+    Değerler bir permütasyon olduğundan üst bitleri g olan grup, sıralı
+    düzende tam olarak g * 2^(b+1) konumundan başlar.
+    """
+    n = perm.size
+    if n < 2:
+        return 0
+
+    v = perm.copy()
+    positions = np.arange(n, dtype=np.int64)
+    cum_ones = np.zeros(n + 1, dtype=np.int64)
+    inversions = 0
+
+    for b in range((n - 1).bit_length() - 1, -1, -1):
+        bits = (v >> b) & 1
+        group_start = (v >> (b + 1)) << (b + 1)
+        np.cumsum(bits, out=cum_ones[1:])
+
+        # Grup içinde bu elemandan önce gelen 1 bitli eleman sayısı
+        ones_before = cum_ones[positions] - cum_ones[group_start]
+        zero = bits == 0
+        inversions += int(ones_before[zero].sum())
+
+        # Grup içi kararlı bölümleme: önce 0 bitliler, sonra 1 bitliler
+        zeros_in_group = np.minimum(1 << b, n - group_start)
+        new_positions = np.where(
+            zero,
+            positions - ones_before,
+            group_start + zeros_in_group + ones_before,
+        )
+        reordered = np.empty_like(v)
+        reordered[new_positions] = v
+        v = reordered
+
+    return inversions
+
+
+def _permutation_lis(perm):
+    """
+    0..n-1 permütasyonundaki en uzun artan alt dizinin uzunluğunu sabır
+    sıralamasıyla (patience sorting) hesaplar: her yığının tepesindeki en
+    küçük değer tutulur ve her eleman ikili aramayla yerleştirilir.
+    """
+    tails = []
+    for r in perm.tolist():
+        i = bisect_left(tails, r)
+        if i == len(tails):
+            tails.append(r)
+        else:
+            tails[i] = r
+    return len(tails)
+
+
+def count_inversions(data):
+    """
+    Verideki ters çevrim sayısını (i < j ve a[j] < a[i] olan çiftler) tam
+    olarak hesaplar.
+
+    Args:
+        data (list veya np.ndarray): İncelenecek veri; değiştirilmez
+
+    Returns:
+        int: Ters çevrim sayısı; sıralı veride 0, ters sıralı ve farklı
+        değerli veride n(n-1)/2
+    """
+    return _permutation_inversions(_stable_ranks(data))
+
+
+def count_runs(data):
+    """
+    Verideki artan (azalmayan) run sayısını hesaplar.
+
+    Args:
+        data (list veya np.ndarray): İncelenecek veri; değiştirilmez
+
+    Returns:
+        int: Run sayısı; boş veride 0, sıralı veride 1
+    """
+    ranks = _stable_ranks(data)
+    if ranks.size == 0:
+        return 0
+    return int(np.count_nonzero(ranks[1:] < ranks[:-1])) + 1
+
+
+def longest_increasing_subsequence(data):
+    """
+    Verideki en uzun azalmayan alt dizinin uzunluğunu hesaplar.
+
+    Kararlı sıra numaraları farklı olduğundan sıra numaralarındaki kesin
+    artan alt dizi, özgün verideki azalmayan alt diziye karşılık gelir.
+
+    Args:
+        data (list veya np.ndarray): İncelenecek veri; değiştirilmez
+
+    Returns:
+        int: En uzun azalmayan alt dizinin uzunluğu
+    """
+    return _permutation_lis(_stable_ranks(data))
+
+
+def count_rem(data):
+    """
+    Veriyi sıralı hale getirmek için çıkarılması gereken en az eleman
+    sayısını (Rem) hesaplar.
+
+    Args:
+        data (list veya np.ndarray): İncelenecek veri; değiştirilmez
+
+    Returns:
+        int: n - en uzun azalmayan alt dizi uzunluğu
+    """
+    ranks = _stable_ranks(data)
+    return ranks.size - _permutation_lis(ranks)
+
+
+def max_displacement(data):
+    """
+    Bir elemanın bulunduğu konum ile kararlı sıralamadaki konumu arasındaki
+    en büyük farkı hesaplar.
+
+    Args:
+        data (list veya np.ndarray): İncelenecek veri; değiştirilmez
+
+    Returns:
+        int: En büyük yer değiştirme; sıralı veride 0
+    """
+    ranks = _stable_ranks(data)
+    if ranks.size == 0:
+        return 0
+    return int(np.abs(ranks - np.arange(ranks.size)).max())
+
+
+def presortedness_summary(data):
+    """
+    Tüm ön sıralılık ölçülerini tek seferde hesaplar.
+
+    Sıra numaraları yalnızca bir kez hesaplanır.
+
+    Args:
+        data (list veya np.ndarray): İncelenecek veri; değiştirilmez
+
+    Returns:
+        dict: inversions, runs, rem ve max_displacement değerleri
+    """
+    ranks = _stable_ranks(data)
+    n = ranks.size
+    if n == 0:
+        return {"inversions": 0, "runs": 0, "rem": 0, "max_displacement": 0}
+
+    return {
+        "inversions": _permutation_inversions(ranks),
+        "runs": int(np.count_nonzero(ranks[1:] < ranks[:-1])) + 1,
+        "rem": n - _permutation_lis(ranks),
+        "max_displacement": int(np.abs(ranks - np.arange(n)).max()),
+    }
@@ -12,6 +12,12 @@ from algorithms.radixsort import radixsort
 from algorithms.cache_oblivious import cache_oblivious_sort
 from algorithms.adaptive_mergesort import adaptive_mergesort
 from algorithms.smoothsort import smoothsort
+from algorithms.parallel_samplesort import parallel_samplesort
+from algorithms.pdqsort import pdqsort
+from algorithms.block_quicksort import block_quicksort
+from algorithms.block_mergesort import block_mergesort
+from algorithms.auto_sort import auto_sort
+from algorithms.threaded_sort import threaded_sort
 
 # Algoritma bilgileri - Her algoritma için tutarlı renkler
 ALGORITHM_INFO = {
@@ -110,6 +116,102 @@ ALGORITHM_INFO = {
         "renk": "#9c27b0",
         "ikon": "🧩",
         "plot_color": "#9c27b0"
+    },
+    "Parallel SampleSort": {
+        "func": parallel_samplesort,
+        "description": "Örnekleme ile seçilen ayırıcılara göre veriyi kovalara böler ve her kovayı ayrı bir işlemci çekirdeğinde sıralar. Veri süreçler arasında paylaşılan bellek üzerinden taşınır.",
+        "best_case": "O(n log n / p)",
+        "avg_case": "O(n log n / p)",
+        "worst_case": "O(n log n)",
+        "adım_sayısı": "Düşük",
+        "bellek_kullanımı": "Orta",
+        "kararlılık": "Kararsız",
+        "özellik": "Paralel",
+        "yıl": "1970",
+        "yaratıcı": "Frazer ve McKellar",
+        "renk": "#00BCD4",
+        "ikon": "🖥️",
+        "plot_color": "#00BCD4"
+    },
+    "PdqSort": {
+        "func": pdqsort,
+        "description": "IntroSort'un desenlere dayanıklı modern sürümüdür. Tekrar eden anahtarları tek bölümlemede ayıklar, sıralı aralıkları erkenden tanır ve dengesiz bölümlemelerde deseni bozarak en kötü durumu HeapSort ile sınırlar.",
+        "best_case": "O(n)",
+        "avg_case": "O(n log n)",
+        "worst_case": "O(n log n)",
+        "adım_sayısı": "Düşük",
+        "bellek_kullanımı": "Düşük",
+        "kararlılık": "Kararsız",
+        "özellik": "Hibrit",
+        "yıl": "2016",
+        "yaratıcı": "Orson Peters",
+        "renk": "#FFC107",
+        "ikon": "🛡️",
+        "plot_color": "#FFC107"
+    },
+    "BlockQuicksort": {
+        "func": block_quicksort,
+        "description": "Bölümlemeyi iki uçtan alınan sabit boyutlu bloklar üzerinde yapar. Yanlış taraftaki elemanlar eleman başına dallanma yerine vektörel maskelerle bulunur ve toplu olarak takas edilir.",
+        "best_case": "O(n log n)",
+        "avg_case": "O(n log n)",
+        "worst_case": "O(n log n)",
+        "adım_sayısı": "Düşük",
+        "bellek_kullanımı": "Düşük",
+        "kararlılık": "Kararsız",
+        "özellik": "Vektörel",
+        "yıl": "2016",
+        "yaratıcı": "Stefan Edelkamp ve Armin Weiß",
+        "renk": "#607D8B",
+        "ikon": "🧱",
+        "plot_color": "#607D8B"
+    },
+    "Block MergeSort": {
+        "func": block_mergesort,
+        "description": "Yardımcı tamponu girdinin kendisinden toplanan benzersiz anahtarlardan oluşturur. Run'ları bloklara ayırıp etiketleyerek ve rotasyonlarla birleştirir; ek bellek kullanmadan kararlı sıralama yapar.",
+        "best_case": "O(n)",
+        "avg_case": "O(n log n)",
+        "worst_case": "O(n log n)",
+        "adım_sayısı": "Orta-Yüksek",
+        "bellek_kullanımı": "Çok Düşük",
+        "kararlılık": "Kararlı",
+        "özellik": "Yerinde",
+        "yıl": "2008",
+        "yaratıcı": "Pok-Son Kim ve Arne Kutzner",
+        "renk": "#8BC34A",
+        "ikon": "🔗",
+        "plot_color": "#8BC34A"
+    },
+    "Auto": {
+        "func": auto_sort,
+        "description": "Her çağrıda verinin küçük bir örneğinden run uzunluğunu, ters çevrim oranını, anahtar aralığını ve farklı değer oranını tahmin eder; buna göre RadixSort, TimSort, Adaptive MergeSort, PdqSort ya da IntroSort'u seçer.",
+        "best_case": "O(n)",
+        "avg_case": "O(n log n)",
+        "worst_case": "O(n log n)",
+        "adım_sayısı": "Düşük",
+        "bellek_kullanımı": "Duruma göre",
+        "kararlılık": "Duruma göre",
+        "özellik": "Uyarlanabilir",
+        "yıl": "2026",
+        "yaratıcı": "Proje ekibi",
+        "renk": "#FF5722",
+        "ikon": "🎯",
+        "plot_color": "#FF5722"
+    },
+    "Threaded Sort": {
+        "func": threaded_sort,
+        "description": "Sayısal diziyi çekirdek başına parçalara bölüp parçaları bir iş parçacığı havuzunda GIL'i bırakan NumPy çekirdekleriyle eşzamanlı sıralar; ardından parçaları np.searchsorted ile merge path bölmelerine ayrılan paralel bir birleştirme ağacıyla birleştirir.",
+        "best_case": "O(n log n / p)",
+        "avg_case": "O(n log n / p + n log p)",
+        "worst_case": "O(n log n)",
+        "adım_sayısı": "Düşük",
+        "bellek_kullanımı": "O(n)",
+        "kararlılık": "Kararsız",
+        "özellik": "Paralel",
+        "yıl": "2026",
+        "yaratıcı": "Proje ekibi",
+        "renk": "#795548",
+        "ikon": "🧵",
+        "plot_color": "#795548"
     }
 }
 
@@ -18,6 +18,7 @@ from animation_utils import (
     create_algorithm_step_visualization,
     get_algorithm_statistics,
     generate_performance_badges,
+    record_trace,
     create_color_legend,
     ALGORITHM_COLORS
 )
@@ -80,6 +81,30 @@ def load_animation_css():
         background: #9c27b0;
     }
     
+    .animation-card.parallel-samplesort::before {
+        background: #00BCD4;
+    }
+    
+    .animation-card.pdqsort::before {
+        background: #FFC107;
+    }
+    
+    .animation-card.blockquicksort::before {
+        background: #607D8B;
+    }
+    
+    .animation-card.block-mergesort::before {
+        background: #8BC34A;
+    }
+    
+    .animation-card.auto::before {
+        background: #FF5722;
+    }
+    
+    .animation-card.threaded-sort::before {
+        background: #795548;
+    }
+    
     /* Kart Başlığı */
     .card-header {
         display: flex;
@@ -354,11 +379,14 @@ def show_algorithm_animation_card(algo_name: str, data: List[int], data_type: st
         </div>
     """, unsafe_allow_html=True)
     
+    # İz bir kez kaydedilir ve dosyadan okunur; hem animasyonda hem istatistiklerde kullanılır
+    states = record_trace(algo_func, data)
+    
     # Animasyon oluştur
     fig, steps = create_sorting_animation_plotly(
         algo_name, 
         data, 
-        algo_func(data.copy(), collect_states=True)[1],
+        states,
         animation_speed
     )
     
@@ -366,7 +394,7 @@ def show_algorithm_animation_card(algo_name: str, data: List[int], data_type: st
     st.plotly_chart(fig, use_container_width=True)
     
     # İstatistikleri hesapla
-    stats = get_algorithm_statistics(algo_func(data.copy(), collect_states=True)[1])
+    stats = get_algorithm_statistics(states)
     
     # İstatistikleri göster
     col1, col2, col3 = st.columns(3)
@@ -492,6 +520,10 @@ def show_algorithm_performance_comparison(selected_algos: List[str], results_df:
             'time': '{:.6f} sn',
             'memory': '{:.6f} MB',
             'comparisons': '{:,d}',
+            'inversions': '{:,d}',
+            'runs': '{:,d}',
+            'rem': '{:,d}',
+            'max_displacement': '{:,d}',
         }).background_gradient(cmap='viridis', axis=0),
         use_container_width=True
     )
@@ -589,7 +621,13 @@ def get_algorithm_use_cases(algo_name: str) -> str:
         "RadixSort": "tam sayı dizileri, pozitif tam sayılar, karakter dizileri, IP adresleri",
         "Cache-Oblivious": "bellek hiyerarşisi optimizasyonu gereken sistemler, sunucu uygulamaları",
         "Adaptive MergeSort": "kısmen sıralı veriler, dağıtık sistemler, büyük veri yapıları",
-        "SmoothSort": "kısmen sıralı veriler, bellek kısıtlı ortamlar, enerji verimli uygulamalar"
+        "SmoothSort": "kısmen sıralı veriler, bellek kısıtlı ortamlar, enerji verimli uygulamalar",
+        "Parallel SampleSort": "çok çekirdekli sunucular, büyük sayısal diziler, toplu veri işleme",
+        "PdqSort": "genel amaçlı kütüphane sıralamaları, tekrar eden anahtarlar, sıralı ya da ters sıralı gelen veriler",
+        "BlockQuicksort": "büyük sayısal diziler, vektörel işlem destekli ortamlar, dal tahmini maliyetinin yüksek olduğu işlemciler",
+        "Block MergeSort": "bellek sınırlı konteynerler, gömülü sistemler, kararlılık gereken yerinde sıralama",
+        "Auto": "şekli zamanla değişen veri akışları, veri türü önceden bilinmeyen genel amaçlı servisler",
+        "Threaded Sort": "çok çekirdekli makinelerde büyük sayısal diziler, süreç başlatma maliyetinin kabul edilemediği kısa süreli işler"
     }
     
     return use_cases.get(algo_name, "çeşitli sıralama gereksinimleri")
@@ -9,6 +9,7 @@ import pandas as pd
 import plotly.express as px
 from utils.data_generator import generate_random_data, generate_nearly_sorted_data
 from utils.data_generator import generate_sorted_data, generate_reverse_sorted_data
+from utils.presortedness import presortedness_summary
 from . import VERI_TURLERI
 
 def generate_data_by_type(data_type, size):
@@ -86,6 +87,16 @@ def show_data_analysis(data_size):
             with col1:
                 st.write(f"**İlk 10 eleman:**")
                 st.json(data[:10])
+                
+                # Ön sıralılık ölçüleri
+                measures = presortedness_summary(data)
+                st.markdown(f"""
+                **Ön sıralılık ölçüleri:**
+                - Ters çevrim: {measures['inversions']:,}
+                - Run sayısı: {measures['runs']:,}
+                - Rem (LIS dışı): {measures['rem']:,}
+                - En büyük yer değiştirme: {measures['max_displacement']:,}
+                """)
             
             with col2:
                 # Veri dağılımını göster - Tema renklerine uyumlu
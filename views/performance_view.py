@@ -9,6 +9,7 @@ import pandas as pd
 import plotly.express as px
 import time
 from utils.metrics import measure_time, measure_memory, measure_comparisons
+from utils.presortedness import presortedness_summary
 from .algorithm_view import ALGORITHM_INFO
 from . import VERI_TURLERI
 
@@ -48,8 +49,9 @@ def show_performance_comparison(data, data_type, algorithms):
                     )
                     results.append(perf)
             
-            # Sonuçları DataFrame'e dönüştür
-            df_results = pd.DataFrame(results).set_index("algorithm")
+            # Sonuçları DataFrame'e dönüştür; girdinin ön sıralılık ölçüleri
+            # veri kümesi başına bir kez hesaplanıp her satıra eklenir
+            df_results = pd.DataFrame(results).set_index("algorithm").assign(**presortedness_summary(data))
             
             # En iyi değerleri bul
             min_time = df_results['time'].min()
@@ -240,6 +242,10 @@ def show_performance_comparison(data, data_type, algorithms):
                 'time': '{:.6f} sn',
                 'memory': '{:.6f} MB',
                 'comparisons': '{:,d}',  # Binlik ayırıcılı sayı formatı
+                'inversions': '{:,d}',
+                'runs': '{:,d}',
+                'rem': '{:,d}',
+                'max_displacement': '{:,d}',
             }).background_gradient(cmap='viridis', axis=0))
             
             # Tablo açıklaması